@@ -1,5 +1,10 @@
 from fastapi import APIRouter, status
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+
+from app.core.admission import limiters
+from app.core.bulkhead import bulkheads
+from app.core.hedging import hedgers
+from app.core.loopmonitor import loop_monitor
 
 router = APIRouter()
 
@@ -8,4 +13,46 @@ async def check_health():
     """
     서버의 상태를 확인하는 엔드포인트입니다.
     """
-    return JSONResponse(status_code=status.HTTP_200_OK, content={"status": "200"})
\ No newline at end of file
+    return ORJSONResponse(status_code=status.HTTP_200_OK, content={"status": "200"})
+
+
+@router.get("/admission")
+async def check_admission():
+    """
+    라우터별 동시 처리 한도, 대기열 길이, 거절된 요청 수를 반환합니다.
+    """
+    return ORJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={name: limiter.snapshot() for name, limiter in limiters.items()}
+    )
+
+
+
+@router.get("/bulkheads")
+async def check_bulkheads():
+    """
+    업스트림별 실행 풀의 사용량과 대기열, 거절된 호출 수를 반환합니다.
+    """
+    return ORJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={name: bulkhead.snapshot() for name, bulkhead in bulkheads.items()}
+    )
+
+
+@router.get("/hedging")
+async def check_hedging():
+    """
+    업스트림별 hedged request 횟수, 두 번째 요청이 이긴 횟수, 현재 hedge 지연 시간을 반환합니다.
+    """
+    return ORJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={name: hedger.snapshot() for name, hedger in hedgers.items()}
+    )
+
+
+@router.get("/loop")
+async def check_loop():
+    """
+    이벤트 루프 지연 percentile(ms)과 최근에 루프가 멈춘 위치의 스택을 반환합니다.
+    """
+    return ORJSONResponse(status_code=status.HTTP_200_OK, content=loop_monitor.snapshot())
@@ -0,0 +1,58 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.admission import limiters
+from app.core.bulkhead import bulkheads
+from app.core.hedging import hedgers
+from app.core.loopmonitor import loop_monitor
+from app.core.metrics import Counter, Gauge, registry
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@registry.collector
+def collect_pools():
+    """bulkhead / admission / hedging 상태는 scrape 시점의 snapshot으로 내보냅니다.
+
+    - 지금 상태(처리 중, 대기열)는 gauge로, 시작 후 누적된 횟수(거절, 재요청)는 _total counter로 내보냅니다.
+    """
+    pending = Gauge("upstream_pool_pending", "업스트림 풀에서 실행 중이거나 기다리는 호출 수", ("upstream",))
+    rejected = Counter("upstream_pool_rejected_total", "업스트림 풀이 가득 차 거절한 호출 수", ("upstream",))
+    for name, bulkhead in bulkheads.items():
+        snapshot = bulkhead.snapshot()
+        pending.set(name, value=snapshot["active"] + snapshot["queued"])
+        rejected.inc(name, amount=snapshot["rejected"])
+
+    limit = Gauge("admission_limit", "라우터별 동시 처리 한도", ("router",))
+    in_flight = Gauge("admission_in_flight", "라우터별 처리 중인 요청 수", ("router",))
+    queue_depth = Gauge("admission_queue_depth", "라우터별 한도를 넘어 기다리는 요청 수", ("router",))
+    shed = Counter("admission_shed_total", "라우터별 거절한 요청 수", ("router",))
+    for name, limiter in limiters.items():
+        limit.set(name, value=int(limiter.limit))
+        in_flight.set(name, value=limiter.in_flight)
+        queue_depth.set(name, value=limiter.queue_depth)
+        shed.inc(name, amount=limiter.shed_count)
+
+    hedged = Counter("upstream_hedged_requests_total", "업스트림별로 두 번째 요청을 보낸 횟수", ("upstream",))
+    for name, hedger in hedgers.items():
+        hedged.inc(name, amount=hedger.hedged)
+    return pending, rejected, limit, in_flight, queue_depth, shed, hedged
+
+
+@router.get("", response_class=PlainTextResponse)
+def get_metrics():
+    """
+    Prometheus text 형식의 메트릭을 반환합니다.
+    """
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@registry.collector
+def collect_loop_lag():
+    """최근 이벤트 루프 지연의 percentile"""
+    lag = Gauge("event_loop_lag_recent_seconds", "최근 이벤트 루프 지연의 percentile", ("quantile",))
+    for name, value in loop_monitor.percentiles().items():
+        lag.set(name, value=value)
+    return (lag,)
@@ -0,0 +1,139 @@
+# app/api/openai/answer_cache.py
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.store import Store
+
+
+def normalize_question(question: str) -> str:
+    """공백, 문장부호, 대소문자 차이를 없앤 질문 문자열"""
+    return re.sub(r"[^\w]+", "", question).lower()
+
+
+def char_ngrams(text: str, n: int = 2) -> frozenset[str]:
+    """문자 n-gram 집합 (n보다 짧은 문자열은 문자열 자체)"""
+    if len(text) <= n:
+        return frozenset((text,)) if text else frozenset()
+    return frozenset(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+def similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    """두 n-gram 집합의 Dice 계수 (0 ~ 1)"""
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+@dataclass
+class CachedAnswer:
+    question: str
+    ngrams: frozenset[str]
+    answer: str
+    expires_at: float
+
+
+class AnswerCache:
+    """작물별로 비슷한 질문에 대한 Assistant 답변을 재사용하는 로컬 캐시입니다.
+
+    - 키는 (작물, 정규화된 질문)이며 비슷한 질문은 문자 n-gram 유사도로 찾습니다.
+    - 항목은 TTL이 지나면 만료되고, 최대 개수를 넘으면 가장 오래 쓰이지 않은 항목부터 제거합니다.
+    - 공유 저장소(store)를 주면 다른 워커가 저장한 답변도 정규화된 질문이 같을 때 찾아서 로컬에 채웁니다.
+      (유사도 검색은 로컬 항목에서만 합니다.)
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 60 * 60 * 24, threshold: float = 0.8, n: int = 2,
+                 store: Optional[Store] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.threshold = threshold
+        self.n = n
+        self.store = store
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], CachedAnswer] = OrderedDict()
+        self._by_crop: dict[str, set[str]] = {}
+
+    def get(self, crop: str, question: str) -> Optional[str]:
+        """가장 비슷한 질문의 답변을 반환합니다. (유사도가 threshold 미만이면 None)"""
+        normalized = normalize_question(question)
+        if not normalized:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            key = (crop, normalized)
+            entry = self._entries.get(key)
+            if entry is None:
+                ngrams = char_ngrams(normalized, self.n)
+                best_score = self.threshold
+                for candidate in self._by_crop.get(crop, ()):
+                    score = similarity(ngrams, self._entries[(crop, candidate)].ngrams)
+                    if score >= best_score:
+                        key, best_score = (crop, candidate), score
+                entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry.answer
+        return self._get_shared(crop, normalized)
+
+    def put(self, crop: str, question: str, answer: str):
+        normalized = normalize_question(question)
+        if not normalized or not answer:
+            return
+        with self._lock:
+            self._insert(crop, normalized, question, answer, self.ttl)
+        if self.store is not None:
+            self.store.set(
+                self._store_key(crop, normalized),
+                {"question": question, "answer": answer, "expiresAt": time.time() + self.ttl},
+                self.ttl,
+            )
+
+    @staticmethod
+    def _store_key(crop: str, normalized: str) -> str:
+        return f"answer:{crop}:{normalized}"
+
+    def _get_shared(self, crop: str, normalized: str) -> Optional[str]:
+        if self.store is None:
+            return None
+        data = self.store.get(self._store_key(crop, normalized))
+        if data is None:
+            return None
+        remaining = data["expiresAt"] - time.time()
+        if remaining <= 0:
+            return None
+        with self._lock:
+            self._insert(crop, normalized, data["question"], data["answer"], remaining)
+        return data["answer"]
+
+    def _insert(self, crop: str, normalized: str, question: str, answer: str, ttl: float):
+        key = (crop, normalized)
+        self._entries[key] = CachedAnswer(
+            question=question,
+            ngrams=char_ngrams(normalized, self.n),
+            answer=answer,
+            expires_at=time.monotonic() + ttl,
+        )
+        self._entries.move_to_end(key)
+        self._by_crop.setdefault(crop, set()).add(normalized)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: tuple[str, str]):
+        self._entries.pop(key, None)
+        crop, normalized = key
+        questions = self._by_crop.get(crop)
+        if questions is not None:
+            questions.discard(normalized)
+            if not questions:
+                del self._by_crop[crop]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -2,14 +2,17 @@
 from typing import List, Any, Optional, Generic, TypeVar
 import re
 import time
+import asyncio
 import json
+import threading
 import logging
 from enum import Enum
 from datetime import datetime
 
 # HTTP 및 API 관련 모듈
 import requests
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, field_validator, ValidationError
 from starlette.responses import JSONResponse
 from starlette.status import (
@@ -25,7 +28,25 @@ import openai
 
 # 프로젝트 내 모듈
 from app.core.config import settings
-from app.api.weather.weather import kakao_service
+from app.core.singleflight import SingleFlight
+from app.core.ratelimit import member_rate_limiter, run_queue, estimate_tokens
+from app.core.admission import LoadShedError
+from app.core.upstream import BulkheadTransport, upstream_session
+from app.core.metrics import cache_lookups, run_duration, run_polls
+from app.core.store import store
+from app.core.deadline import (
+    DeadlineExceeded, current_deadline, timeout_for, without_deadline, stage as deadline_stage
+)
+from app.api.weather.weather import LamcParameter, kakao_service, lamcproj
+from app.api.weather.history import KST
+from app.api.openai.tools import tool_registry
+from app.api.openai.intent import Intent, classify_intent
+from app.api.openai.answer_cache import AnswerCache
+from app.api.openai.recommendation import date_parts, recommend
+from app.api.openai.context import (
+    ThreadContext, ThreadContextStore, summary_messages, truncation_strategy, usage_to_dict
+)
+from app.core.globalException import get_error_code
 from app.utils.response import create_response
 from app.models.error import ErrorDetail
 
@@ -34,15 +55,111 @@ import socket
 
 DEBUG = True
 
-BE_BASE_URL = "http://15.164.175.127:8080/api"
+logger = logging.getLogger(__name__)
+
+BE_BASE_URL = settings.BACKEND_BASE_URL
 
 router = APIRouter()
 
+
+def create_openai_client() -> openai.Client:
+    """OpenAI API 클라이언트를 만듭니다. (요청은 OpenAI 전용 bulkhead에서 실행됩니다.)
+
+    - SDK 재시도는 끕니다. SDK는 transport의 모든 예외를 연결 오류로 감싸 다시 보내므로,
+      deadline 초과는 예산이 끝난 뒤 backoff만큼 더 기다리고, 가득 찬 bulkhead에는 부하를 더 얹게 됩니다.
+      (다른 업스트림처럼 재시도하지 않음)
+    """
+    return openai.OpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        base_url=settings.OPENAI_BASE_URL,
+        max_retries=0,
+        http_client=openai.DefaultHttpxClient(transport=BulkheadTransport("openai")),
+    )
+
+
 # OpenAI API 클라이언트 생성
-client: openai.Client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+client: openai.Client = create_openai_client()
+
+# FarmMate 백엔드 전용 세션
+backend_http = upstream_session("backend")
+
+# 작물, 기상청 격자, 생육 단계가 같은 채팅방끼리 비슷한 질문의 답변을 재사용합니다.
+answer_cache = AnswerCache(
+    max_entries=settings.ANSWER_CACHE_MAX_ENTRIES,
+    ttl=settings.ANSWER_CACHE_TTL_SECONDS,
+    threshold=settings.ANSWER_CACHE_SIMILARITY,
+    store=store if store.shared else None,
+)
+
+# 채팅방별 농장 정보와 이전 대화 요약 (공유 저장소를 쓰면 워커끼리 공유)
+context_store = ThreadContextStore(store, ttl=settings.THREAD_CONTEXT_TTL_SECONDS)
+
+# 동일한 Assistant/Thread 조회가 동시에 들어오면 OpenAI 호출 하나로 합칩니다.
+openai_flight = SingleFlight()
+_assistant = None
+
+
+def get_assistant():
+    """ASSISTANT_ID에 해당하는 Assistant 인스턴스를 가져옵니다. (최초 1회만 조회)"""
+    global _assistant
+    if _assistant is None:
+        _assistant = openai_flight.do(
+            ("assistant", settings.ASSISTANT_ID),
+            client.beta.assistants.retrieve,
+            assistant_id=settings.ASSISTANT_ID,
+        )
+    return _assistant
+
+
+def retrieve_thread(thread_id: str):
+    """채팅방(Thread)을 조회합니다."""
+    return openai_flight.do(("thread", thread_id), client.beta.threads.retrieve, thread_id=thread_id)
+
+
+RUN_TERMINAL_STATUSES = ("completed", "failed", "cancelled", "expired", "incomplete")
+
+
+def unwrap_openai_error(error: Exception) -> Exception:
+    """OpenAI SDK가 연결 오류로 감싼 transport 예외(deadline 초과, bulkhead 거절)를 꺼냅니다."""
+    if isinstance(error, openai.APIConnectionError) and isinstance(error.__cause__, (DeadlineExceeded, LoadShedError)):
+        return error.__cause__
+    return error
+
+
+def wait_for_run(thread_id: str, run_id: str):
+    """run이 끝날 때까지 기다리고 마지막 run 상태를 반환합니다.
+
+    - requires_action 상태면 등록된 로컬 tool을 실행하고 결과를 제출한 뒤 계속 기다립니다.
+    - 요청 deadline을 넘기면 run을 취소하고 DeadlineExceeded를 발생시킵니다.
+    """
+    try:
+        while True:
+            run_status = client.beta.threads.runs.retrieve(thread_id=thread_id, run_id=run_id)
+            run_polls.inc()
+            if run_status.status in RUN_TERMINAL_STATUSES:
+                return run_status
+            if run_status.status == "requires_action":
+                tool_calls = run_status.required_action.submit_tool_outputs.tool_calls
+                client.beta.threads.runs.submit_tool_outputs(
+                    thread_id=thread_id,
+                    run_id=run_id,
+                    tool_outputs=tool_registry.execute(tool_calls),
+                )
+                continue
+            with deadline_stage("openai run_wait"):
+                time.sleep(min(1.0, timeout_for("openai run_wait", default=1.0)))
+    except (DeadlineExceeded, openai.APIConnectionError) as e:
+        error = unwrap_openai_error(e)
+        if not isinstance(error, DeadlineExceeded):
+            raise
+        # 끝나지 않은 run이 남아 있으면 채팅방에 다음 메시지를 추가할 수 없으므로 취소합니다.
+        with without_deadline():
+            try:
+                client.beta.threads.runs.cancel(thread_id=thread_id, run_id=run_id, timeout=5)
+            except openai.APIError:
+                logger.warning("run %s 취소 실패", run_id)
+        raise error from None
 
-# ASSISTANT_ID를 사용하여 Assistant 인스턴스 가져오기
-assistant = client.beta.assistants.retrieve(assistant_id=settings.ASSISTANT_ID)
 
 T = TypeVar('T')
 
@@ -78,10 +195,8 @@ class ThreadCreateData(BaseModel):
 
 
 @router.post("/")
-async def create_thread(memberId: str, request: CreateThreadRequest) -> JSONResponse:
-    """새로운 채팅방(Thread)을 생성하고 초기 메시지를 추가합니다."""
-    thread = client.beta.threads.create()
-
+def create_thread(memberId: str, request: CreateThreadRequest) -> JSONResponse:
+    """새로운 채팅방(Thread)을 생성하고 농장 정보를 metadata로 저장합니다."""
     crop_id = request.cropId
     if crop_id == -1:
         raise ValueError("작물ID를 입력해야 합니다.")
@@ -103,11 +218,8 @@ async def create_thread(memberId: str, request: CreateThreadRequest) -> JSONResp
     except ValueError:
         raise ValueError("날짜 형식이 올바르지 않습니다.")
 
-    client.beta.threads.messages.create(
-        thread_id=thread.id,
-        role="assistant",
-        content=f"[시스템 메시지] 사용자는 심은날짜 : {plantedAt}, 주소 : {address}에서 작물 : {crop}을(를) 재배하고 있습니다.",
-    )
+    context = ThreadContext(address=address, crop=crop, cropId=crop_id, plantedAt=plantedAt, memberId=memberId)
+    thread = client.beta.threads.create(metadata=context.to_metadata())
 
     request_data = {
         "address": address,
@@ -115,13 +227,14 @@ async def create_thread(memberId: str, request: CreateThreadRequest) -> JSONResp
         "plantedAt": plantedAt,
         "threadId": str(thread.id)
     }
-    req = requests.post(f"{BE_BASE_URL}/members/{memberId}/threads", json=request_data)
+    req = backend_http.post(f"{BE_BASE_URL}/members/{memberId}/threads", json=request_data)
 
     if req.status_code != 200:
         raise HTTPException(
             status_code=req.status_code,
             detail=req.json().get("details", "백엔드 서버 요청 실패")
         )
+    context_store.set(thread.id, context)
     return create_response(
         status_code=HTTP_201_CREATED,
         message="채팅방이 성공적으로 생성되었습니다.",
@@ -134,31 +247,130 @@ class Role(str, Enum):
     ASSITANT = "assistant"
 
 
-class MessageData(BaseModel):
-    """채팅방의 메시지 구조를 정의합니다."""
-    role: Role = Field(..., description="메시지 작성자 (assistant 또는 user)")
-    text: str = Field(..., description="메시지 내용")
+def member_thread_ids(memberId: str) -> list[str]:
+    """백엔드에 기록된 회원의 채팅방 ID 목록"""
+    req = backend_http.get(f"{BE_BASE_URL}/members/{memberId}/threads")
 
-    def to_dict(self):
-        return {
-            "role": self.role,
-            "text": self.text,
-        }
+    if req.status_code != 200:
+        raise HTTPException(
+            status_code=req.status_code,
+            detail=req.json().get("details", "백엔드 서버 요청 실패")
+        )
+    return [thread["threadId"] for thread in req.json().get("data") or []]
+
+
+@router.get("/status")
+async def get_threads_status(
+    memberId: str,
+    threadIds: Optional[str] = Query(None, description="쉼표로 구분한 채팅방 ID 목록 (없으면 회원의 모든 채팅방)"),
+):
+    """
+    회원의 여러 채팅방 상태를 한 번에 반환합니다. (홈 화면)
+    - threadIds가 없으면 백엔드에 기록된 회원의 채팅방을 앞에서부터 DASHBOARD_MAX_THREADS개까지 조회합니다.
+    - 채팅방 조회와 주소 확인은 DASHBOARD_CONCURRENCY개씩 동시에 처리하고, 날씨는 같은 격자마다 한 번만 조회합니다.
+    - 일부 채팅방이 실패해도 나머지 채팅방의 상태와 실패한 채팅방의 오류를 함께 반환합니다.
+    - 다른 회원의 채팅방은 조회하지 않고 NOT_FOUND 오류로 반환합니다. 만든 회원이 기록되지 않은 이전 채팅방은
+      백엔드의 회원 채팅방 목록으로 확인하고, 확인되면 회원을 기록해 둡니다.
+    - /{thread_id} 경로보다 먼저 등록해야 "status"가 채팅방 ID로 해석되지 않습니다.
+    """
+    owned_ids = None
+    if threadIds is None:
+        thread_ids = (await run_in_threadpool(member_thread_ids, memberId))[:settings.DASHBOARD_MAX_THREADS]
+        owned_ids = set(thread_ids)
+    else:
+        thread_ids = list(dict.fromkeys(thread_id.strip() for thread_id in threadIds.split(",") if thread_id.strip()))
+        if not thread_ids:
+            raise ValueError("threadIds가 필요합니다.")
+        if len(thread_ids) > settings.DASHBOARD_MAX_THREADS:
+            raise ValueError(f"채팅방은 한 번에 {settings.DASHBOARD_MAX_THREADS}개까지 조회할 수 있습니다.")
+
+    # 저장소에 있는 컨텍스트는 한 번에 읽습니다.
+    contexts = await run_in_threadpool(context_store.get_many, thread_ids)
+    cache_lookups.inc("thread_context", "hit", amount=len(contexts))
+    cache_lookups.inc("thread_context", "miss", amount=len(thread_ids) - len(contexts))
+
+    owned_lock = threading.Lock()
+
+    def owned_threads() -> set[str]:
+        """백엔드의 회원 채팅방 목록 (이전 채팅방이 있을 때 요청마다 한 번만 조회)"""
+        nonlocal owned_ids
+        with owned_lock:
+            if owned_ids is None:
+                owned_ids = set(member_thread_ids(memberId))
+            return owned_ids
+
+    semaphore = asyncio.Semaphore(settings.DASHBOARD_CONCURRENCY)
+
+    async def bounded(fn, *args):
+        async with semaphore:
+            return await run_in_threadpool(fn, *args)
+
+    def load(thread_id: str):
+        context = contexts.get(thread_id) or fetch_thread_context(thread_id)
+        if context.memberId is None and thread_id in owned_threads():
+            context.memberId = memberId
+            save_thread_context(thread_id, context)
+        if not context.owned_by(memberId):
+            raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="채팅방을 찾을 수 없습니다.")
+        thread = retrieve_thread(thread_id)
+        address = resolve_address(thread_id, context)
+        return thread, context, address_cell(address) if address else None
+
+    loaded = await asyncio.gather(*(bounded(load, thread_id) for thread_id in thread_ids), return_exceptions=True)
+    cells = list(dict.fromkeys(result[2] for result in loaded if not isinstance(result, BaseException) and result[2]))
+    weathers = dict(zip(cells, await asyncio.gather(*(bounded(cell_weather, *cell) for cell in cells), return_exceptions=True)))
+
+    threads, failed = [], 0
+    for thread_id, result in zip(thread_ids, loaded):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            logger.warning("채팅방 상태 조회 실패 (thread_id=%s): %r", thread_id, result)
+            threads.append({"threadId": thread_id, "status": None, "error": status_error(result)})
+            failed += 1
+            continue
+
+        thread, context, cell = result
+        weather, recent, error = None, None, None
+        outcome = weathers.get(cell)
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            # 날씨만 실패한 채팅방은 날씨 없이 생육 단계 추천을 반환합니다.
+            error = status_error(outcome)
+        elif outcome is not None:
+            weather, recent = outcome
+        threads.append({
+            "threadId": thread_id,
+            "crop": context.crop,
+            "cropId": context.cropId,
+            "address": context.address,
+            "status": build_status(thread, context, weather, recent),
+            "error": error,
+        })
+
+    return create_response(
+        status_code=HTTP_200_OK,
+        message="상태 정보가 올바르게 반환되었습니다.",
+        data={"count": len(threads), "failed": failed, "threads": threads}
+    )
+
+
+def message_to_dict(message) -> dict:
+    """OpenAI 메시지를 응답용 dict로 바꿉니다. (메시지마다 모델을 만들지 않고 바로 직렬화)"""
+    return {
+        "role": message.role,
+        "text": message.content[0].text.value if message.content else "",
+    }
 
 
 @router.get("/{thread_id}")
-async def get_thread(memberId: str, thread_id: str):
+def get_thread(memberId: str, thread_id: str):
     """특정 채팅방의 메시지 목록을 반환합니다."""
-    thread = client.beta.threads.retrieve(thread_id=thread_id)
-    messages = client.beta.threads.messages.list(thread_id=thread_id, order="asc")
-
-    messages_data = [
-        MessageData(
-            role=Role(message.role),
-            text=message.content[0].text.value if message.content else "",
-        ).to_dict()
-        for message in messages.data
-    ]
+    thread = retrieve_thread(thread_id)
+    # 첫 페이지(기본 20개)만이 아니라 모든 메시지를 100개씩 나눠 가져옵니다.
+    messages = client.beta.threads.messages.list(thread_id=thread_id, order="asc", limit=100)
+    messages_data = [message_to_dict(message) for message in messages]
 
     return create_response(
         status_code=HTTP_200_OK,
@@ -167,47 +379,275 @@ async def get_thread(memberId: str, thread_id: str):
     )
 
 
+# [시스템 메시지]에 저장된 주소/작물을 찾는 패턴 (채팅방 생성 / 주소 변경)
+SYSTEM_MESSAGE_PATTERNS = {
+    "address": (
+        re.compile(r"변경된 주소지:\s*(.+)"),
+        re.compile(r"주소 : (.+?)에서 작물"),
+    ),
+    "crop": (
+        re.compile(r"작물 : (.+?)을\(를\)"),
+    ),
+    "plantedAt": (
+        re.compile(r"변경된 심은날짜 :\s*(\S+)"),
+        re.compile(r"심은날짜 : (.+?), 주소"),
+    ),
+}
+
+
+def load_thread_context(thread_id: str) -> ThreadContext:
+    """채팅방의 농장 정보를 Thread metadata에서 읽습니다.
+
+    - metadata가 없는 이전 채팅방은 [시스템 메시지]를 처음부터 읽어 주소/작물/심은날짜를 찾습니다.
+    """
+    thread = retrieve_thread(thread_id)
+    if thread.metadata and thread.metadata.get("address"):
+        return ThreadContext.from_metadata(thread.metadata)
+
+    context = ThreadContext()
+    for message in client.beta.threads.messages.list(thread_id=thread_id, order="asc"):
+        if message.role != "assistant" or not message.content:
+            continue
+        text = message.content[0].text.value
+        if "[시스템 메시지]" not in text:
+            continue
+        for key, patterns in SYSTEM_MESSAGE_PATTERNS.items():
+            for pattern in patterns:
+                match = pattern.search(text)
+                if match:
+                    setattr(context, key, match.group(1).strip())
+                    break
+    return context
+
+
+def get_thread_context(thread_id: str) -> ThreadContext:
+    """채팅방 컨텍스트를 가져옵니다. (저장소에 없을 때만 Thread를 읽음)"""
+    context = context_store.get(thread_id)
+    cache_lookups.inc("thread_context", "miss" if context is None else "hit")
+    if context is None:
+        context = fetch_thread_context(thread_id)
+    return context
+
+
+def fetch_thread_context(thread_id: str) -> ThreadContext:
+    """Thread에서 컨텍스트를 읽어 저장소에 기록합니다."""
+    context = openai_flight.do(("context", thread_id), load_thread_context, thread_id)
+    context_store.set(thread_id, context)
+    return context
+
+
+def refresh_synopsis(thread_id: str, context: ThreadContext):
+    """truncation으로 run에서 빠지는 오래된 대화를 요약에 합칩니다.
+
+    - 응답을 보낸 뒤 백그라운드에서 실행되므로, 그 사이 PATCH나 다음 메시지로 바뀐 컨텍스트를 덮어쓰지 않도록
+      시작할 때와 저장 직전에 저장소에서 다시 읽어 요약 항목만 바꿉니다. (turns_since_summary는 예약할 때 이미 0으로 바꿨으므로
+      요약하는 동안 늘어난 값을 그대로 둡니다.)
+    """
+    context = context_store.get(thread_id) or context
+    keep = settings.RUN_CONTEXT_LAST_MESSAGES
+    messages = client.beta.threads.messages.list(
+        thread_id=thread_id,
+        order="desc",
+        limit=min(100, keep + settings.SUMMARY_EVERY_TURNS * 2),
+    )
+    older = [
+        message for message in reversed(messages.data[keep:])
+        if message.created_at > context.summarized_until and message.content
+        and "[시스템 메시지]" not in message.content[0].text.value
+    ]
+    if not older:
+        return
+
+    response = client.chat.completions.create(
+        model=settings.SUMMARY_MODEL,
+        messages=summary_messages(context.synopsis, [
+            {"role": message.role, "content": message.content[0].text.value} for message in older
+        ]),
+        temperature=0,
+        max_tokens=512,
+    )
+    latest = context_store.get(thread_id) or context
+    if latest.summarized_until >= older[-1].created_at:
+        # 다른 요약이 먼저 저장되었습니다.
+        return
+    latest.synopsis = response.choices[0].message.content.strip()
+    latest.summarized_until = older[-1].created_at
+    save_thread_context(thread_id, latest)
+
+
+def save_thread_context(thread_id: str, context: ThreadContext):
+    """채팅방 컨텍스트를 저장소와 Thread metadata에 기록합니다."""
+    client.beta.threads.update(thread_id=thread_id, metadata=context.to_metadata())
+    context_store.set(thread_id, context)
+
+
+def describe_current_weather(address: Optional[str]) -> Optional[str]:
+    """run에 함께 전달할 현재 날씨 문장 (조회 실패 시 None)"""
+    if not address:
+        return None
+    try:
+        weather_data = kakao_service.convert_address_to_coordinate(address)
+    except (HTTPException, LoadShedError, requests.exceptions.RequestException):
+        return None
+    thread_status = ThreadStatus()
+    return thread_status.describe_weather(address, thread_status.format_weather(weather_data))
+
+
+def answer_locally(thread, context: ThreadContext, intent: Intent) -> Optional[str]:
+    """날씨/상태 질문을 Assistant run 없이 서버의 정보로 답합니다.
+
+    - 상태 질문은 상태 API와 같은 build_status 결과로 날씨, 생육 단계, 추천 작업을 함께 알려줍니다.
+    - 주소나 날씨 정보를 얻지 못하면 None을 반환하여 Assistant가 답하도록 합니다.
+    """
+    if intent == Intent.WEATHER:
+        return describe_current_weather(context.address)
+    if not context.address:
+        return None
+    try:
+        weather, recent = cell_weather(*address_cell(context.address))
+    except (HTTPException, LoadShedError, requests.exceptions.RequestException):
+        return None
+    return describe_status(context, build_status(thread, context, weather, recent))
+
+
+def describe_status(context: ThreadContext, status: dict) -> str:
+    """build_status 결과를 채팅 답변 문장으로 만듭니다."""
+    lines = [
+        "현재 작물을 키우시는 곳의 상태를 알려드릴게요.",
+        ThreadStatus().describe_weather(context.address, status["weather"]),
+    ]
+    stage = status["growthStage"]
+    if stage is not None:
+        line = f"{context.crop or '작물'}은(는) 심은 지 {stage['daysSincePlanted']}일째로 {stage['name']} 단계입니다."
+        if stage["nextStage"]:
+            next_date = stage["nextStageDate"]
+            line += f" {next_date['month']}월 {next_date['day']}일쯤 {stage['nextStage']} 단계가 됩니다."
+        lines.append(line)
+    lines.append("오늘 추천 작업")
+    lines.extend(f"{int(index) + 1}. {action}" for index, action in status["recommendedActions"].items())
+    return "\n".join(lines)
+
+
+def append_exchange(thread_id: str, user_message: str, reply: str):
+    """로컬에서 답한 대화를 채팅방 기록에 남깁니다."""
+    client.beta.threads.messages.create(thread_id=thread_id, role="user", content=user_message)
+    client.beta.threads.messages.create(thread_id=thread_id, role="assistant", content=reply)
+
+
 class MessageRequest(BaseModel):
     """사용자가 보낸 메시지 정보를 담는 모델입니다."""
     message: str = Field("", description="사용자가 보낸 메시지 내용")
+    useCache: bool = Field(True, description="비슷한 질문의 저장된 답변 사용 여부")
 
 
-@router.post("/{thread_id}")
-async def send_message(memberId: str, thread_id: str, request: MessageRequest):
-    """특정 채팅방에 메시지를 전송하고 AI의 응답을 생성합니다."""
-    if not request.message:
-        raise ValueError("메시지가 누락되었습니다.")
-
-    thread = client.beta.threads.retrieve(thread_id=thread_id)
+def answer_scope(context: ThreadContext) -> Optional[str]:
+    """답변 캐시 키에 쓸 범위 (작물 + 기상청 격자 + 생육 단계)
 
+    - run에는 농장 주소의 날씨와 심은 지 며칠째인지가 함께 전달되므로, 같은 작물이라도 격자나 생육 단계가 다르면
+      답변을 공유하지 않습니다.
+    - 작물이나 주소를 모르거나 격자를 구하지 못하면 None을 반환하여 캐시를 쓰지 않습니다.
+    """
+    if not context.crop or not context.address:
+        return None
+    try:
+        nx, ny = address_cell(context.address)
+    except (HTTPException, LoadShedError, requests.exceptions.RequestException):
+        return None
+    stage = recommend(context.crop, context.planted_date(), datetime.now(KST).date())["stage"]
+    return f"{context.crop}:{nx},{ny}:{stage['name'] if stage else '-'}"
+
+
+def answer_without_run(thread_id: str, message: str, use_cache: bool):
+    """Assistant run 없이 답할 수 있는 질문이면 답하고 채팅방 기록에 남깁니다.
+
+    - 반환값: (채팅방 컨텍스트, 답변 캐시 범위, 로컬 답변 또는 None)
+    """
+    thread = retrieve_thread(thread_id)
+
+    intent = classify_intent(message)
+    context = get_thread_context(thread.id)
+
+    reply, scope = None, None
+    if intent != Intent.OTHER:
+        reply = answer_locally(thread, context, intent)
+    elif use_cache:
+        scope = answer_scope(context)
+        if scope:
+            reply = answer_cache.get(scope, message)
+            cache_lookups.inc("answer", "miss" if reply is None else "hit")
+    if reply is not None:
+        append_exchange(thread.id, message, reply)
+    return context, scope, reply
+
+
+def run_assistant(thread_id: str, message: str, context: ThreadContext):
+    """메시지를 추가하고 run을 만들어 끝날 때까지 기다립니다."""
     client.beta.threads.messages.create(
-        thread_id=thread.id,
+        thread_id=thread_id,
         role="user",
-        content=request.message,
+        content=message,
     )
 
+    started = time.monotonic()
     run = client.beta.threads.runs.create(
-        thread_id=thread.id,
-        assistant_id=assistant.id,
+        thread_id=thread_id,
+        assistant_id=get_assistant().id,
+        additional_instructions=context.run_instructions(weather=describe_current_weather(context.address)),
+        truncation_strategy=truncation_strategy(
+            settings.RUN_TRUNCATION_STRATEGY, settings.RUN_CONTEXT_LAST_MESSAGES
+        ),
     )
 
-    while True:
-        run_status = client.beta.threads.runs.retrieve(thread_id=thread_id, run_id=run.id)
-        if run_status.status == "completed":
-            break
-        elif run_status.status in ["failed", "cancelled"]:
-            raise HTTPException(
-                status_code=HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"AI 응답 생성 실패: {run_status.status}"
-            )
-        elif run_status.status == "expired":
-            raise HTTPException(
-                status_code=HTTP_408_REQUEST_TIMEOUT,
-                detail=f"AI 응답 생성 실패: {run_status.status}"
-            )
-        time.sleep(1)
-
-    messages = client.beta.threads.messages.list(thread_id=thread_id, order="desc", limit=1)
+    try:
+        run_status = wait_for_run(thread_id=thread_id, run_id=run.id)
+    except DeadlineExceeded:
+        run_duration.observe("deadline_exceeded", value=time.monotonic() - started)
+        raise
+    run_duration.observe(run_status.status, value=time.monotonic() - started)
+    return run_status
+
+
+@router.post("/{thread_id}")
+async def send_message(memberId: str, thread_id: str, request: MessageRequest, background_tasks: BackgroundTasks):
+    """특정 채팅방에 메시지를 전송하고 AI의 응답을 생성합니다.
+
+    - 블로킹 OpenAI 호출은 스레드에서 실행하고, run 대기열만 이벤트 루프에서 기다립니다.
+    """
+    if not request.message:
+        raise ValueError("메시지가 누락되었습니다.")
+
+    context, scope, reply = await run_in_threadpool(answer_without_run, thread_id, request.message, request.useCache)
+    if reply is not None:
+        return create_response(
+            status_code=HTTP_200_OK,
+            message="메시지를 성공적으로 전송하였습니다.",
+            data={"threadId": thread_id, "text": reply}
+        )
+
+    estimated_tokens = estimate_tokens(request.message)
+    member_rate_limiter.check_tokens(memberId, estimated_tokens)
+
+    deadline = current_deadline()
+    queued_at = time.monotonic()
+    try:
+        async with run_queue.slot(memberId, timeout=timeout_for("run_queue")):
+            if deadline is not None:
+                deadline.record("run_queue", time.monotonic() - queued_at)
+            run_status = await run_in_threadpool(run_assistant, thread_id, request.message, context)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded("run_queue", deadline)
+    if run_status.status == "expired":
+        raise HTTPException(
+            status_code=HTTP_408_REQUEST_TIMEOUT,
+            detail=f"AI 응답 생성 실패: {run_status.status}"
+        )
+    elif run_status.status != "completed":
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"AI 응답 생성 실패: {run_status.status}"
+        )
+
+    messages = await run_in_threadpool(client.beta.threads.messages.list, thread_id=thread_id, order="desc", limit=1)
     if not messages.data:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND,
@@ -217,10 +657,24 @@ async def send_message(memberId: str, thread_id: str, request: MessageRequest):
     latest_message = messages.data[0]
     if latest_message.role == "assistant":
         content = latest_message.content[0].text.value if latest_message.content else ""
+        if scope and not context.synopsis:
+            # 이전 대화 요약이 있는 채팅방의 답변은 그 대화에 맞춰져 있으므로 다른 채팅방과 공유하지 않습니다.
+            answer_cache.put(scope, request.message, content)
+
+        usage = usage_to_dict(run_status.usage)
+        logger.info("run %s usage: %s", run_status.id, usage)
+        member_rate_limiter.settle_tokens(memberId, estimated_tokens, usage and usage["totalTokens"])
+
+        context.turns_since_summary += 1
+        if context.turns_since_summary >= settings.SUMMARY_EVERY_TURNS:
+            context.turns_since_summary = 0
+            background_tasks.add_task(refresh_synopsis, thread_id, context)
+        context_store.set(thread_id, context)
+
         return create_response(
             status_code=HTTP_200_OK,
             message="메시지를 성공적으로 전송하였습니다.",
-            data={"threadId": thread_id, "text": content}
+            data={"threadId": thread_id, "text": content, "usage": usage}
         )
 
     raise HTTPException(status_code=HTTP_422_UNPROCESSABLE_ENTITY, detail="AI 응답을 찾을 수 없습니다.")
@@ -228,66 +682,53 @@ async def send_message(memberId: str, thread_id: str, request: MessageRequest):
 
 class ModifyMessageRequest(BaseModel):
     cropId: int = Field(-1, description="변경할 작물 ID")
+    cropName: str = Field("", description="변경할 작물 이름 (작물 ID를 바꿀 때)")
     address: str = Field("", description="변경할 주소")
     plantedAt: datetime = Field(None, description="변경할 심은 날짜 (YYYY-MM-DD 형식)")
 
 
 @router.patch("/{thread_id}")
-async def modify_message(memberId: str, thread_id: str, request: ModifyMessageRequest):
-    """특정 채팅방의 주소 정보를 수정합니다."""
+def modify_message(memberId: str, thread_id: str, request: ModifyMessageRequest):
+    """특정 채팅방의 주소 정보를 수정합니다. (run 없이 metadata만 갱신)"""
     if not thread_id:
         raise ValueError("채팅방 ID가 누락되었습니다.")
     if not request.address:
         raise ValueError("주소가 누락되었습니다.")
+    if request.cropName and re.search(r'[^\w\s]', request.cropName):
+        raise ValueError("올바른 작물명을 입력해야 합니다.")
 
-    thread = client.beta.threads.retrieve(thread_id=thread_id)
-
-    client.beta.threads.messages.create(
-        thread_id=thread.id,
-        role="assistant",
-        content=f"""
-       [시스템 메시지]
-       사용자 요청에 따라 주소지 변경 작업이 이루어졌습니다.
-
-       [변경 사항]
-       - 변경된 주소지: {request.address}
-       - 변경된 이유: 사용자의 요청에 따른 주소지 업데이트
-       - 변경된 심은날짜 : {request.plantedAt}
-       - 변경된 이유: 사용자의 요청에 따른 심은날짜 업데이트
-       """,
-    )
-
-    run = client.beta.threads.runs.create(
-        thread_id=thread.id,
-        assistant_id=assistant.id,
-    )
-
-    while True:
-        run_status = client.beta.threads.runs.retrieve(thread_id=thread.id, run_id=run.id)
-        if run_status.status == "completed":
-            break
-        elif run_status.status in ["failed", "cancelled", "expired"]:
-            raise HTTPException(
-                status_code=HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"AI 응답 생성 실패: {run_status.status}"
-            )
-        time.sleep(1)
-
+    context = get_thread_context(thread_id)
+    planted_at = request.plantedAt.strftime("%Y-%m-%d") if request.plantedAt else None
 
     request_data = {
         "address": request.address,
         "cropId": request.cropId,
-        "plantedAt": request.plantedAt,
-        "threadId": str(thread.id)
+        "plantedAt": planted_at,
+        "threadId": thread_id
     }
 
-    req = requests.patch(f"{BE_BASE_URL}/members/{memberId}/threads", json=request_data)
+    req = backend_http.patch(f"{BE_BASE_URL}/members/{memberId}/threads", json=request_data)
 
     if req.status_code != 200:
         raise HTTPException(
             status_code=req.status_code,
             detail=req.json().get("details", "백엔드 서버 요청 실패")
         )
+
+    context.address = request.address
+    if context.memberId is None:
+        # 회원이 기록되지 않은 이전 채팅방은 백엔드가 수정을 허용한 회원을 기록합니다.
+        context.memberId = memberId
+    if request.cropId != -1:
+        if request.cropName:
+            context.crop = request.cropName.strip()
+        elif request.cropId != context.cropId:
+            # 이름 없이 작물만 바뀌면 이전 작물명이 남지 않도록 지웁니다.
+            context.crop = None
+        context.cropId = request.cropId
+    if planted_at:
+        context.plantedAt = planted_at
+    save_thread_context(thread_id, context)
     return create_response(
         status_code=HTTP_200_OK,
         message="주소가 성공적으로 변경되었습니다.",
@@ -296,11 +737,12 @@ async def modify_message(memberId: str, thread_id: str, request: ModifyMessageRe
 
 
 @router.delete("/{thread_id}")
-async def delete_thread(memberId: str, thread_id: str):
+def delete_thread(memberId: str, thread_id: str):
     """특정 채팅방을 삭제합니다."""
     client.beta.threads.delete(thread_id)
+    context_store.delete(thread_id)
 
-    req = requests.delete(f"{BE_BASE_URL}/members/{memberId}/threads/{thread_id}", json=request_data)
+    req = backend_http.delete(f"{BE_BASE_URL}/members/{memberId}/threads/{thread_id}")
 
     if req.status_code != 200:
         raise HTTPException(
@@ -312,24 +754,7 @@ async def delete_thread(memberId: str, thread_id: str):
 
 class ThreadStatus:
     def __init__(self, model="gpt-4o-mini"):
-        self.tool = [{
-            "type": "function",
-            "function": {
-                "name": "get_weather",
-                "description": "Converts an address to geographic coordinates and retrieves weather information for those coordinates",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "address": {
-                            "type": "string",
-                            "description": "The address to be converted to coordinates"
-                        }
-                    },
-                    "required": ["address"],
-                    "additionalProperties": False
-                }
-            }
-        }]
+        self.tool = tool_registry.definitions("get_weather")
         self.message = None
         self.model = model
         self.directions = [
@@ -363,7 +788,8 @@ class ThreadStatus:
         idx = (int((float(vec_value) + 22.5) // 22.5) + 8) % 16
         return self.directions[idx]
 
-    def get_weather(self):
+    def extract_address(self) -> Optional[str]:
+        """[시스템 메시지]에서 LLM으로 주소를 추출합니다. (tool call이 없으면 None)"""
         response = client.chat.completions.create(
             model=self.model,
             messages=self.message,
@@ -381,53 +807,117 @@ class ThreadStatus:
         if response.choices[0].message.tool_calls:
             tool_call = response.choices[0].message.tool_calls[0]
             arguments = json.loads(tool_call.function.arguments)
-            address = arguments.get("address")
-            weather_data = kakao_service.convert_address_to_coordinate(address)
+            return arguments.get("address")
+        return None
 
-            skyCondition, rainCondition = self.get_sky_condition(weather_data["PTY"])
-            windDirection = self.get_wind_direction(weather_data["VEC"])
+    def get_weather(self):
+        address = self.extract_address()
+        if address:
+            return self.format_weather(kakao_service.convert_address_to_coordinate(address))
 
-            return {
-                "temp": weather_data["T1H"],
-                "skyCondition": skyCondition,
-                "rainProbability": weather_data["RN1"],
-                "rainCondition": rainCondition,
-                "humidity": weather_data["REH"],
-                "windSpeed": weather_data["WSD"],
-                "windDirection": windDirection
-            }
+    def format_weather(self, weather_data):
+        skyCondition, rainCondition = self.get_sky_condition(weather_data["PTY"])
+        windDirection = self.get_wind_direction(weather_data["VEC"])
 
+        return {
+            "temp": weather_data["T1H"],
+            "skyCondition": skyCondition,
+            "rainProbability": weather_data.get("POP"),
+            "rainfall": weather_data["RN1"],
+            "rainCondition": rainCondition,
+            "humidity": weather_data["REH"],
+            "windSpeed": weather_data["WSD"],
+            "windDirection": windDirection
+        }
 
-@router.get("/{thread_id}/status")
-async def get_thread_status(memberId: str, thread_id: str):
-    """특정 채팅방의 상태 정보를 반환합니다."""
-    thread = client.beta.threads.retrieve(thread_id=thread_id)
-    messages = client.beta.threads.messages.list(thread_id=thread.id, order="asc")
+    def describe_weather(self, address, weather):
+        """format_weather 결과를 채팅 답변 문장으로 만듭니다."""
+        description = (
+            f"현재 {address}의 날씨는 {weather['skyCondition']}이고 기온은 {weather['temp']}℃, "
+            f"습도는 {weather['humidity']}%입니다. "
+            f"바람은 {weather['windDirection']}풍 {weather['windSpeed']}m/s이며, "
+            f"최근 1시간 강수량은 {weather['rainfall']}mm입니다."
+        )
+        if weather["rainProbability"] is not None:
+            description += f" 강수확률은 {weather['rainProbability']:g}%입니다."
+        return description
+
+
+def resolve_address(thread_id: str, context: ThreadContext) -> Optional[str]:
+    """채팅방의 농장 주소
 
+    - 컨텍스트에 주소가 없는 채팅방은 [시스템 메시지]에서 LLM으로 주소를 추출하고, 다음 조회를 위해 저장소에 기록합니다.
+    """
+    if context.address:
+        return context.address
+    messages = client.beta.threads.messages.list(thread_id=thread_id, order="asc")
     assistant_message = [
         {"role": "assistant", "content": message.content[0].text.value}
         for message in messages
         if message.role == "assistant" and "[시스템 메시지]" in message.content[0].text.value
     ]
-
+    if not assistant_message:
+        return None
     thread_status = ThreadStatus()
     thread_status.set_message(assistant_message)
-    weather_data = thread_status.get_weather()
+    address = thread_status.extract_address()
+    if address:
+        context.address = address
+        context_store.set(thread_id, context)
+    return address
+
+
+def address_cell(address: str) -> tuple[int, int]:
+    """주소가 속한 기상청 격자 (nx, ny)"""
+    return lamcproj(*kakao_service.get_coordinate(address), 0, LamcParameter())
+
+
+def cell_weather(nx: int, ny: int) -> tuple[dict, Optional[dict]]:
+    """격자의 현재 날씨(format_weather 형식)와 최근 3일 관측 집계 (누적 강수량 / 최저 기온)"""
+    weather = ThreadStatus().format_weather(kakao_service.get_cell_weather(nx, ny))
+    return weather, kakao_service.history.summary(nx, ny, hours=72)
+
+
+def build_status(thread, context: ThreadContext, weather: Optional[dict], recent: Optional[dict]) -> dict:
+    """채팅방 상태 응답 (추천 작업은 작물별 생육 단계표와 날씨 규칙으로 서버에서 만듭니다. LLM 호출 없음)"""
+    recommendation = recommend(context.crop, context.planted_date(), datetime.now(KST).date(), weather, recent)
+    return {
+        "weather": weather,
+        "recommendedActions": {str(index): action for index, action in enumerate(recommendation["actions"])},
+        "growthStage": recommendation["stage"],
+        "schedule": recommendation["schedule"],
+        "createdAt": date_parts(datetime.fromtimestamp(thread.created_at, KST).date()),
+    }
+
+
+def status_error(error: Exception) -> dict:
+    """대시보드에서 실패한 채팅방의 오류 (전역 예외 처리기와 같은 오류 코드)"""
+    error = unwrap_openai_error(error)
+    if isinstance(error, HTTPException):
+        code, message = get_error_code(error.status_code), str(error.detail)
+    elif isinstance(error, openai.NotFoundError):
+        code, message = "NOT_FOUND", "채팅방을 찾을 수 없습니다."
+    elif isinstance(error, DeadlineExceeded):
+        code, message = "DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다."
+    elif isinstance(error, LoadShedError):
+        code, message = "OVERLOADED", "서버가 일시적으로 요청을 처리할 수 없습니다."
+    elif isinstance(error, openai.APIError):
+        code, message = "OPENAI_API_ERROR", "OpenAI API 요청에 실패했습니다."
+    else:
+        code, message = "INTERNAL_SERVER_ERROR", "예기치 않은 오류가 발생했습니다."
+    return ErrorDetail(code=code, message=message, details=str(error)).to_dict()
+
+
+@router.get("/{thread_id}/status")
+def get_thread_status(memberId: str, thread_id: str):
+    """특정 채팅방의 상태 정보를 반환합니다."""
+    thread = retrieve_thread(thread_id)
+    context = get_thread_context(thread.id)
+    address = resolve_address(thread.id, context)
+    weather_data, recent = cell_weather(*address_cell(address)) if address else (None, None)
 
     return create_response(
         status_code=HTTP_200_OK,
         message="상태 정보가 올바르게 반환되었습니다.",
-        data={
-            "weather": weather_data,
-            "recommendedActions": {
-                "0": "물 주기",
-                "1": "비료 주기",
-                "2": "영양제 주기"
-            },
-            "createdAt": {
-                "year": 2024,
-                "month": 12,
-                "day": 14,
-            }
-        }
+        data=build_status(thread, context, weather_data, recent)
     )
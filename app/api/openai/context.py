@@ -0,0 +1,152 @@
+# app/api/openai/context.py
+
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+from app.api.weather.history import KST
+from app.core.store import Store
+
+# OpenAI metadata 값의 최대 길이
+METADATA_VALUE_LIMIT = 512
+
+
+@dataclass
+class ThreadContext:
+    """채팅방마다 run에 함께 전달할 농장 정보와 이전 대화 요약
+
+    - 채팅방 메시지에 [시스템 메시지]로 남기지 않고 Thread metadata에 보관합니다.
+    """
+    address: Optional[str] = None
+    crop: Optional[str] = None
+    cropId: Optional[int] = None
+    plantedAt: Optional[str] = None
+    synopsis: str = ""
+    # 요약에 반영된 마지막 메시지의 생성 시각 (unix timestamp)
+    summarized_until: int = 0
+    # 마지막 요약 이후 진행된 run 수
+    turns_since_summary: int = 0
+    # 채팅방을 만든 회원 (이전 채팅방은 None)
+    memberId: Optional[str] = None
+
+    def to_metadata(self) -> dict[str, str]:
+        """OpenAI Thread metadata 형식 (값은 512자 이하 문자열)"""
+        metadata = {
+            "address": self.address,
+            "crop": self.crop,
+            "cropId": None if self.cropId is None else str(self.cropId),
+            "plantedAt": self.plantedAt,
+            "synopsis": self.synopsis[:METADATA_VALUE_LIMIT] or None,
+            "summarizedUntil": str(self.summarized_until) if self.summarized_until else None,
+            "memberId": self.memberId,
+        }
+        return {key: value[:METADATA_VALUE_LIMIT] for key, value in metadata.items() if value}
+
+    @classmethod
+    def from_metadata(cls, metadata: dict[str, str]) -> "ThreadContext":
+        crop_id = metadata.get("cropId")
+        return cls(
+            address=metadata.get("address"),
+            crop=metadata.get("crop"),
+            cropId=int(crop_id) if crop_id and crop_id.lstrip("-").isdigit() else None,
+            plantedAt=metadata.get("plantedAt"),
+            synopsis=metadata.get("synopsis", ""),
+            summarized_until=int(metadata.get("summarizedUntil", 0) or 0),
+            memberId=metadata.get("memberId"),
+        )
+
+    def owned_by(self, member_id: str) -> bool:
+        return self.memberId is not None and self.memberId == member_id
+
+    def planted_date(self) -> Optional[date]:
+        if not self.plantedAt:
+            return None
+        try:
+            return datetime.strptime(self.plantedAt[:10], "%Y-%m-%d").date()
+        except ValueError:
+            return None
+
+    def days_since_planted(self, today: Optional[date] = None) -> Optional[int]:
+        """심은 지 며칠째인지 (today를 주지 않으면 서버 시간대와 상관없이 한국 날짜 기준)"""
+        planted = self.planted_date()
+        return None if planted is None else ((today or datetime.now(KST).date()) - planted).days
+
+    def run_instructions(self, weather: Optional[str] = None, today: Optional[date] = None) -> Optional[str]:
+        """run마다 additional_instructions로 전달할 농장 정보, 생육 단계, 현재 날씨, 대화 요약"""
+        lines = []
+        if self.crop or self.address:
+            lines.append(
+                f"[농장 정보] 사용자는 심은날짜 : {self.plantedAt or '알 수 없음'}, "
+                f"주소 : {self.address or '알 수 없음'}에서 작물 : {self.crop or '알 수 없음'}을(를) 재배하고 있습니다."
+            )
+        days = self.days_since_planted(today)
+        if days is not None and days >= 0:
+            lines.append(f"[생육 단계] 오늘은 작물을 심은 지 {days}일째입니다.")
+        if weather:
+            lines.append(f"[현재 날씨] {weather}")
+        if self.synopsis:
+            lines.append(f"[이전 대화 요약]\n{self.synopsis}")
+        return "\n\n".join(lines) or None
+
+
+class ThreadContextStore:
+    """채팅방 컨텍스트 저장소 (공유 저장소를 쓰면 워커끼리 같은 컨텍스트를 봅니다.)
+
+    - 가져온 ThreadContext를 고친 뒤에는 set으로 다시 저장해야 반영됩니다.
+    """
+
+    def __init__(self, store: Store, ttl: Optional[float] = None):
+        self.store = store
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(thread_id: str) -> str:
+        return f"thread_context:{thread_id}"
+
+    def get(self, thread_id: str) -> Optional[ThreadContext]:
+        data = self.store.get(self._key(thread_id))
+        return None if data is None else ThreadContext(**data)
+
+    def get_many(self, thread_ids: Iterable[str]) -> dict[str, ThreadContext]:
+        keys = {self._key(thread_id): thread_id for thread_id in thread_ids}
+        return {keys[key]: ThreadContext(**data) for key, data in self.store.get_many(keys).items()}
+
+    def set(self, thread_id: str, context: ThreadContext):
+        self.store.set(self._key(thread_id), asdict(context), self.ttl)
+
+    def delete(self, thread_id: str):
+        self.store.delete(self._key(thread_id))
+
+
+def truncation_strategy(strategy: str, last_messages: int) -> dict:
+    """runs.create에 전달할 truncation_strategy"""
+    if strategy == "last_messages":
+        return {"type": "last_messages", "last_messages": last_messages}
+    return {"type": "auto"}
+
+
+SUMMARY_PROMPT = (
+    "당신은 농업 상담 대화를 요약하는 도우미입니다. "
+    "기존 요약과 새 대화를 합쳐 작물 상태, 사용자가 한 작업, 받은 조언, 남은 질문만 "
+    "한국어 bullet 5개 이내로 간결하게 정리하세요."
+)
+
+
+def summary_messages(synopsis: str, turns: list[dict]) -> list[dict]:
+    """요약용 chat.completions 메시지 목록"""
+    conversation = "\n".join(f"{turn['role']}: {turn['content']}" for turn in turns)
+    return [
+        {"role": "system", "content": SUMMARY_PROMPT},
+        {"role": "user", "content": f"[기존 요약]\n{synopsis or '없음'}\n\n[새 대화]\n{conversation}"},
+    ]
+
+
+def usage_to_dict(usage) -> Optional[dict]:
+    """run.usage를 응답용 딕셔너리로 변환"""
+    if usage is None:
+        return None
+    return {
+        "promptTokens": usage.prompt_tokens,
+        "completionTokens": usage.completion_tokens,
+        "totalTokens": usage.total_tokens,
+    }
@@ -0,0 +1,51 @@
+# app/api/openai/intent.py
+
+import re
+from enum import Enum
+
+
+class Intent(str, Enum):
+    WEATHER = "weather"
+    STATUS = "status"
+    OTHER = "other"
+
+
+# 날씨 질문으로 볼 수 있는 키워드
+WEATHER_KEYWORDS = ("날씨", "기온", "온도", "습도", "풍속", "바람", "강수", "비와", "비오", "비가", "눈와", "눈오", "눈이", "더워", "추워", "덥", "춥")
+# 밭/작물 상태 질문 키워드
+STATUS_KEYWORDS = ("상태", "현황")
+# 재배 환경을 묻는 표현 (물 온도, 흙 상태처럼 날씨 단어가 들어 있어도 재배 질문입니다.)
+CULTIVATION_TERMS = ("물", "흙", "토양", "수온", "지온", "잎", "뿌리", "모종", "싹", "발아", "하우스", "온실", "비닐", "적정", "적당", "알맞")
+# 질문 형태를 나타내는 표현
+QUESTION_CUES = ("?", "어때", "어떄", "어떤가", "어떻", "알려", "몇도", "얼마", "오나", "와요", "오니", "불어", "궁금")
+# 조언을 구하는 질문은 Assistant가 답해야 합니다.
+ADVICE_CUES = ("해도", "할까", "하나요", "해야", "언제", "방법", "심어", "심을", "수확", "물주", "비료", "영양제", "병", "벌레", "약", "괜찮")
+
+MAX_FAST_PATH_LENGTH = 40
+
+
+def normalize_message(message: str) -> str:
+    """공백과 문장부호 차이를 없앤 비교용 문자열"""
+    return re.sub(r"[\s.,!~]+", "", message)
+
+
+def classify_intent(message: str) -> Intent:
+    """메시지를 로컬에서 바로 답할 수 있는 질문인지 분류합니다.
+
+    - 짧은 날씨/상태 질문만 골라내고, 조언이 섞인 질문이나 재배 환경을 묻는 질문은 OTHER로 분류합니다.
+    """
+    text = normalize_message(message)
+    if not text or len(text) > MAX_FAST_PATH_LENGTH:
+        return Intent.OTHER
+    if any(cue in text for cue in ADVICE_CUES):
+        return Intent.OTHER
+    # "작물"의 "물"은 재배 환경 표현이 아닙니다.
+    if any(term in text.replace("작물", "") for term in CULTIVATION_TERMS):
+        return Intent.OTHER
+    if not any(cue in text for cue in QUESTION_CUES):
+        return Intent.OTHER
+    if any(keyword in text for keyword in STATUS_KEYWORDS):
+        return Intent.STATUS
+    if any(keyword in text for keyword in WEATHER_KEYWORDS):
+        return Intent.WEATHER
+    return Intent.OTHER
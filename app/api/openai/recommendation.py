@@ -0,0 +1,241 @@
+# app/api/openai/recommendation.py
+
+import operator
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+# 추천 작업 종류 (날씨 규칙이 같은 종류의 생육 단계 작업을 대신합니다.)
+WATER = "water"
+FERTILIZE = "fertilize"
+CARE = "care"
+PEST = "pest"
+HARVEST = "harvest"
+
+DEFAULT_CROP = "기본"
+# 추천 작업 최대 개수, 일정에 포함할 기간(일), 오늘 할 일로 볼 작업일 범위(일)
+MAX_ACTIONS = 5
+SCHEDULE_DAYS = 30
+DUE_WINDOW_DAYS = 3
+
+
+@dataclass(frozen=True)
+class GrowthStage:
+    start: int
+    name: str
+    actions: tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class CropRules:
+    """작물 하나의 생육 단계표와 심은 날 기준 작업 일정"""
+
+    stages: tuple[GrowthStage, ...]
+    tasks: tuple[tuple[int, str, str], ...]
+    # bisect용 정렬된 시작일 / 작업일
+    stage_starts: tuple[int, ...] = field(init=False)
+    task_days: tuple[int, ...] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "stage_starts", tuple(stage.start for stage in self.stages))
+        object.__setattr__(self, "task_days", tuple(day for day, _, _ in self.tasks))
+
+    def stage_index(self, days: int) -> int:
+        return max(bisect_right(self.stage_starts, days) - 1, 0)
+
+    def tasks_between(self, first: int, last: int) -> tuple[tuple[int, str, str], ...]:
+        """심은 지 first일부터 last일까지의 작업"""
+        return self.tasks[bisect_left(self.task_days, first):bisect_right(self.task_days, last)]
+
+
+def _rules(stages: list[tuple], tasks: list[tuple]) -> CropRules:
+    return CropRules(
+        stages=tuple(GrowthStage(start, name, tuple(actions)) for start, name, actions in sorted(stages)),
+        tasks=tuple(sorted(tasks)),
+    )
+
+
+# 작물별 생육 단계 (시작일, 단계, 작업)과 작업 일정 (심은 지 며칠째, 종류, 작업)
+CROP_RULES: dict[str, CropRules] = {
+    "감자": _rules(
+        [
+            (0, "발아기", [(WATER, "싹이 올라올 때까지 흙이 마르지 않게 물 주기"), (CARE, "싹이 올라왔는지 확인하기")]),
+            (20, "줄기 신장기", [(WATER, "5~7일 간격으로 물 주기"), (CARE, "튼튼한 줄기 2~3개만 남기고 솎기")]),
+            (40, "덩이줄기 형성기", [(WATER, "흙이 마르지 않게 물 주기"), (PEST, "역병 예방 살균제 뿌리기")]),
+            (60, "덩이줄기 비대기", [(WATER, "물 주기 간격을 일정하게 유지하기"), (CARE, "드러난 감자에 흙 덮어 주기")]),
+            (90, "수확기", [(HARVEST, "잎과 줄기가 누렇게 변하면 수확하기"), (WATER, "수확 1~2주 전부터 물 주기 중단")]),
+        ],
+        [(22, CARE, "싹 솎기"), (25, FERTILIZE, "웃거름 주기"), (30, CARE, "북주기"),
+         (50, CARE, "2차 북주기"), (85, WATER, "물 주기 중단"), (100, HARVEST, "수확")],
+    ),
+    "고추": _rules(
+        [
+            (0, "정식 활착기", [(WATER, "아주심은 뒤 뿌리가 내릴 때까지 물 주기"), (CARE, "지주 세우고 묶어 주기")]),
+            (15, "생육 초기", [(WATER, "3~4일 간격으로 물 주기"), (CARE, "첫 꽃 아래 곁순 제거하기")]),
+            (40, "개화 착과기", [(WATER, "꽃이 떨어지지 않게 물 주기"), (PEST, "진딧물과 총채벌레 살피기")]),
+            (70, "과실 비대기", [(FERTILIZE, "2~3주 간격으로 웃거름 주기"), (PEST, "탄저병 예방 살균제 뿌리기")]),
+            (90, "수확기", [(HARVEST, "붉게 익은 고추부터 수확하기"), (PEST, "병든 과실 바로 제거하기")]),
+        ],
+        [(5, CARE, "지주 세우기"), (20, FERTILIZE, "1차 웃거름 주기"), (25, CARE, "곁순 제거"),
+         (45, FERTILIZE, "2차 웃거름 주기"), (60, PEST, "탄저병 예방 방제"), (90, HARVEST, "첫 수확")],
+    ),
+    "토마토": _rules(
+        [
+            (0, "정식 활착기", [(WATER, "아주심은 뒤 뿌리가 내릴 때까지 물 주기"), (CARE, "지주 세우기")]),
+            (14, "생육 초기", [(WATER, "흙 겉이 마르면 물 주기"), (CARE, "곁순 제거하기")]),
+            (35, "개화기", [(CARE, "곁순 제거하고 줄기 묶어 주기"), (PEST, "잿빛곰팡이병 살피기")]),
+            (50, "과실 비대기", [(WATER, "물 주기 간격을 일정하게 유지해 열과 막기"), (FERTILIZE, "칼슘 영양제 주기")]),
+            (80, "수확기", [(HARVEST, "붉게 익은 과실부터 수확하기"), (CARE, "아래 잎 따 주기")]),
+        ],
+        [(3, CARE, "지주 세우기"), (14, CARE, "곁순 제거 시작"), (30, FERTILIZE, "1차 웃거름 주기"),
+         (50, FERTILIZE, "2차 웃거름 주기"), (80, HARVEST, "첫 수확")],
+    ),
+    "딸기": _rules(
+        [
+            (0, "활착기", [(WATER, "뿌리가 내릴 때까지 흙이 마르지 않게 물 주기"), (CARE, "시든 포기 다시 심기")]),
+            (30, "생육기", [(CARE, "러너와 묵은 잎 제거하기"), (FERTILIZE, "웃거름 주기")]),
+            (60, "개화기", [(CARE, "꽃가루받이가 잘 되도록 환기하기"), (PEST, "잿빛곰팡이병 살피기")]),
+            (90, "과실 비대기", [(WATER, "물 주기 간격을 일정하게 유지하기"), (PEST, "응애와 진딧물 살피기")]),
+            (120, "수확기", [(HARVEST, "80% 이상 붉어진 과실 수확하기"), (CARE, "상한 과실 바로 제거하기")]),
+        ],
+        [(20, CARE, "러너 제거"), (30, FERTILIZE, "웃거름 주기"), (55, CARE, "수정벌 넣기"),
+         (120, HARVEST, "첫 수확")],
+    ),
+    "배추": _rules(
+        [
+            (0, "정식 활착기", [(WATER, "아주심은 뒤 매일 물 주기"), (PEST, "벼룩잎벌레 살피기")]),
+            (15, "바깥잎 생육기", [(WATER, "흙 겉이 마르면 물 주기"), (FERTILIZE, "웃거름 주기")]),
+            (35, "결구기", [(WATER, "결구가 잘 되도록 물 충분히 주기"), (PEST, "배추좀나방과 무름병 살피기")]),
+            (60, "수확기", [(HARVEST, "속이 단단하게 차면 수확하기"), (CARE, "추위가 오기 전 바깥잎 묶어 주기")]),
+        ],
+        [(15, FERTILIZE, "1차 웃거름 주기"), (30, FERTILIZE, "2차 웃거름 주기"),
+         (40, FERTILIZE, "3차 웃거름 주기"), (60, HARVEST, "수확")],
+    ),
+    "상추": _rules(
+        [
+            (0, "발아 정식기", [(WATER, "흙이 마르지 않게 물 주기"), (CARE, "싹이 배게 나면 솎아 주기")]),
+            (10, "생육기", [(WATER, "흙 겉이 마르면 물 주기"), (PEST, "진딧물 살피기")]),
+            (30, "수확기", [(HARVEST, "바깥잎부터 따서 수확하기"), (FERTILIZE, "수확 후 웃거름 주기")]),
+        ],
+        [(15, FERTILIZE, "웃거름 주기"), (30, HARVEST, "첫 수확")],
+    ),
+    DEFAULT_CROP: _rules(
+        [
+            (0, "생육 초기", [(WATER, "흙이 마르지 않게 물 주기"), (CARE, "싹과 뿌리 상태 확인하기")]),
+            (30, "생육기", [(FERTILIZE, "웃거름 주기"), (PEST, "병해충 살피기")]),
+            (60, "성숙기", [(CARE, "수확 시기 확인하기"), (PEST, "병든 잎 제거하기")]),
+        ],
+        [(30, FERTILIZE, "웃거름 주기")],
+    ),
+}
+
+
+@dataclass(frozen=True)
+class WeatherRule:
+    """날씨 값이 기준을 넘으면 추가하는 작업 (suppresses 종류의 생육 단계 작업은 뺍니다.)"""
+
+    metric: str
+    compare: Callable[[Any, Any], bool]
+    threshold: float
+    message: str
+    suppresses: tuple[str, ...] = ()
+
+
+# 현재 날씨 (format_weather 결과) / 최근 관측 (rainfall72h: 72시간 누적 강수량, minTemp72h: 72시간 최저 기온)
+WEATHER_RULES = (
+    WeatherRule("rainProbability", operator.ge, 60, "강수확률 {value:g}% — 물 주기는 미루고 배수로를 정비하세요", (WATER,)),
+    WeatherRule("rainfall", operator.gt, 0, "비가 오고 있습니다({value:g}mm) — 오늘은 물 주기와 약제 살포를 미루세요", (WATER, PEST)),
+    WeatherRule("rainfall72h", operator.ge, 30, "최근 3일 강수량 {value:g}mm — 배수 상태와 뿌리 썩음을 확인하세요", (WATER,)),
+    WeatherRule("humidity", operator.ge, 85, "습도 {value:g}% — 곰팡이병 예방을 위해 환기하세요"),
+    WeatherRule("temp", operator.le, 5, "기온 {value:g}℃ — 저온 피해에 대비해 보온하세요"),
+    WeatherRule("minTemp72h", operator.le, 0, "최근 최저 기온 {value:g}℃ — 서리 피해가 없는지 확인하세요"),
+    WeatherRule("temp", operator.ge, 30, "기온 {value:g}℃ — 한낮 물 주기를 피하고 그늘을 만들어 주세요"),
+    WeatherRule("windSpeed", operator.ge, 9, "풍속 {value:g}m/s — 지주와 시설물을 점검하세요"),
+)
+
+
+@lru_cache(maxsize=1024)
+def crop_rules(crop: Optional[str]) -> tuple[str, CropRules]:
+    """작물명에 맞는 규칙표 ("방울토마토"처럼 이름에 등록된 작물이 들어 있으면 그 작물)"""
+    if crop:
+        name = crop.strip()
+        if name in CROP_RULES:
+            return name, CROP_RULES[name]
+        matches = [known for known in CROP_RULES if known in name]
+        if matches:
+            best = max(matches, key=len)
+            return best, CROP_RULES[best]
+    return DEFAULT_CROP, CROP_RULES[DEFAULT_CROP]
+
+
+def weather_metrics(weather: Optional[dict], recent: Optional[dict]) -> dict[str, float]:
+    """날씨 규칙에 쓸 값 (현재 날씨와 /weather/history 집계)"""
+    metrics = {key: value for key, value in (weather or {}).items() if isinstance(value, (int, float))}
+    aggregates = (recent or {}).get("aggregates", {})
+    if "RN1" in aggregates:
+        metrics["rainfall72h"] = aggregates["RN1"]["sum"]
+    if "T1H" in aggregates:
+        metrics["minTemp72h"] = aggregates["T1H"]["min"]
+    return metrics
+
+
+def date_parts(day: date) -> dict[str, int]:
+    return {"year": day.year, "month": day.month, "day": day.day}
+
+
+def recommend(
+    crop: Optional[str],
+    planted_at: Optional[date],
+    today: date,
+    weather: Optional[dict] = None,
+    recent: Optional[dict] = None,
+) -> dict:
+    """작물, 심은 날, 날씨로 오늘의 추천 작업과 앞으로의 작업 일정을 만듭니다.
+
+    - 날씨 규칙에 걸린 작업이 먼저 오고, 같은 종류의 생육 단계 작업은 빠집니다.
+    - 심은 날을 모르면 날씨 규칙에 걸린 작업만 추천합니다.
+    """
+    name, rules = crop_rules(crop)
+    metrics = weather_metrics(weather, recent)
+
+    actions, suppressed = [], set()
+    for rule in WEATHER_RULES:
+        value = metrics.get(rule.metric)
+        if value is not None and rule.compare(value, rule.threshold):
+            actions.append(rule.message.format(value=value))
+            suppressed.update(rule.suppresses)
+
+    days = (today - planted_at).days if planted_at else None
+    stage, next_stage, stage_actions, due, schedule = None, None, (), (), ()
+    if days is not None and days >= 0:
+        index = rules.stage_index(days)
+        stage = rules.stages[index]
+        stage_actions = stage.actions
+        due = rules.tasks_between(days - DUE_WINDOW_DAYS, days + DUE_WINDOW_DAYS)
+        schedule = rules.tasks_between(days + 1, days + SCHEDULE_DAYS)
+        next_stage = rules.stages[index + 1] if index + 1 < len(rules.stages) else None
+
+    for kind, text in (*((kind, text) for _, kind, text in due), *stage_actions):
+        if kind not in suppressed and text not in actions:
+            actions.append(text)
+    if not actions:
+        actions.append("작물 상태 확인하기")
+
+    result = {
+        "crop": name,
+        "actions": actions[:MAX_ACTIONS],
+        "stage": None,
+        "schedule": [
+            {"action": text, "date": date_parts(planted_at + timedelta(days=day))} for day, _, text in schedule
+        ],
+    }
+    if stage is not None:
+        result["stage"] = {
+            "name": stage.name,
+            "daysSincePlanted": days,
+            "nextStage": next_stage.name if next_stage else None,
+            "nextStageDate": date_parts(planted_at + timedelta(days=next_stage.start)) if next_stage else None,
+        }
+    return result
@@ -0,0 +1,94 @@
+# app/api/openai/tools.py
+
+import contextvars
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from fastapi import HTTPException
+
+from app.core.deadline import DeadlineExceeded
+from app.api.weather.weather import kakao_service
+
+logger = logging.getLogger(__name__)
+
+
+class ToolRegistry:
+    """Assistant가 호출할 수 있는 로컬 함수(tool)를 등록하고 실행합니다."""
+
+    def __init__(self, max_workers: int = 4):
+        self._tools: dict[str, tuple[Callable[..., Any], dict]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="assistant-tool")
+
+    def register(self, name: str, description: str, parameters: dict):
+        """함수를 tool로 등록하는 데코레이터"""
+        def decorator(fn: Callable[..., Any]):
+            self._tools[name] = (fn, {
+                "type": "function",
+                "function": {
+                    "name": name,
+                    "description": description,
+                    "parameters": parameters,
+                }
+            })
+            return fn
+        return decorator
+
+    def definitions(self, *names: str) -> list[dict]:
+        """OpenAI API에 전달할 tool 정의 목록 (이름을 주면 해당 tool만)"""
+        return [definition for name, (_, definition) in self._tools.items() if not names or name in names]
+
+    def _call(self, tool_call) -> dict:
+        name = tool_call.function.name
+        try:
+            if name not in self._tools:
+                raise ValueError(f"등록되지 않은 tool입니다: {name}")
+            fn, _ = self._tools[name]
+            arguments = json.loads(tool_call.function.arguments or "{}")
+            output = fn(**arguments)
+        except HTTPException as e:
+            output = {"error": str(e.detail)}
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.exception("tool 실행 실패: %s", name)
+            output = {"error": str(e)}
+        return {
+            "tool_call_id": tool_call.id,
+            "output": output if isinstance(output, str) else json.dumps(output, ensure_ascii=False),
+        }
+
+    def execute(self, tool_calls) -> list[dict]:
+        """tool 호출들을 동시에 실행하고 submit_tool_outputs 형식의 결과를 반환합니다.
+
+        - 실패한 tool은 에러 내용을 결과로 돌려주어 run이 계속 진행되도록 합니다.
+        """
+        # 요청 deadline이 tool 안의 업스트림 호출까지 전달되도록 contextvars를 복사합니다.
+        futures = [
+            self._executor.submit(contextvars.copy_context().run, self._call, tool_call)
+            for tool_call in tool_calls
+        ]
+        return [future.result() for future in futures]
+
+
+tool_registry = ToolRegistry()
+
+
+@tool_registry.register(
+    name="get_weather",
+    description="Converts an address to geographic coordinates and retrieves weather information for those coordinates",
+    parameters={
+        "type": "object",
+        "properties": {
+            "address": {
+                "type": "string",
+                "description": "The address to be converted to coordinates"
+            }
+        },
+        "required": ["address"],
+        "additionalProperties": False
+    },
+)
+def get_weather(address: str):
+    return kakao_service.convert_address_to_coordinate(address)
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Query
+from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_404_NOT_FOUND, HTTP_409_CONFLICT
+
+from app.core.profiling import current_session, start_session, stop_session
+from app.models.error import ErrorDetail
+from app.utils.response import create_response
+
+router = APIRouter()
+
+
+@router.post("/session")
+def start_profiling_session(seconds: float = Query(30, gt=0)):
+    """
+    프로세스 전체의 스택 표본 추출을 시작합니다. seconds가 지나면 스스로 끝나고 PROFILE_DIR에 저장됩니다.
+    """
+    try:
+        session = start_session(seconds)
+    except RuntimeError as e:
+        return create_response(
+            status_code=HTTP_409_CONFLICT,
+            message="프로파일링 세션을 시작하지 못했습니다.",
+            error=ErrorDetail(code="CONFLICT", message=str(e), details=None).to_dict()
+        )
+    return create_response(
+        status_code=HTTP_201_CREATED,
+        message="프로파일링 세션을 시작했습니다.",
+        data={**session.snapshot(), "maxSeconds": session.max_seconds}
+    )
+
+
+@router.get("/session")
+def get_profiling_session():
+    """
+    진행 중이거나 마지막으로 끝난 세션의 표본 수와 가장 많이 찍힌 함수를 반환합니다.
+    """
+    session = current_session()
+    if session is None:
+        return create_response(
+            status_code=HTTP_404_NOT_FOUND,
+            message="프로파일링 세션이 없습니다.",
+            error=ErrorDetail(code="NOT_FOUND", message="시작한 세션이 없습니다.", details=None).to_dict()
+        )
+    return create_response(status_code=HTTP_200_OK, message="프로파일링 세션을 조회했습니다.", data=session.snapshot())
+
+
+@router.delete("/session")
+def stop_profiling_session():
+    """
+    진행 중인 세션을 일찍 끝내고 저장된 파일과 결과를 반환합니다.
+    """
+    session = stop_session()
+    if session is None:
+        return create_response(
+            status_code=HTTP_404_NOT_FOUND,
+            message="프로파일링 세션이 없습니다.",
+            error=ErrorDetail(code="NOT_FOUND", message="시작한 세션이 없습니다.", details=None).to_dict()
+        )
+    return create_response(status_code=HTTP_200_OK, message="프로파일링 세션을 종료했습니다.", data=session.snapshot())
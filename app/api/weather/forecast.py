@@ -0,0 +1,147 @@
+# app/api/weather/forecast.py
+
+import codecs
+import json
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Iterator, Optional
+
+from app.api.weather.history import KST, observed_at
+
+
+class ForecastUnavailable(Exception):
+    """기상청 응답에 예보 항목이 없음 (아직 발표 전이거나 오류 응답)"""
+
+    def __init__(self, result_code: str):
+        super().__init__(f"예보를 가져오지 못했습니다. (resultCode={result_code})")
+        self.result_code = result_code
+
+
+@dataclass(frozen=True)
+class ForecastSchedule:
+    """예보 종류별 발표 주기
+
+    - 첫 발표 시각(first)부터 period마다 발표하며, 발표 후 delay가 지나야 API로 조회할 수 있습니다.
+    """
+
+    period: timedelta
+    first: timedelta
+    delay: timedelta
+    rows: int
+
+    def latest_base(self, now: datetime) -> datetime:
+        """now에 조회할 수 있는 가장 최근 발표 시각 (KST)"""
+        now = now.astimezone(KST)
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        elapsed = now - midnight - self.first - self.delay
+        return midnight + self.first + (elapsed // self.period) * self.period
+
+    def next_available(self, base: datetime) -> datetime:
+        """base 다음 발표를 조회할 수 있는 시각"""
+        return base + self.period + self.delay
+
+
+# 단기예보 (getVilageFcst): 02시부터 3시간마다, 3일치 약 1000행 (강수확률 POP 포함)
+# 초단기예보 (getUltraSrtFcst): 매시 30분, 6시간치 60행
+SCHEDULES = {
+    "village": ForecastSchedule(timedelta(hours=3), timedelta(hours=2), timedelta(minutes=10), rows=1000),
+    "ultra": ForecastSchedule(timedelta(hours=1), timedelta(minutes=30), timedelta(minutes=15), rows=60),
+}
+
+# 최신 발표가 아직 조회되지 않을 때 다시 확인하는 간격
+PENDING_RETRY_SECONDS = 120
+
+_RESULT_CODE = re.compile(r'"resultCode"\s*:\s*"([^"]*)"')
+_ITEM_ARRAY = re.compile(r'"item"\s*:\s*\[')
+_SEPARATORS = " \t\r\n,"
+
+
+def iter_items(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """기상청 JSON 응답의 item 배열 원소를 받는 대로 하나씩 꺼냅니다.
+
+    - 응답 전체를 문자열이나 dict로 만들지 않고, 아직 읽지 않은 항목 하나 분량만 버퍼에 둡니다.
+    - item 배열 전에 resultCode가 "00"이 아니거나 item 배열이 없으면 ForecastUnavailable을 발생시킵니다.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    in_items = False
+    for chunk in chunks:
+        buffer += utf8.decode(chunk)
+        if not in_items:
+            match = _ITEM_ARRAY.search(buffer)
+            if match is None:
+                continue
+            code = _RESULT_CODE.search(buffer, 0, match.start())
+            if code is not None and code.group(1) != "00":
+                raise ForecastUnavailable(code.group(1))
+            buffer = buffer[match.end():]
+            in_items = True
+
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in _SEPARATORS:
+                position += 1
+            if position == len(buffer):
+                break
+            if buffer[position] == "]":
+                return
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # 항목이 청크 경계에서 잘렸으면 다음 청크를 기다립니다.
+                break
+            yield item
+        buffer = buffer[position:]
+
+    if not in_items:
+        code = _RESULT_CODE.search(buffer)
+        raise ForecastUnavailable(code.group(1) if code else "NO_ITEMS")
+
+
+def forecast_value(value: str) -> Any:
+    """숫자 값은 float, "강수없음"이나 "1mm 미만" 같은 값은 문자열 그대로"""
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def compact_forecast(items: Iterable[dict], base_date: str, base_time: str) -> dict:
+    """행 단위 예보를 격자 하나의 열(column) 형식으로 바꿉니다.
+
+    - times는 예보 시각(unix timestamp)이고, values의 항목별 배열이 같은 순서로 값을 담습니다. (없는 값은 None)
+    """
+    columns: dict[str, dict[int, Any]] = {}
+    for item in items:
+        timestamp = observed_at(item["fcstDate"], item["fcstTime"])
+        columns.setdefault(item["category"], {})[timestamp] = forecast_value(item["fcstValue"])
+    times = sorted(set().union(*columns.values()))
+    return {
+        "baseDate": base_date,
+        "baseTime": base_time,
+        "times": times,
+        "values": {category: [column.get(timestamp) for timestamp in times] for category, column in columns.items()},
+    }
+
+
+def forecast_at(forecast: dict, timestamp: float) -> dict[str, Any]:
+    """timestamp가 속한 예보 시각의 항목별 값 (첫 예보 시각 전이면 첫 예보)"""
+    if not forecast["times"]:
+        return {}
+    index = max(bisect_right(forecast["times"], timestamp) - 1, 0)
+    return {category: column[index] for category, column in forecast["values"].items() if column[index] is not None}
+
+
+def slice_forecast(forecast: dict, since: float, hours: Optional[int] = None) -> dict:
+    """since가 속한 예보 시각부터 hours시간까지의 예보"""
+    times = forecast["times"]
+    start = max(bisect_right(times, since) - 1, 0)
+    end = len(times) if hours is None else bisect_right(times, since + hours * 3600)
+    return {
+        **forecast,
+        "times": times[start:end],
+        "values": {category: column[start:end] for category, column in forecast["values"].items()},
+    }
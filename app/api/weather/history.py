@@ -0,0 +1,162 @@
+# app/api/weather/history.py
+
+import math
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+KST = timezone(timedelta(hours=9))
+
+# 초단기실황 항목 (기온, 1시간 강수량, 동서/남북 바람 성분, 습도, 강수형태, 풍향, 풍속)
+CATEGORIES = ("T1H", "RN1", "UUU", "VVV", "REH", "PTY", "VEC", "WSD")
+
+
+def observed_at(base_date: str, base_time: str) -> int:
+    """발표 날짜 / 시각(KST)을 unix timestamp로 바꿉니다."""
+    return int(datetime.strptime(base_date + base_time, "%Y%m%d%H%M").replace(tzinfo=KST).timestamp())
+
+
+def to_iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, KST).isoformat()
+
+
+class CellHistory:
+    """격자 하나의 관측값을 시간 순서로 담는 고정 크기 ring buffer
+
+    - 관측 시각은 array('q'), 항목별 값은 array('d')에 같은 위치로 저장합니다. (없는 값은 NaN)
+    - 같은 발표 시각은 덮어쓰고, 마지막 관측보다 이전 시각은 버립니다.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.times = array("q", [0]) * capacity
+        self.values = {category: array("d", [math.nan]) * capacity for category in CATEGORIES}
+        self.size = 0
+        self.head = 0
+
+    def _slot(self, index: int) -> int:
+        """index번째로 오래된 관측의 위치"""
+        return (self.head - self.size + index) % self.capacity
+
+    def append(self, timestamp: int, observation: dict[str, float]) -> bool:
+        if self.size and timestamp <= self.times[self._slot(self.size - 1)]:
+            if timestamp < self.times[self._slot(self.size - 1)]:
+                return False
+            slot = self._slot(self.size - 1)
+        else:
+            slot = self.head
+            self.head = (self.head + 1) % self.capacity
+            self.size = min(self.size + 1, self.capacity)
+
+        self.times[slot] = timestamp
+        for category, column in self.values.items():
+            value = observation.get(category)
+            column[slot] = math.nan if value is None else float(value)
+        return True
+
+    def _first_index(self, since: int) -> int:
+        """since 이후 첫 관측의 index (이분 탐색)"""
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            if self.times[self._slot(middle)] < since:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def window(self, since: int) -> tuple[list[int], dict[str, list[float]]]:
+        """since 이후 관측 시각과 항목별 값"""
+        slots = [self._slot(index) for index in range(self._first_index(since), self.size)]
+        return (
+            [self.times[slot] for slot in slots],
+            {category: [column[slot] for slot in slots] for category, column in self.values.items()},
+        )
+
+    @property
+    def latest(self) -> Optional[int]:
+        return self.times[self._slot(self.size - 1)] if self.size else None
+
+
+def aggregate(category: str, values: list[float]) -> Optional[dict]:
+    """구간 안의 관측 수, 최소, 최대, 합, 평균, 마지막 값 (풍향 평균은 각도의 벡터 평균)"""
+    present = [value for value in values if not math.isnan(value)]
+    if not present:
+        return None
+    result = {
+        "count": len(present),
+        "min": min(present),
+        "max": max(present),
+        "sum": round(math.fsum(present), 2),
+        "mean": round(math.fsum(present) / len(present), 2),
+        "last": present[-1],
+    }
+    if category == "VEC":
+        x = math.fsum(math.sin(math.radians(value)) for value in present)
+        y = math.fsum(math.cos(math.radians(value)) for value in present)
+        result["mean"] = round(math.degrees(math.atan2(x, y)) % 360, 1)
+        del result["sum"]
+    return result
+
+
+class ObservationHistory:
+    """격자(nx, ny)별 초단기실황 관측 기록
+
+    - 조회한 관측을 쌓기만 하므로 업스트림을 추가로 호출하지 않습니다. (워커 프로세스마다 따로 쌓임)
+    - 격자가 max_cells개를 넘으면 가장 오래 쓰이지 않은 격자부터 제거합니다.
+    """
+
+    def __init__(self, capacity: int = 168, max_cells: int = 1000):
+        self.capacity = capacity
+        self.max_cells = max_cells
+        self._lock = threading.Lock()
+        self._cells: OrderedDict[tuple[int, int], CellHistory] = OrderedDict()
+
+    def append(self, nx: int, ny: int, timestamp: int, observation: dict[str, float]) -> bool:
+        with self._lock:
+            cell = self._cells.get((nx, ny))
+            if cell is None:
+                cell = self._cells[(nx, ny)] = CellHistory(self.capacity)
+                while len(self._cells) > self.max_cells:
+                    self._cells.popitem(last=False)
+            self._cells.move_to_end((nx, ny))
+            return cell.append(timestamp, observation)
+
+    def summary(self, nx: int, ny: int, hours: int, series: bool = False, now: Optional[float] = None) -> Optional[dict]:
+        """최근 hours시간의 항목별 집계 (기록이 없는 격자는 None)"""
+        now = time.time() if now is None else now
+        since = int(now - hours * 3600)
+        with self._lock:
+            cell = self._cells.get((nx, ny))
+            if cell is None:
+                return None
+            times, values = cell.window(since)
+            latest = cell.latest
+
+        summary = {
+            "nx": nx,
+            "ny": ny,
+            "hours": hours,
+            "from": to_iso(since),
+            "to": to_iso(now),
+            "samples": len(times),
+            "latestObservedAt": to_iso(latest),
+            "aggregates": {
+                category: result for category in CATEGORIES
+                if (result := aggregate(category, values[category])) is not None
+            },
+        }
+        if series:
+            summary["series"] = {
+                "time": [to_iso(timestamp) for timestamp in times],
+                **{category: [None if math.isnan(value) else value for value in column]
+                   for category, column in values.items()},
+            }
+        return summary
+
+    def __len__(self):
+        with self._lock:
+            return len(self._cells)
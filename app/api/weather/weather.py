@@ -1,13 +1,28 @@
 import os
 import math
+import time
+import asyncio
+import logging
 import requests
 import json
-from datetime import datetime
-from typing import List, Any, Optional, Generic, TypeVar
+from datetime import datetime, timedelta
+from typing import List, Any, Literal, Optional, Generic, TypeVar
 from starlette.status import HTTP_404_NOT_FOUND, HTTP_500_INTERNAL_SERVER_ERROR
 from app.core.config import settings
-from starlette.responses import JSONResponse
+from app.core.singleflight import SingleFlight, normalize_address
+from app.core.upstream import upstream_session
+from app.core.admission import LoadShedError
+from app.core.deadline import DeadlineExceeded
+from app.core.metrics import cache_lookups
+from app.core.store import store
+from app.api.weather.history import CATEGORIES, KST, ObservationHistory, observed_at, to_iso
+from app.api.weather.forecast import (
+    PENDING_RETRY_SECONDS, SCHEDULES, ForecastUnavailable, compact_forecast, forecast_at, iter_items, slice_forecast
+)
+from app.utils.response import create_response
+from app.models.error import ErrorDetail
 from fastapi import APIRouter, HTTPException, status, Query
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, field_validator, ValidationError
 from starlette.status import (
     HTTP_200_OK,
@@ -22,37 +37,7 @@ from starlette.status import (
     HTTP_500_INTERNAL_SERVER_ERROR, HTTP_408_REQUEST_TIMEOUT
 )
 
-
-def create_response(*,
-                    status_code: int,
-                    message: str,
-                    data: Any = None,
-                    error: dict[str, str] = None) -> JSONResponse:
-    """통합 응답 생성 함수
-    - status_code로 성공/실패 판단 (2xx는 성공, 4xx/5xx는 실패)
-    """
-    return JSONResponse(status_code=status_code, content=
-    {
-        "message": message,
-        "data": data,
-        "error": error}
-                        )
-
-
-class ErrorDetail(BaseModel):
-    """에러 상세 정보 모델"""
-    code: str
-    message: str
-    details: Optional[str] = None
-
-    def to_dict(self):
-        """객체를 딕셔너리로 변환"""
-        return {
-            "code": self.code,
-            "message": self.message,
-            "details": self.details
-        }
-
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -101,69 +86,278 @@ def lamcproj(lon, lat, code, map_param):
         x = ra * math.sin(theta) + map_param.xo
         y = ro - ra * math.cos(theta) + map_param.yo
         return round(x), round(y)
-    else:
-        # 여기에 코드가 있을 경우 역변환 코드 구현
-        return lon, lat
+    else:  # X, Y -> 위도, 경도 변환 (lon, lat 자리에 X, Y를 받아 (경도, 위도)를 반환)
+        xn = lon - map_param.xo
+        yn = ro - lat + map_param.yo
+        ra = math.sqrt(xn * xn + yn * yn)
+        if sn < 0.0:
+            ra = -ra
+        alat = (re * sf / ra) ** (1.0 / sn)
+        alat = 2.0 * math.atan(alat) - PI * 0.5
+        if abs(xn) <= 0.0:
+            theta = 0.0
+        elif abs(yn) <= 0.0:
+            theta = PI * 0.5 if xn > 0 else -PI * 0.5
+        else:
+            theta = math.atan2(xn, yn)
+        alon = theta / sn + olon
+        return alon * RADDEG, alat * RADDEG
+
+
+def isint(s):
+    try:
+        int(s)
+        return True
+    except ValueError:
+        return False
+
+
+def parse_nowcast_items(items):
+    """초단기실황 item 목록을 {category: 관측값} 으로 바꿉니다. (정수로 읽히면 int, 아니면 float)"""
+    return {
+        item["category"]: int(item["obsrValue"]) if isint(item["obsrValue"]) else float(item["obsrValue"])
+        for item in items
+    }
+
+
+def nowcast_cache_key(nx: int, ny: int, now: datetime) -> str:
+    # 조회한 시각(정시 단위)마다 캐시합니다. 발표 전이라 이전 시각의 실황을 쓴 경우는 _fetch_nowcast에서 짧게 캐시합니다.
+    return f"nowcast:{nx}:{ny}:{now:%Y%m%d%H}"
+
+
+def parse_bbox(bbox: str) -> tuple[float, float, float, float]:
+    """bbox 문자열 ("최소경도,최소위도,최대경도,최대위도")을 숫자로 바꿉니다."""
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(value) for value in bbox.split(","))
+    except ValueError:
+        raise ValueError("bbox는 '최소경도,최소위도,최대경도,최대위도' 형식이어야 합니다.")
+    if not (min_lon < max_lon and min_lat < max_lat):
+        raise ValueError("bbox의 최소값은 최대값보다 작아야 합니다.")
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def grid_cells(min_lon: float, min_lat: float, max_lon: float, max_lat: float,
+               max_cells: int) -> list[tuple[int, int, float, float]]:
+    """중심이 bbox 안에 있는 격자 (nx, ny, 중심 경도, 중심 위도)
+
+    - 람베르트 투영에서 위도선은 곡선이므로 모서리와 변의 가운데를 모두 투영해서 후보 범위를 잡습니다.
+    - bbox가 격자 하나보다 작으면 bbox 가운데의 격자 하나를 반환합니다.
+    """
+    param = LamcParameter()
+    points = [
+        lamcproj(lon, lat, 0, param)
+        for lon in (min_lon, (min_lon + max_lon) / 2, max_lon)
+        for lat in (min_lat, (min_lat + max_lat) / 2, max_lat)
+    ]
+    xs, ys = [x for x, _ in points], [y for _, y in points]
+    if (max(xs) - min(xs) + 1) * (max(ys) - min(ys) + 1) > max_cells * 2:
+        raise ValueError(f"bbox가 너무 넓습니다. (격자 최대 {max_cells}개)")
+
+    cells = []
+    for nx in range(min(xs), max(xs) + 1):
+        for ny in range(min(ys), max(ys) + 1):
+            lon, lat = lamcproj(nx, ny, 1, param)
+            if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat:
+                cells.append((nx, ny, lon, lat))
+    if not cells:
+        nx, ny = lamcproj((min_lon + max_lon) / 2, (min_lat + max_lat) / 2, 0, param)
+        cells.append((nx, ny, *lamcproj(nx, ny, 1, param)))
+    if len(cells) > max_cells:
+        raise ValueError(f"bbox가 너무 넓습니다. (격자 {len(cells)}개, 최대 {max_cells}개)")
+    return cells
 
 
 class KakaoLocalService:
-    KAKAO_API_URL = "https://dapi.kakao.com/v2/local/search/address.json"
+    KAKAO_API_URL = settings.KAKAO_LOCAL_API_URL
 
     def __init__(self):
         self.API_KEY = settings.KAKAO_LOCAL_API_KEY
-        self.url = 'http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getUltraSrtNcst'
-
-    def convert_address_to_coordinate(self, address):
-        def get_weather(lon: float, lat: float):
-            def isint(s):
-                try:
-                    int(s)
-                    return True
-                except ValueError:
-                    return False
-            param = LamcParameter()
-            nx, ny = lamcproj(lon, lat, 0, param)
-
-            today = datetime.now().strftime("%Y%m%d")
-            times = int(datetime.now().strftime("%H"))
+        self.url = settings.KMA_NOWCAST_URL
+        # Kakao / 기상청 호출은 각각 전용 bulkhead에서 실행됩니다.
+        self.kakao_http = upstream_session("kakao")
+        self.kma_http = upstream_session("kma")
+        # 같은 주소/격자에 대한 동시 조회는 업스트림 호출 하나로 합칩니다.
+        self._geocode_flight = SingleFlight()
+        self._nowcast_flight = SingleFlight()
+        self._forecast_flight = SingleFlight()
+        self.forecast_urls = {
+            "village": settings.KMA_VILLAGE_FORECAST_URL,
+            "ultra": settings.KMA_ULTRA_FORECAST_URL,
+        }
+        # 조회한 실황은 격자별로 쌓아 두고 /weather/history에서 집계합니다.
+        self.history = ObservationHistory(
+            capacity=settings.WEATHER_HISTORY_HOURS, max_cells=settings.WEATHER_HISTORY_MAX_CELLS
+        )
 
-            for i in range(3):
-                try:
-                    params = {
-                        'serviceKey': settings.WEATHER_API_KEY,
-                        'pageNo': '1',
-                        'numOfRows': '8',
-                        'dataType': 'JSON',
-                        'base_date': today,
-                        'base_time': f"{(times - i):02d}00",
-                        'nx': nx,
-                        'ny': ny
-                    }
-                    response = requests.get(self.url, params=params)
-                    response.raise_for_status()
-                    response_data = response.json()
-                    print(response)
-                    if response_data["response"]["header"]["resultCode"] != "00":
-                        continue
-                    values = {
-                        item["category"]: int(item["obsrValue"]) if isint(item["obsrValue"]) else float(item["obsrValue"])
-                        for item in response_data["response"]["body"]["items"]["item"]
-                    }
-                    return values
-                except requests.exceptions.RequestException as e:
-                    continue
-            return HTTPException(status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail="날씨 정보를 가져오지 못했습니다")
+    def get_coordinate(self, address):
+        """주소를 (경도, 위도)로 변환합니다. (변환 결과는 워커끼리 공유하는 저장소에 캐시)"""
+        normalized = normalize_address(address)
+        cached = store.get(f"geocode:{normalized}")
+        cache_lookups.inc("geocode", "miss" if cached is None else "hit")
+        if cached is not None:
+            return tuple(cached)
+        coordinate = self._geocode_flight.do(normalized, self._request_coordinate, address)
+        store.set(f"geocode:{normalized}", coordinate, settings.GEOCODE_CACHE_TTL_SECONDS)
+        return coordinate
 
+    def _request_coordinate(self, address):
         headers = {"Authorization": f"KakaoAK {self.API_KEY}"}
-        response = requests.get(self.KAKAO_API_URL, headers=headers, params={"query": address})
+        response = self.kakao_http.get(self.KAKAO_API_URL, headers=headers, params={"query": address})
         response.raise_for_status()
         data = response.json()
         if data["documents"]:
             document = data["documents"][0]
-            return get_weather(float(document['x']), float(document['y']))
-        else:
-            raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="주소가 올바르지 않습니다.")
+            return float(document['x']), float(document['y'])
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="주소가 올바르지 않습니다.")
+
+    def _request_nowcast(self, nx, ny, base_date, base_time):
+        params = {
+            'serviceKey': settings.WEATHER_API_KEY,
+            'pageNo': '1',
+            'numOfRows': '8',
+            'dataType': 'JSON',
+            'base_date': base_date,
+            'base_time': base_time,
+            'nx': nx,
+            'ny': ny
+        }
+        response = self.kma_http.get(self.url, params=params)
+        response.raise_for_status()
+        logger.debug("초단기실황 응답 (nx=%s, ny=%s, base=%s%s): %s", nx, ny, base_date, base_time, response.status_code)
+        return response.json()
+
+    def get_weather(self, lon: float, lat: float):
+        param = LamcParameter()
+        nx, ny = lamcproj(lon, lat, 0, param)
+        return self.get_cell_weather(nx, ny)
+
+    def get_cell_weather(self, nx: int, ny: int):
+        """격자의 현재 실황에 단기예보의 강수확률(POP, %)을 더한 값"""
+        base_date, base_time, weather = self.get_nowcast(nx, ny)
+        self.history.append(nx, ny, observed_at(base_date, base_time), weather)
+        return {**weather, "POP": self.get_rain_probability(nx, ny)}
+
+    def get_rain_probability(self, nx: int, ny: int) -> Optional[float]:
+        """현재 시각 단기예보의 강수확률 (예보를 가져오지 못하면 None)"""
+        try:
+            forecast = self.get_forecast(nx, ny, "village")
+        except (HTTPException, LoadShedError, ForecastUnavailable, DeadlineExceeded) as e:
+            logger.warning("강수확률 조회 실패 (nx=%s, ny=%s): %s", nx, ny, e)
+            return None
+        return forecast_at(forecast, time.time()).get("POP")
 
+    def get_forecast(self, nx: int, ny: int, kind: str = "village") -> dict:
+        """격자의 최신 예보 (compact_forecast 형식)
+
+        - 같은 격자의 농장들이 하나의 예보를 공유하도록 발표 시각별로 격자 단위 캐시에 저장합니다.
+        - 최신 발표가 아직 조회되지 않으면 이전 발표를 사용합니다.
+        """
+        schedule = SCHEDULES[kind]
+        now = datetime.now(KST)
+        base = schedule.latest_base(now)
+        # 다음 발표를 조회할 수 있을 때까지 캐시합니다.
+        ttl = max((schedule.next_available(base) - now).total_seconds(), 60)
+        keys = []
+        for attempt in range(2):
+            base_date, base_time = f"{base:%Y%m%d}", f"{base:%H%M}"
+            cache_key = f"forecast:{kind}:{nx}:{ny}:{base_date}{base_time}"
+            keys.append(cache_key)
+            forecast = store.get(cache_key)
+            cache_lookups.inc("forecast", "miss" if forecast is None else "hit")
+            if forecast is None:
+                try:
+                    forecast = self._forecast_flight.do(
+                        cache_key, self._request_forecast, kind, nx, ny, base_date, base_time
+                    )
+                except ForecastUnavailable:
+                    if attempt:
+                        raise
+                    base -= schedule.period
+                    continue
+                except requests.exceptions.RequestException:
+                    raise HTTPException(status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail="예보 정보를 가져오지 못했습니다")
+                store.set(cache_key, forecast, ttl)
+            if attempt:
+                # 최신 발표가 조회될 때까지 잠시 이전 발표로 응답합니다. (격자마다 매번 다시 확인하지 않도록)
+                store.set(keys[0], forecast, PENDING_RETRY_SECONDS)
+            return forecast
+
+    def _request_forecast(self, kind: str, nx: int, ny: int, base_date: str, base_time: str) -> dict:
+        # 단기예보는 격자당 수백 행이므로 응답을 받는 대로 읽어 열 형식으로 모읍니다.
+        params = {
+            'serviceKey': settings.WEATHER_API_KEY,
+            'pageNo': '1',
+            'numOfRows': str(SCHEDULES[kind].rows),
+            'dataType': 'JSON',
+            'base_date': base_date,
+            'base_time': base_time,
+            'nx': nx,
+            'ny': ny
+        }
+        with self.kma_http.get(self.forecast_urls[kind], params=params, stream=True) as response:
+            response.raise_for_status()
+            return compact_forecast(iter_items(response.iter_content(chunk_size=16384)), base_date, base_time)
+
+    def get_nowcast(self, nx: int, ny: int):
+        """격자의 최근 실황 (발표 날짜, 발표 시각, 관측값)"""
+        # 발표 시각은 KST 기준입니다. (컨테이너 시간대가 UTC여도 같은 시각을 요청)
+        now = datetime.now(KST)
+        cached = store.get(nowcast_cache_key(nx, ny, now))
+        cache_lookups.inc("nowcast", "miss" if cached is None else "hit")
+        if cached is not None:
+            return tuple(cached)
+        return self._fetch_nowcast(nx, ny, now)
+
+    def _fetch_nowcast(self, nx: int, ny: int, now: datetime):
+        for i in range(3):
+            try:
+                # 자정 직후에는 전날 23시, 22시 실황으로 넘어갑니다.
+                base = now - timedelta(hours=i)
+                base_date, base_time = f"{base:%Y%m%d}", f"{base:%H}00"
+                response_data = self._nowcast_flight.do(
+                    (nx, ny, base_date, base_time), self._request_nowcast, nx, ny, base_date, base_time
+                )
+                if response_data["response"]["header"]["resultCode"] != "00":
+                    continue
+                nowcast = (base_date, base_time, parse_nowcast_items(response_data["response"]["body"]["items"]["item"]))
+                # 이전 시각의 실황이면 이번 시각 발표를 곧 다시 확인하도록 짧게 캐시합니다.
+                ttl = settings.NOWCAST_CACHE_TTL_SECONDS if i == 0 else PENDING_RETRY_SECONDS
+                store.set(nowcast_cache_key(nx, ny, now), nowcast, ttl)
+                return nowcast
+            except requests.exceptions.RequestException as e:
+                continue
+        raise HTTPException(status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail="날씨 정보를 가져오지 못했습니다")
+
+    async def get_nowcasts(self, cells: list[tuple[int, int]], concurrency: int) -> dict[tuple[int, int], Optional[tuple]]:
+        """여러 격자의 실황 (캐시에 있는 격자는 한 번에 읽고, 없는 격자만 concurrency개씩 동시에 조회)
+
+        - 조회에 실패한 격자는 None입니다.
+        """
+        now = datetime.now(KST)
+        keys = {nowcast_cache_key(nx, ny, now): (nx, ny) for nx, ny in cells}
+        cached = await run_in_threadpool(store.get_many, keys)
+        cache_lookups.inc("nowcast", "hit", amount=len(cached))
+        cache_lookups.inc("nowcast", "miss", amount=len(keys) - len(cached))
+        nowcasts = {keys[key]: tuple(value) for key, value in cached.items()}
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(cell: tuple[int, int]):
+            async with semaphore:
+                try:
+                    nowcasts[cell] = await run_in_threadpool(self._fetch_nowcast, *cell, now)
+                except (HTTPException, LoadShedError):
+                    nowcasts[cell] = None
+
+        await asyncio.gather(*(fetch(cell) for cell in keys.values() if cell not in nowcasts))
+        for (nx, ny), nowcast in nowcasts.items():
+            if nowcast is not None:
+                self.history.append(nx, ny, observed_at(nowcast[0], nowcast[1]), nowcast[2])
+        return nowcasts
+
+    def convert_address_to_coordinate(self, address):
+        lon, lat = self.get_coordinate(address)
+        return self.get_weather(lon, lat)
 
 
 kakao_service = KakaoLocalService()
@@ -189,6 +383,9 @@ def get_coordinates(address: str):
                     details="Invalid address"
                 ).to_dict()
             )
+    except (DeadlineExceeded, LoadShedError):
+        # 전역 예외 처리기에서 504 / 503으로 응답합니다.
+        raise
     except HTTPException as e:
         return create_response(
             status_code=e.status_code,
@@ -211,6 +408,121 @@ def get_coordinates(address: str):
         )
 
 
+@router.get("/history")
+def get_history(
+    address: Optional[str] = None,
+    nx: Optional[int] = None,
+    ny: Optional[int] = None,
+    hours: int = Query(24, ge=1, le=settings.WEATHER_HISTORY_HOURS),
+    series: bool = False,
+):
+    """
+    격자의 최근 hours시간 관측 집계(최소, 최대, 합, 평균, 마지막 값)를 반환합니다.
+    예) 3일 누적 강수량: hours=72의 RN1.sum, 밤사이 최저 기온: hours=12의 T1H.min
+    - address 또는 nx, ny로 격자를 지정하며, 이미 조회된 관측만 사용합니다. (series=true이면 시각별 값 포함)
+    """
+    if nx is None or ny is None:
+        if not address:
+            raise ValueError("address 또는 nx, ny가 필요합니다.")
+        nx, ny = lamcproj(*kakao_service.get_coordinate(address), 0, LamcParameter())
+
+    summary = kakao_service.history.summary(nx, ny, hours, series=series)
+    if summary is None:
+        return create_response(
+            status_code=HTTP_404_NOT_FOUND,
+            message="관측 기록이 없습니다.",
+            error=ErrorDetail(
+                code="NOT_FOUND",
+                message="아직 이 격자의 날씨를 조회한 적이 없습니다.",
+                details=f"nx={nx}, ny={ny}"
+            ).to_dict()
+        )
+    return create_response(
+        status_code=HTTP_200_OK,
+        message="관측 기록을 성공적으로 조회했습니다.",
+        data=summary
+    )
+
+
+@router.get("/forecast")
+def get_forecast(
+    address: Optional[str] = None,
+    nx: Optional[int] = None,
+    ny: Optional[int] = None,
+    kind: Literal["village", "ultra"] = "village",
+    hours: Optional[int] = Query(None, ge=1, le=72),
+):
+    """
+    격자의 최신 예보를 예보 시각 순서의 배열(times, values.<항목>)로 반환합니다.
+    - kind=village: 단기예보 (3일, 강수확률 POP 포함), kind=ultra: 초단기예보 (6시간)
+    - address 또는 nx, ny로 격자를 지정하며, hours를 주면 현재 시각부터 hours시간까지만 반환합니다.
+    """
+    if nx is None or ny is None:
+        if not address:
+            raise ValueError("address 또는 nx, ny가 필요합니다.")
+        nx, ny = lamcproj(*kakao_service.get_coordinate(address), 0, LamcParameter())
+
+    try:
+        forecast = slice_forecast(kakao_service.get_forecast(nx, ny, kind), time.time(), hours)
+    except ForecastUnavailable as e:
+        return create_response(
+            status_code=HTTP_404_NOT_FOUND,
+            message="예보 정보가 없습니다.",
+            error=ErrorDetail(
+                code="NOT_FOUND",
+                message=str(e),
+                details=f"nx={nx}, ny={ny}, kind={kind}"
+            ).to_dict()
+        )
+    return create_response(
+        status_code=HTTP_200_OK,
+        message="예보 정보를 성공적으로 조회했습니다.",
+        data={
+            "nx": nx,
+            "ny": ny,
+            "kind": kind,
+            **forecast,
+            "times": [to_iso(timestamp) for timestamp in forecast["times"]],
+        }
+    )
+
+
+@router.get("/region")
+async def get_region(bbox: str = Query(..., description="최소경도,최소위도,최대경도,최대위도")):
+    """
+    bbox 안의 모든 격자 실황을 반환합니다.
+    - 격자마다 객체를 만들지 않고 같은 순서의 배열(nx, ny, lon, lat, observedAt, values.<항목>)로 반환합니다.
+    - 캐시에 없는 격자만 기상청에 조회하며, 조회에 실패한 격자의 값은 null입니다.
+    """
+    cells = grid_cells(*parse_bbox(bbox), max_cells=settings.WEATHER_REGION_MAX_CELLS)
+    nowcasts = await kakao_service.get_nowcasts(
+        [(nx, ny) for nx, ny, _, _ in cells], concurrency=settings.WEATHER_REGION_CONCURRENCY
+    )
+
+    observed = []
+    values = {category: [] for category in CATEGORIES}
+    for nx, ny, _, _ in cells:
+        nowcast = nowcasts.get((nx, ny))
+        observed.append(None if nowcast is None else observed_at(nowcast[0], nowcast[1]))
+        for category, column in values.items():
+            column.append(None if nowcast is None else nowcast[2].get(category))
+
+    return create_response(
+        status_code=HTTP_200_OK,
+        message="지역 날씨 정보를 성공적으로 조회했습니다.",
+        data={
+            "count": len(cells),
+            "missing": observed.count(None),
+            "nx": [nx for nx, _, _, _ in cells],
+            "ny": [ny for _, ny, _, _ in cells],
+            "lon": [round(lon, 4) for _, _, lon, _ in cells],
+            "lat": [round(lat, 4) for _, _, _, lat in cells],
+            "observedAt": observed,
+            "values": values,
+        }
+    )
+
+
 if __name__ == '__main__':
     result = kakao_service.convert_address_to_coordinate("두정역동 2길 31")
     print(result)
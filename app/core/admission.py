@@ -0,0 +1,160 @@
+# app/core/admission.py
+
+import asyncio
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
+
+from app.core.config import settings
+
+
+class LoadShedError(Exception):
+    """동시 처리 한도와 대기열이 모두 찬 요청을 거절할 때 발생합니다."""
+
+    def __init__(self, name: str, retry_after: float = 1.0):
+        super().__init__(f"{name} 요청이 많아 처리할 수 없습니다.")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class AdaptiveLimiter:
+    """업스트림 호출 지연 시간에 따라 라우터의 동시 처리 한도를 조절하는 AIMD 방식의 limiter
+
+    - 지연 시간은 요청 전체가 아니라 라우터가 의존하는 업스트림 호출마다 잽니다. (app/core/upstream.py의 _call)
+      요청 안의 run 대기열 대기나 run 폴링 간격은 과부하 신호가 아니기 때문입니다.
+    - 업스트림마다 최근 지연(EWMA)이 기준 지연보다 tolerance배 이상 길어지면 한도를 backoff배로 줄입니다.
+    - 한도를 거의 다 쓰면서 지연이 정상이면 한도를 1/limit씩 늘립니다.
+    - 한도를 넘은 요청은 max_queue개까지 queue_timeout초 동안 기다리고, 그 밖에는 즉시 거절합니다.
+    """
+
+    def __init__(self, name: str, dependencies: tuple[str, ...] = (), initial_limit: int = 16, min_limit: int = 2,
+                 max_limit: int = 128, max_queue: int = 32, queue_timeout: float = 2.0, tolerance: float = 2.0,
+                 backoff: float = 0.9):
+        self.name = name
+        self.dependencies = dependencies
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.tolerance = tolerance
+        self.backoff = backoff
+
+        self.in_flight = 0
+        self.shed_count = 0
+        # 업스트림별 [최근 지연, 기준 지연] (bulkhead 스레드에서 갱신하므로 lock 사용)
+        self._latency: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latency = {name: tuple(state) for name, state in self._latency.items()}
+        return {
+            "limit": int(self.limit),
+            "inFlight": self.in_flight,
+            "queueDepth": self.queue_depth,
+            "shedCount": self.shed_count,
+            "latency": {name: round(short, 4) for name, (short, _) in latency.items()},
+            "baselineLatency": {name: round(long, 4) for name, (_, long) in latency.items()},
+        }
+
+    @asynccontextmanager
+    async def slot(self):
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self):
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.shed_count += 1
+            raise LoadShedError(self.name, self.queue_timeout)
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # 자리를 넘겨받은 직후 시간이 초과된 경우 다음 대기자에게 넘깁니다.
+                self._wake_next()
+            else:
+                future.cancel()
+                self._waiters.remove(future)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self.shed_count += 1
+            raise LoadShedError(self.name, self.queue_timeout)
+
+    def release(self):
+        self._wake_next()
+
+    def _wake_next(self):
+        # 줄어든 한도만큼은 대기자를 깨우지 않고 자리를 반납합니다.
+        while self._waiters and self.in_flight <= int(self.limit):
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def observe(self, dependency: str, latency: float):
+        """업스트림 호출 한 번의 지연 시간을 반영해 한도를 조절합니다."""
+        with self._lock:
+            state = self._latency.get(dependency)
+            if state is None:
+                self._latency[dependency] = [latency, latency]
+                return
+            state[0] += (latency - state[0]) * 0.2
+            state[1] += (latency - state[1]) * 0.02
+
+            if state[0] > state[1] * self.tolerance:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+            elif self.in_flight >= self.limit * 0.8:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+
+# 라우터별로 지연 시간을 지켜볼 업스트림
+ROUTER_DEPENDENCIES = {
+    "chat": ("openai", "kakao", "kma", "backend"),
+    "weather": ("kakao", "kma"),
+}
+
+limiters = {
+    name: AdaptiveLimiter(
+        name,
+        dependencies,
+        initial_limit=settings.ADMISSION_INITIAL_LIMIT,
+        max_limit=settings.ADMISSION_MAX_LIMIT,
+        max_queue=settings.ADMISSION_MAX_QUEUE,
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    )
+    for name, dependencies in ROUTER_DEPENDENCIES.items()
+}
+
+
+def observe_upstream(upstream: str, latency: float):
+    """업스트림 호출 지연 시간을 그 업스트림에 의존하는 라우터의 limiter에 전달합니다."""
+    for limiter in limiters.values():
+        if upstream in limiter.dependencies:
+            limiter.observe(upstream, latency)
+
+
+def admit(name: str):
+    """라우터에 거는 admission 의존성을 만듭니다."""
+    limiter = limiters[name]
+
+    async def dependency():
+        async with limiter.slot():
+            yield
+
+    return dependency
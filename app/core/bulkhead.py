@@ -0,0 +1,99 @@
+# app/core/bulkhead.py
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+import anyio.to_thread
+
+from app.core.admission import LoadShedError
+from app.core.config import settings
+
+
+class BulkheadFull(LoadShedError):
+    """업스트림별 실행 풀과 대기열이 모두 찼을 때 발생합니다."""
+
+    def __init__(self, name: str):
+        super().__init__(f"{name} 연동", retry_after=1.0)
+
+
+class Bulkhead:
+    """업스트림 하나의 블로킹 호출만 실행하는 크기가 정해진 스레드 풀
+
+    - 실행 중 + 대기 중인 호출이 max_workers + max_queue개를 넘으면 즉시 BulkheadFull을 발생시킵니다.
+    - 느린 업스트림 하나가 다른 업스트림의 호출이나 서버 전체의 스레드를 잡아두지 못하게 합니다.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"bulkhead-{name}")
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.peak_pending = 0
+        self.rejected = 0
+        self.completed = 0
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """fn을 풀에 넣습니다. (호출한 스레드의 contextvars를 그대로 전달)"""
+        with self._lock:
+            if self.pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise BulkheadFull(self.name)
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+        context = contextvars.copy_context()
+        future = self._executor.submit(context.run, fn, *args, **kwargs)
+        future.add_done_callback(self._done)
+        return future
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """fn을 풀에서 실행하고 결과를 기다립니다."""
+        return self.submit(fn, *args, **kwargs).result()
+
+    def _done(self, future: Future):
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            pending = self.pending
+            return {
+                "workers": self.max_workers,
+                "maxQueue": self.max_queue,
+                "active": min(pending, self.max_workers),
+                "queued": max(0, pending - self.max_workers),
+                "peakPending": self.peak_pending,
+                "rejected": self.rejected,
+                "completed": self.completed,
+                "saturation": round(pending / (self.max_workers + self.max_queue), 3),
+            }
+
+
+bulkheads = {
+    "openai": Bulkhead("openai", settings.OPENAI_POOL_SIZE, settings.OPENAI_POOL_QUEUE),
+    "kakao": Bulkhead("kakao", settings.KAKAO_POOL_SIZE, settings.KAKAO_POOL_QUEUE),
+    "kma": Bulkhead("kma", settings.KMA_POOL_SIZE, settings.KMA_POOL_QUEUE),
+    "backend": Bulkhead("backend", settings.BACKEND_POOL_SIZE, settings.BACKEND_POOL_QUEUE),
+}
+
+
+# bulkhead와 run 대기 외의 동기 처리(라우트 함수, 파일 I/O 등)에 남겨 둘 요청 스레드 수 (anyio 기본 한도)
+SPARE_REQUEST_THREADS = 40
+
+
+def reserve_request_threads() -> int:
+    """요청 스레드 한도(anyio 기본 CapacityLimiter)를 bulkhead 크기에 맞춰 늘리고 그 값을 반환합니다.
+
+    - 요청 스레드는 bulkhead 결과를 기다리는 동안에도 limiter 토큰을 잡고 있습니다. 한 업스트림이 멈춰
+      풀과 대기열이 모두 차도 다른 업스트림을 쓰는 요청과 run을 기다리는 스레드가 토큰을 얻을 수 있어야 합니다.
+    - 이벤트 루프마다 limiter가 따로 있으므로 서버가 시작할 때(lifespan) 호출합니다.
+    """
+    required = sum(bulkhead.max_workers + bulkhead.max_queue for bulkhead in bulkheads.values())
+    required += settings.RUN_MAX_CONCURRENCY + SPARE_REQUEST_THREADS
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, required)
+    return limiter.total_tokens
@@ -12,5 +12,109 @@ class Settings(BaseSettings):
     KAKAO_LOCAL_API_KEY: str = os.getenv("KAKAO_LOCAL_API_KEY")
     WEATHER_API_KEY: str = os.getenv("WEATHER_API_KEY")
 
+    # 업스트림 주소 (부하 테스트에서는 benchmarks/fake_upstreams.py 주소로 바꿉니다.)
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+    KAKAO_LOCAL_API_URL: str = os.getenv("KAKAO_LOCAL_API_URL", "https://dapi.kakao.com/v2/local/search/address.json")
+    KMA_NOWCAST_URL: str = os.getenv(
+        "KMA_NOWCAST_URL", "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getUltraSrtNcst"
+    )
+    KMA_VILLAGE_FORECAST_URL: str = os.getenv(
+        "KMA_VILLAGE_FORECAST_URL", "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getVilageFcst"
+    )
+    KMA_ULTRA_FORECAST_URL: str = os.getenv(
+        "KMA_ULTRA_FORECAST_URL", "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getUltraSrtFcst"
+    )
+    BACKEND_BASE_URL: str = os.getenv("BACKEND_BASE_URL", "http://15.164.175.127:8080/api")
+
+    # 격자별 관측 기록 (격자마다 최근 몇 번의 관측을 보관할지, 최대 격자 수)
+    WEATHER_HISTORY_HOURS: int = int(os.getenv("WEATHER_HISTORY_HOURS", "168"))
+    WEATHER_HISTORY_MAX_CELLS: int = int(os.getenv("WEATHER_HISTORY_MAX_CELLS", "1000"))
+
+    # 지역(bbox) 날씨 조회 (최대 격자 수, 캐시에 없는 격자를 동시에 조회할 수)
+    WEATHER_REGION_MAX_CELLS: int = int(os.getenv("WEATHER_REGION_MAX_CELLS", "400"))
+    WEATHER_REGION_CONCURRENCY: int = int(os.getenv("WEATHER_REGION_CONCURRENCY", "4"))
+
+    # 회원 대시보드 (한 번에 조회할 최대 채팅방 수, 동시에 처리할 채팅방 수)
+    DASHBOARD_MAX_THREADS: int = int(os.getenv("DASHBOARD_MAX_THREADS", "50"))
+    DASHBOARD_CONCURRENCY: int = int(os.getenv("DASHBOARD_CONCURRENCY", "4"))
+
+    # 작물별 답변 캐시
+    ANSWER_CACHE_MAX_ENTRIES: int = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "1000"))
+    ANSWER_CACHE_TTL_SECONDS: int = int(os.getenv("ANSWER_CACHE_TTL_SECONDS", str(60 * 60 * 24)))
+    ANSWER_CACHE_SIMILARITY: float = float(os.getenv("ANSWER_CACHE_SIMILARITY", "0.8"))
+
+    # 워커끼리 공유하는 캐시 저장소 ("memory", "sqlite": 같은 노드, "redis": 여러 노드)
+    STORE_BACKEND: str = os.getenv("STORE_BACKEND", "memory")
+    STORE_MEMORY_MAX_ENTRIES: int = int(os.getenv("STORE_MEMORY_MAX_ENTRIES", "10000"))
+    STORE_SQLITE_PATH: str = os.getenv("STORE_SQLITE_PATH", "/tmp/farmmate-store.sqlite3")
+    STORE_REDIS_URL: str = os.getenv("STORE_REDIS_URL", "redis://localhost:6379/0")
+    GEOCODE_CACHE_TTL_SECONDS: int = int(os.getenv("GEOCODE_CACHE_TTL_SECONDS", str(60 * 60 * 24 * 7)))
+    NOWCAST_CACHE_TTL_SECONDS: int = int(os.getenv("NOWCAST_CACHE_TTL_SECONDS", "600"))
+    THREAD_CONTEXT_TTL_SECONDS: int = int(os.getenv("THREAD_CONTEXT_TTL_SECONDS", str(60 * 60 * 24 * 7)))
+
+    # run 컨텍스트 관리 (truncation: "last_messages" 또는 "auto")
+    RUN_TRUNCATION_STRATEGY: str = os.getenv("RUN_TRUNCATION_STRATEGY", "last_messages")
+    RUN_CONTEXT_LAST_MESSAGES: int = int(os.getenv("RUN_CONTEXT_LAST_MESSAGES", "10"))
+    SUMMARY_EVERY_TURNS: int = int(os.getenv("SUMMARY_EVERY_TURNS", "5"))
+    SUMMARY_MODEL: str = os.getenv("SUMMARY_MODEL", "gpt-4o-mini")
+
+    # 회원별 요청 제한 / run 대기열
+    RATE_LIMIT_REQUESTS_PER_MINUTE: int = int(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "30"))
+    RATE_LIMIT_TOKENS_PER_MINUTE: int = int(os.getenv("RATE_LIMIT_TOKENS_PER_MINUTE", "40000"))
+    RUN_ESTIMATED_CONTEXT_TOKENS: int = int(os.getenv("RUN_ESTIMATED_CONTEXT_TOKENS", "1500"))
+    RUN_MAX_CONCURRENCY: int = int(os.getenv("RUN_MAX_CONCURRENCY", "8"))
+    RUN_MAX_WAITING_PER_MEMBER: int = int(os.getenv("RUN_MAX_WAITING_PER_MEMBER", "5"))
+
+    # 전역 admission control (지연 시간 기반 동시 처리 한도)
+    ADMISSION_INITIAL_LIMIT: int = int(os.getenv("ADMISSION_INITIAL_LIMIT", "16"))
+    ADMISSION_MAX_LIMIT: int = int(os.getenv("ADMISSION_MAX_LIMIT", "128"))
+    ADMISSION_MAX_QUEUE: int = int(os.getenv("ADMISSION_MAX_QUEUE", "32"))
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "2"))
+
+    # 업스트림별 bulkhead (스레드 수 / 대기열 길이)
+    OPENAI_POOL_SIZE: int = int(os.getenv("OPENAI_POOL_SIZE", "16"))
+    OPENAI_POOL_QUEUE: int = int(os.getenv("OPENAI_POOL_QUEUE", "32"))
+    KAKAO_POOL_SIZE: int = int(os.getenv("KAKAO_POOL_SIZE", "8"))
+    KAKAO_POOL_QUEUE: int = int(os.getenv("KAKAO_POOL_QUEUE", "16"))
+    KMA_POOL_SIZE: int = int(os.getenv("KMA_POOL_SIZE", "8"))
+    KMA_POOL_QUEUE: int = int(os.getenv("KMA_POOL_QUEUE", "16"))
+    BACKEND_POOL_SIZE: int = int(os.getenv("BACKEND_POOL_SIZE", "8"))
+    BACKEND_POOL_QUEUE: int = int(os.getenv("BACKEND_POOL_QUEUE", "16"))
+
+    # 느린 응답 대비 hedged request (kakao, kma GET 요청)
+    HEDGE_UPSTREAMS: str = os.getenv("HEDGE_UPSTREAMS", "kakao,kma")
+    HEDGE_PERCENTILE: float = float(os.getenv("HEDGE_PERCENTILE", "95"))
+    HEDGE_MIN_DELAY_SECONDS: float = float(os.getenv("HEDGE_MIN_DELAY_SECONDS", "0.05"))
+    HEDGE_BUDGET_RATIO: float = float(os.getenv("HEDGE_BUDGET_RATIO", "0.1"))
+
+    # OpenTelemetry span 내보내기 (예: http://localhost:4318, 비어 있으면 사용하지 않음)
+    OTEL_EXPORTER_OTLP_ENDPOINT: str = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "")
+    OTEL_SERVICE_NAME: str = os.getenv("OTEL_SERVICE_NAME", "farmmate-ai-server")
+
+    # 이벤트 루프 지연 감시
+    LOOP_MONITOR_ENABLED: bool = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true"
+    LOOP_MONITOR_INTERVAL_SECONDS: float = float(os.getenv("LOOP_MONITOR_INTERVAL_SECONDS", "0.05"))
+    LOOP_BLOCK_THRESHOLD_SECONDS: float = float(os.getenv("LOOP_BLOCK_THRESHOLD_SECONDS", "0.1"))
+
+    # 요청별 프로파일링 / 프로세스 전체 표본 추출 세션 (토큰이 비어 있으면 사용하지 않음)
+    PROFILING_TOKEN: str = os.getenv("PROFILING_TOKEN", "")
+    PROFILE_DIR: str = os.getenv("PROFILE_DIR", "profiles")
+    PROFILE_SAMPLE_INTERVAL_SECONDS: float = float(os.getenv("PROFILE_SAMPLE_INTERVAL_SECONDS", "0.005"))
+    PROFILE_SESSION_MAX_SECONDS: float = float(os.getenv("PROFILE_SESSION_MAX_SECONDS", "120"))
+
+    # 운영 서버 실행 (app/server.py, WEB_CONCURRENCY가 0이면 CPU / 메모리 한도로 워커 수를 정함)
+    HOST: str = os.getenv("HOST", "0.0.0.0")
+    PORT: int = int(os.getenv("PORT", "8000"))
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "0"))
+    WORKER_MEMORY_MB: int = int(os.getenv("WORKER_MEMORY_MB", "256"))
+    SHUTDOWN_DRAIN_SECONDS: float = float(os.getenv("SHUTDOWN_DRAIN_SECONDS", "90"))
+
+    # 요청별 처리 시간 예산 (초)
+    DEADLINE_DEFAULT_SECONDS: float = float(os.getenv("DEADLINE_DEFAULT_SECONDS", "30"))
+    DEADLINE_CHAT_SECONDS: float = float(os.getenv("DEADLINE_CHAT_SECONDS", "90"))
+    DEADLINE_STATUS_SECONDS: float = float(os.getenv("DEADLINE_STATUS_SECONDS", "20"))
+    DEADLINE_WEATHER_SECONDS: float = float(os.getenv("DEADLINE_WEATHER_SECONDS", "10"))
+    DEADLINE_MAX_SECONDS: float = float(os.getenv("DEADLINE_MAX_SECONDS", "120"))
+
 
 settings = Settings()
@@ -0,0 +1,147 @@
+# app/core/deadline.py
+
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from app.core.config import settings
+
+# 클라이언트가 요청 처리 시간(초)을 직접 지정할 때 쓰는 헤더
+DEADLINE_HEADER = "x-request-timeout"
+
+
+class DeadlineExceeded(Exception):
+    """요청에 주어진 처리 시간을 모두 사용했을 때 발생합니다."""
+
+    def __init__(self, stage: str, deadline: "Deadline"):
+        super().__init__(f"{stage} 단계에서 처리 시간({deadline.budget:g}초)을 모두 사용했습니다.")
+        self.stage = stage
+        self.budget = deadline.budget
+        self.elapsed = deadline.elapsed()
+        self.stages = deadline.breakdown()
+
+    @property
+    def details(self) -> str:
+        spent = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in self.stages)
+        return f"경과 {self.elapsed:.2f}s / 예산 {self.budget:g}s" + (f" ({spent})" if spent else "")
+
+
+class Deadline:
+    """요청 하나의 처리 시간 예산과 단계별 사용 시간"""
+
+    def __init__(self, budget: float):
+        self.budget = budget
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + budget
+        self._lock = threading.Lock()
+        self._spent: dict[str, float] = {}
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def timeout_for(self, stage: str) -> float:
+        """stage에 줄 수 있는 남은 시간 (이미 다 썼으면 DeadlineExceeded)"""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(stage, self)
+        return remaining
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self._spent[stage] = self._spent.get(stage, 0.0) + seconds
+
+    def breakdown(self) -> list[tuple[str, float]]:
+        """사용 시간이 긴 단계 순서"""
+        with self._lock:
+            return sorted(self._spent.items(), key=lambda item: item[1], reverse=True)
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+
+def timeout_for(stage: str, default: Optional[float] = None) -> Optional[float]:
+    """현재 요청의 남은 시간을 stage의 timeout으로 반환합니다. (deadline이 없으면 default)"""
+    deadline = _current.get()
+    if deadline is None:
+        return default
+    return deadline.timeout_for(stage)
+
+
+@contextmanager
+def stage(name: str):
+    """stage에 쓴 시간을 현재 deadline에 기록합니다."""
+    deadline = _current.get()
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        if deadline is not None:
+            deadline.record(name, time.monotonic() - started)
+
+
+@contextmanager
+def use_deadline(deadline: Optional[Deadline]):
+    """블록 안의 호출에 deadline을 적용합니다."""
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def without_deadline():
+    """정리 작업(run 취소 등)처럼 예산이 끝난 뒤에도 실행해야 하는 호출에 사용합니다."""
+    with use_deadline(None):
+        yield
+
+
+# (메서드, 경로 패턴, 예산) - 위에서부터 처음 일치하는 규칙을 사용합니다.
+ROUTE_BUDGETS = (
+    ("GET", re.compile(r"^/members/[^/]+/threads/([^/]+/)?status$"), settings.DEADLINE_STATUS_SECONDS),
+    ("POST", re.compile(r"^/members/[^/]+/threads/[^/]+$"), settings.DEADLINE_CHAT_SECONDS),
+    (None, re.compile(r"^/weather"), settings.DEADLINE_WEATHER_SECONDS),
+)
+
+
+def route_budget(method: str, path: str) -> float:
+    for rule_method, pattern, budget in ROUTE_BUDGETS:
+        if (rule_method is None or rule_method == method) and pattern.match(path):
+            return budget
+    return settings.DEADLINE_DEFAULT_SECONDS
+
+
+class DeadlineMiddleware:
+    """요청마다 deadline을 만들어 업스트림 호출까지 전달하는 ASGI 미들웨어
+
+    - 예산은 경로별 설정을 따르고, X-Request-Timeout 헤더(초)로 DEADLINE_MAX_SECONDS까지 바꿀 수 있습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        budget = route_budget(scope["method"], scope["path"])
+        for name, value in scope["headers"]:
+            if name.decode("latin-1") == DEADLINE_HEADER:
+                try:
+                    budget = min(max(float(value), 0.1), settings.DEADLINE_MAX_SECONDS)
+                except ValueError:
+                    pass
+                break
+
+        with use_deadline(Deadline(budget)):
+            await self.app(scope, receive, send)
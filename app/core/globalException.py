@@ -7,13 +7,18 @@ from starlette.status import (
     HTTP_404_NOT_FOUND,
     HTTP_408_REQUEST_TIMEOUT,
     HTTP_422_UNPROCESSABLE_ENTITY,
+    HTTP_429_TOO_MANY_REQUESTS,
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_502_BAD_GATEWAY,
+    HTTP_503_SERVICE_UNAVAILABLE,
     HTTP_504_GATEWAY_TIMEOUT, HTTP_204_NO_CONTENT
 )
 import openai
 from requests.exceptions import RequestException, Timeout
 
+from app.core.admission import LoadShedError
+from app.core.deadline import DeadlineExceeded
+from app.core.ratelimit import RateLimitExceeded
 from app.models.error import ErrorDetail
 from app.utils.response import create_response
 
@@ -27,7 +32,9 @@ def get_status_message(status_code: int) -> str:
         HTTP_403_FORBIDDEN: "권한이 없습니다.",
         HTTP_404_NOT_FOUND: "리소스를 찾을 수 없습니다.",
         HTTP_422_UNPROCESSABLE_ENTITY: "입력값 검증에 실패했습니다.",
+        HTTP_429_TOO_MANY_REQUESTS: "요청이 너무 많습니다.",
         HTTP_500_INTERNAL_SERVER_ERROR: "서버 내부 오류가 발생했습니다.",
+        HTTP_503_SERVICE_UNAVAILABLE: "서버가 일시적으로 요청을 처리할 수 없습니다.",
     }.get(status_code, "요청을 처리할 수 없습니다.")
 
 
@@ -40,7 +47,9 @@ def get_error_code(status_code: int) -> str:
         HTTP_403_FORBIDDEN: "FORBIDDEN",
         HTTP_404_NOT_FOUND: "NOT_FOUND",
         HTTP_422_UNPROCESSABLE_ENTITY: "VALIDATION_ERROR",
+        HTTP_429_TOO_MANY_REQUESTS: "RATE_LIMITED",
         HTTP_500_INTERNAL_SERVER_ERROR: "INTERNAL_SERVER_ERROR",
+        HTTP_503_SERVICE_UNAVAILABLE: "SERVICE_UNAVAILABLE",
     }.get(status_code, "HTTP_ERROR")
 
 
@@ -93,6 +102,53 @@ def add_exception_handlers(app: FastAPI):
             ).to_dict()
         )
 
+    @app.exception_handler(RateLimitExceeded)
+    async def rate_limit_exception_handler(request: Request, exc: RateLimitExceeded):
+        return create_response(
+            status_code=HTTP_429_TOO_MANY_REQUESTS,
+            message=get_status_message(HTTP_429_TOO_MANY_REQUESTS),
+            error=ErrorDetail(
+                code="RATE_LIMITED",
+                message=exc.message,
+                details=f"{exc.retry_after_header}초 후에 다시 시도해주세요."
+            ).to_dict(),
+            headers={"Retry-After": exc.retry_after_header}
+        )
+
+    @app.exception_handler(LoadShedError)
+    async def load_shed_exception_handler(request: Request, exc: LoadShedError):
+        return create_response(
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            message=get_status_message(HTTP_503_SERVICE_UNAVAILABLE),
+            error=ErrorDetail(
+                code="OVERLOADED",
+                message="요청이 많아 잠시 처리할 수 없습니다.",
+                details=str(exc)
+            ).to_dict(),
+            headers={"Retry-After": str(max(1, round(exc.retry_after)))}
+        )
+
+    @app.exception_handler(DeadlineExceeded)
+    async def deadline_exception_handler(request: Request, exc: DeadlineExceeded):
+        return create_response(
+            status_code=HTTP_504_GATEWAY_TIMEOUT,
+            message="요청 처리 시간 초과",
+            error=ErrorDetail(
+                code="DEADLINE_EXCEEDED",
+                message=str(exc),
+                details=exc.details
+            ).to_dict()
+        )
+
+    @app.exception_handler(openai.APIConnectionError)
+    async def openai_connection_exception_handler(request: Request, exc: openai.APIConnectionError):
+        # bulkhead 거절이나 deadline 초과도 OpenAI SDK에서는 연결 오류로 감싸져 올라옵니다.
+        if isinstance(exc.__cause__, DeadlineExceeded):
+            return await deadline_exception_handler(request, exc.__cause__)
+        if isinstance(exc.__cause__, LoadShedError):
+            return await load_shed_exception_handler(request, exc.__cause__)
+        return await openai_exception_handler(request, exc)
+
     @app.exception_handler(Timeout)
     async def timeout_exception_handler(request: Request, exc: Timeout):
         return create_response(
@@ -131,12 +187,17 @@ def add_exception_handlers(app: FastAPI):
 
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
-        return create_response(
-            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
-            message="서버 내부 오류",
-            error=ErrorDetail(
-                code="INTERNAL_SERVER_ERROR",
-                message="예기치 않은 오류가 발생했습니다.",
-                details=str(exc)
-            ).to_dict()
-        )
+        return internal_error_response(exc)
+
+
+def internal_error_response(exc: Exception):
+    """처리되지 않은 예외의 500 응답 (TracingMiddleware도 요청 ID를 붙이기 위해 사용합니다)"""
+    return create_response(
+        status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+        message="서버 내부 오류",
+        error=ErrorDetail(
+            code="INTERNAL_SERVER_ERROR",
+            message="예기치 않은 오류가 발생했습니다.",
+            details=str(exc)
+        ).to_dict()
+    )
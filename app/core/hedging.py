@@ -0,0 +1,147 @@
+# app/core/hedging.py
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, TimeoutError as FutureTimeoutError, wait
+from typing import Any, Callable, Optional
+
+from app.core.bulkhead import Bulkhead, BulkheadFull
+from app.core.config import settings
+
+
+def _close_response(future: Future):
+    """늦게 끝난 쪽 응답의 연결을 반납합니다."""
+    if not future.cancelled() and future.exception() is None:
+        close = getattr(future.result(), "close", None)
+        if close is not None:
+            close()
+
+
+class Hedger:
+    """느린 응답을 기다리는 대신 같은 요청을 한 번 더 보내는 hedged request 정책
+
+    - 첫 요청이 최근 지연 시간의 percentile 안에 끝나지 않으면 두 번째 요청을 보내고 먼저 끝난 응답을 사용합니다.
+    - 두 번째 요청은 전체 요청의 budget_ratio 비율까지만 보내 업스트림 부하가 두 배가 되지 않게 합니다.
+    - 지연 시간 표본이 min_samples개 모이기 전에는 hedge하지 않습니다.
+    """
+
+    def __init__(self, name: str, percentile: float = 95, min_delay: float = 0.05, budget_ratio: float = 0.1,
+                 max_burst: float = 10, window: int = 200, min_samples: int = 20):
+        self.name = name
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.budget_ratio = budget_ratio
+        self.max_burst = max_burst
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._credit = 0.0
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.over_budget = 0
+
+    def observe(self, latency: float):
+        with self._lock:
+            self._latencies.append(latency)
+
+    def delay(self) -> Optional[float]:
+        """두 번째 요청을 보내기 전에 기다릴 시간 (표본이 부족하면 None)"""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self._credit >= 1:
+                self._credit -= 1
+                self.hedged += 1
+                return True
+            self.over_budget += 1
+            return False
+
+    def _timed(self, fn: Callable[..., Any], *args, **kwargs):
+        started = time.monotonic()
+        result = fn(*args, **kwargs)
+        self.observe(time.monotonic() - started)
+        return result
+
+    def call(self, bulkhead: Bulkhead, wait_seconds: Optional[float], fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """bulkhead에서 fn을 실행하고, 느리면 한 번 더 실행해 먼저 끝난 결과를 반환합니다.
+
+        - wait_seconds 안에 어느 쪽도 끝나지 않으면 concurrent.futures.TimeoutError
+        """
+        started = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            self._credit = min(self.max_burst, self._credit + self.budget_ratio)
+
+        delay = self.delay()
+        primary = bulkhead.submit(self._timed, fn, *args, **kwargs)
+        if delay is None or (wait_seconds is not None and wait_seconds <= delay):
+            return primary.result(wait_seconds)
+
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._take_budget():
+            return primary.result(self._remaining(started, wait_seconds))
+        try:
+            # 풀이 가득 찼으면 대기열을 더 늘리지 않고 첫 요청만 기다립니다.
+            hedge = bulkhead.submit(self._timed, fn, *args, **kwargs)
+        except BulkheadFull:
+            return primary.result(self._remaining(started, wait_seconds))
+
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, timeout=self._remaining(started, wait_seconds), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    for loser in pending:
+                        loser.add_done_callback(_close_response)
+                    return future.result()
+                error = future.exception()
+        if pending:
+            for loser in pending:
+                loser.add_done_callback(_close_response)
+            raise FutureTimeoutError()
+        raise error
+
+    @staticmethod
+    def _remaining(started: float, wait_seconds: Optional[float]) -> Optional[float]:
+        if wait_seconds is None:
+            return None
+        return max(0.0, wait_seconds - (time.monotonic() - started))
+
+    def snapshot(self) -> dict:
+        delay = self.delay()
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "hedgeWins": self.hedge_wins,
+                "overBudget": self.over_budget,
+                "samples": len(self._latencies),
+                "delay": None if delay is None else round(delay, 4),
+            }
+
+
+# HEDGE_UPSTREAMS에 적힌 업스트림의 GET 요청만 hedge합니다. (빈 값이면 사용하지 않음)
+hedgers = {
+    name: Hedger(
+        name,
+        percentile=settings.HEDGE_PERCENTILE,
+        min_delay=settings.HEDGE_MIN_DELAY_SECONDS,
+        budget_ratio=settings.HEDGE_BUDGET_RATIO,
+    )
+    for name in filter(None, (name.strip() for name in settings.HEDGE_UPSTREAMS.split(",")))
+}
@@ -0,0 +1,164 @@
+# app/core/loopmonitor.py
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.core.config import settings
+from app.core.metrics import loop_blocked, loop_lag
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BlockSample:
+    """이벤트 루프가 멈춘 한 번의 기록"""
+    lag: float
+    stack: Optional[str] = None
+    at: float = field(default_factory=time.time)
+
+
+class LoopBlockedError(AssertionError):
+    """테스트 중 핸들러가 이벤트 루프를 막았을 때 발생합니다."""
+
+    def __init__(self, sample: BlockSample):
+        message = f"이벤트 루프가 {sample.lag * 1000:.0f}ms 동안 멈췄습니다."
+        if sample.stack:
+            message += f"\n{sample.stack}"
+        super().__init__(message)
+        self.sample = sample
+
+
+class LoopMonitor:
+    """이벤트 루프 지연(lag)을 계속 측정하고, 오래 멈추면 멈춘 위치의 스택을 기록합니다.
+
+    - 루프 안의 작업은 interval마다 깨어나 예정보다 늦게 깨어난 시간을 lag로 기록합니다.
+    - 별도 감시 스레드가 루프가 threshold 넘게 깨어나지 않는 것을 보면, 그 순간의 루프 스레드 스택을 저장합니다.
+      (막고 있는 코드가 끝나기 전에 찍어야 원인이 보입니다.)
+    """
+
+    def __init__(self, interval: float = 0.05, threshold: float = 0.1, window: int = 1200,
+                 max_samples: int = 20, export_metrics: bool = False):
+        self.interval = interval
+        self.threshold = threshold
+        self.export_metrics = export_metrics
+        self.blocks: deque[BlockSample] = deque(maxlen=max_samples)
+        self.blocked_count = 0
+        self._lags: deque[float] = deque(maxlen=window)
+        self._heartbeat = 0.0
+        self._stack: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self):
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._tick())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._watchdog.start()
+        # 첫 측정 주기가 시작된 뒤에 돌아갑니다.
+        await asyncio.sleep(0)
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._watchdog.join()
+
+    async def _tick(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            self._record(max(0.0, now - expected))
+
+    def _record(self, lag: float):
+        self._lags.append(lag)
+        if self.export_metrics:
+            loop_lag.observe(value=lag)
+        if lag < self.threshold:
+            self._stack = None
+            return
+
+        sample = BlockSample(lag=lag, stack=self._stack)
+        self._stack = None
+        self.blocks.append(sample)
+        self.blocked_count += 1
+        if self.export_metrics:
+            loop_blocked.inc()
+        logger.warning("이벤트 루프가 %.0fms 동안 멈췄습니다.\n%s", lag * 1000, sample.stack or "(스택을 찍기 전에 풀림)")
+
+    def _watch(self):
+        reported = None
+        while not self._stop.wait(min(self.interval, self.threshold / 2)):
+            heartbeat = self._heartbeat
+            if heartbeat == reported or time.monotonic() - heartbeat - self.interval < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._stack = "".join(traceback.format_stack(frame))
+            reported = heartbeat
+
+    def percentiles(self) -> dict[str, float]:
+        lags = sorted(self._lags)
+        if not lags:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        pick = lambda q: lags[min(len(lags) - 1, int(len(lags) * q))]
+        return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": lags[-1]}
+
+    def snapshot(self) -> dict:
+        return {
+            "running": self.running,
+            "thresholdMs": self.threshold * 1000,
+            "lagMs": {name: round(value * 1000, 2) for name, value in self.percentiles().items()},
+            "blockedCount": self.blocked_count,
+            "recentBlocks": [
+                {"lagMs": round(sample.lag * 1000, 1), "at": sample.at, "stack": sample.stack}
+                for sample in self.blocks
+            ],
+        }
+
+
+@asynccontextmanager
+async def detect_blocking(threshold: float = 0.05, interval: float = 0.01):
+    """테스트용: 블록 안에서 이벤트 루프가 threshold 넘게 멈추면 LoopBlockedError를 발생시킵니다."""
+    monitor = LoopMonitor(interval=interval, threshold=threshold)
+    await monitor.start()
+    try:
+        yield monitor
+        # 마지막으로 막힌 구간도 측정되도록 한 번 더 깨어날 때까지 기다립니다.
+        await asyncio.sleep(interval * 2)
+    finally:
+        await monitor.stop()
+    if monitor.blocks:
+        raise LoopBlockedError(monitor.blocks[0])
+
+
+loop_monitor = LoopMonitor(
+    interval=settings.LOOP_MONITOR_INTERVAL_SECONDS,
+    threshold=settings.LOOP_BLOCK_THRESHOLD_SECONDS,
+    export_metrics=True,
+)
@@ -0,0 +1,212 @@
+# app/core/metrics.py
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+from starlette.routing import Match
+
+# 업스트림 호출 / run 대기 시간용 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, description: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], object] = {}
+
+    def _key(self, labels: tuple) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name}: label {self.labelnames}가 필요합니다.")
+        return tuple(str(label) for label in labels)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """단조 증가하는 횟수"""
+    kind = "counter"
+
+    def inc(self, *labels, amount: float = 1):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self.header() + [f"{self.name}{_labels(self.labelnames, key)} {_format(value)}" for key, value in items]
+
+
+class Gauge(Counter):
+    """올라가고 내려가는 현재 값"""
+    kind = "gauge"
+
+    def dec(self, *labels, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels, value: float):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """버킷별 관측 횟수와 합계 (Prometheus histogram)"""
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, labelnames: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, description, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, *labels, value: float):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [버킷별 횟수..., +Inf 횟수], 합계
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def count(self, *labels) -> int:
+        state = self._values.get(self._key(labels))
+        return sum(state[0]) if state else 0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = [(key, list(counts), total) for key, (counts, total) in self._values.items()]
+        lines = self.header()
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="%s"' % _format(bound)
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_format(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """메트릭 목록과 scrape 시점에 값을 읽는 collector 목록"""
+
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+        self._collectors: list[Callable[[], Iterable[_Metric]]] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, fn: Callable[[], Iterable[_Metric]]):
+        """/metrics 요청 때만 계산하는 gauge / counter를 등록하는 데코레이터"""
+        self._collectors.append(fn)
+        return fn
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collect in self._collectors:
+            for metric in collect():
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+upstream_latency = registry.register(Histogram(
+    "upstream_request_duration_seconds", "업스트림 호출 시간", ("upstream", "operation")))
+upstream_errors = registry.register(Counter(
+    "upstream_request_errors_total", "업스트림 호출 실패 횟수 (5xx 응답 또는 예외)", ("upstream", "operation", "reason")))
+run_polls = registry.register(Counter(
+    "assistant_run_polls_total", "run 상태 조회 횟수"))
+run_duration = registry.register(Histogram(
+    "assistant_run_duration_seconds", "run 생성부터 종료까지 걸린 시간", ("status",)))
+cache_lookups = registry.register(Counter(
+    "cache_lookups_total", "캐시 조회 횟수", ("cache", "result")))
+http_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "처리 중인 요청 수", ("method", "route")))
+http_latency = registry.register(Histogram(
+    "http_request_duration_seconds", "요청 처리 시간", ("method", "route", "status")))
+loop_lag = registry.register(Histogram(
+    "event_loop_lag_seconds", "이벤트 루프가 예정보다 늦게 깨어난 시간", (),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)))
+loop_blocked = registry.register(Counter(
+    "event_loop_blocked_total", "이벤트 루프가 기준 시간 넘게 멈춘 횟수"))
+
+
+def record_upstream(upstream: str, operation: str, seconds: float, status_code: int = None, error: BaseException = None):
+    upstream_latency.observe(upstream, operation, value=seconds)
+    if error is not None:
+        upstream_errors.inc(upstream, operation, type(error).__name__)
+    elif status_code is not None and status_code >= 500:
+        upstream_errors.inc(upstream, operation, str(status_code))
+
+
+def route_template(scope) -> str:
+    """/members/1/threads/thread_abc 같은 경로를 등록된 라우트 경로로 바꿉니다. (label 수 제한)"""
+    app = scope.get("app")
+    for route in getattr(app, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """라우트별 처리 중인 요청 수와 처리 시간을 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        route = route_template(scope)
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        http_in_flight.inc(method, route)
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_in_flight.dec(method, route)
+            http_latency.observe(method, route, str(status["code"]), value=time.monotonic() - started)
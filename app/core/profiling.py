@@ -0,0 +1,236 @@
+# app/core/profiling.py
+
+import asyncio
+import cProfile
+import hmac
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from app.core.config import settings
+from app.core.tracing import current_request_id
+
+PROFILE_TOKEN_HEADER = "x-profile-token"
+PROFILE_MODE_HEADER = "x-profile-mode"
+
+# 이 파일에서 멈춰 있는 스레드는 일이 없어 기다리는 중이므로 세지 않습니다.
+_IDLE_FILES = ("threading.py", "selectors.py", "queue.py", "concurrent/futures/thread.py")
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _is_idle(frame) -> bool:
+    return frame.f_code.co_filename.replace("\\", "/").endswith(_IDLE_FILES)
+
+
+class StackSampler:
+    """interval마다 모든 스레드의 스택을 찍어 같은 스택끼리 세고, folded 형식(flamegraph.pl / speedscope)으로 저장합니다.
+
+    - 동기 처리기와 업스트림 호출은 스레드 풀에서 실행되므로 이벤트 루프 스레드만이 아니라 프로세스 전체를 찍습니다.
+    - max_seconds가 지나면 스스로 멈추고, path가 있으면 멈출 때 파일로 저장합니다.
+    - 표본 추출 스레드가 stacks를 고치는 동안 다른 스레드가 읽지 않도록 counts()로 lock을 잡고 복사해서 읽습니다.
+    """
+
+    def __init__(self, interval: float = 0.005, max_seconds: Optional[float] = None, path: Optional[str] = None):
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.path = path
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "StackSampler":
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "StackSampler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self
+
+    def _run(self):
+        own = threading.get_ident()
+        ends_at = None if self.max_seconds is None else time.monotonic() + self.max_seconds
+        while True:
+            self.sample(skip=own)
+            if self._stop.wait(self.interval) or (ends_at is not None and time.monotonic() >= ends_at):
+                break
+        self.finished_at = time.time()
+        if self.path is not None:
+            self.write(self.path)
+
+    def sample(self, skip: Optional[int] = None):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            if ident == skip or _is_idle(frame):
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            stack.append(names.get(ident, str(ident)))
+            stacks.append(";".join(reversed(stack)))
+        with self._lock:
+            self.stacks.update(stacks)
+            self.samples += 1
+
+    def counts(self) -> Counter[str]:
+        """지금까지 모은 스택별 표본 수의 복사본"""
+        with self._lock:
+            return self.stacks.copy()
+
+    def top(self, limit: int = 10) -> list[dict]:
+        """가장 많이 찍힌 맨 안쪽 함수 (self time 순)"""
+        own: Counter[str] = Counter()
+        for stack, count in self.counts().items():
+            own[stack.rsplit(";", 1)[-1]] += count
+        return [{"frame": frame, "samples": count} for frame, count in own.most_common(limit)]
+
+    def write(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.counts().most_common():
+                f.write(f"{stack} {count}\n")
+
+    def snapshot(self) -> dict:
+        return {
+            "running": self.running,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+            "intervalMs": self.interval * 1000,
+            "samples": self.samples,
+            "file": self.path,
+            "top": self.top(),
+        }
+
+
+def profile_path(name: str, extension: str, directory: Optional[str] = None) -> str:
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_")[:60] or "root"
+    return os.path.join(directory or settings.PROFILE_DIR, f"{timestamp}-{slug}.{extension}")
+
+
+def require_profiling_token(x_profile_token: Optional[str] = Header(None)):
+    """프로파일링 관리 엔드포인트는 PROFILING_TOKEN을 아는 관리자만 사용할 수 있습니다."""
+    token = settings.PROFILING_TOKEN
+    if not token or x_profile_token is None or not hmac.compare_digest(x_profile_token, token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="프로파일링 권한이 없습니다.")
+
+
+# 프로세스 전체 표본 추출 세션 (한 번에 하나)
+_session: Optional[StackSampler] = None
+_session_lock = threading.Lock()
+
+
+def current_session() -> Optional[StackSampler]:
+    return _session
+
+
+def start_session(seconds: float) -> StackSampler:
+    """seconds(최대 PROFILE_SESSION_MAX_SECONDS) 동안 표본을 모으고 끝나면 PROFILE_DIR에 저장합니다."""
+    global _session
+    with _session_lock:
+        if _session is not None and _session.running:
+            raise RuntimeError("이미 진행 중인 프로파일링 세션이 있습니다.")
+        _session = StackSampler(
+            interval=settings.PROFILE_SAMPLE_INTERVAL_SECONDS,
+            max_seconds=min(seconds, settings.PROFILE_SESSION_MAX_SECONDS),
+            path=profile_path("session", "folded"),
+        ).start()
+        return _session
+
+
+def stop_session() -> Optional[StackSampler]:
+    """진행 중인 세션을 일찍 끝냅니다. (이미 끝났으면 마지막 세션을 그대로 반환)"""
+    with _session_lock:
+        return _session.stop() if _session is not None else None
+
+
+class ProfilingMiddleware:
+    """관리자 토큰이 붙은 요청 하나를 프로파일러 아래에서 실행하고 결과를 PROFILE_DIR에 저장하는 ASGI 미들웨어
+
+    - `x-profile-token: <토큰>` 헤더로만 켭니다. (URL에 넣은 토큰은 접근 로그나 프록시에 남기 때문입니다.)
+    - 기본은 요청 동안 프로세스 전체의 스택 표본(.folded)이고, `x-profile-mode: cprofile`이면
+      이벤트 루프 스레드를 cProfile로 측정합니다. (.prof, async 처리기용, 같은 시간에 루프에서 돈 다른 요청도 함께 잡힘)
+    - 한 번에 한 요청만 프로파일링하고, 다른 요청을 프로파일링하는 중에는 그냥 실행합니다.
+    - 파일 이름에 요청 ID가 들어가도록 TracingMiddleware 안쪽에 둡니다.
+    - PROFILING_TOKEN이 비어 있으면 main.py에서 추가하지 않으므로 끄면 비용이 없습니다.
+    """
+
+    def __init__(self, app, token: Optional[str] = None, directory: Optional[str] = None,
+                 interval: Optional[float] = None):
+        self.app = app
+        self.token = (token or settings.PROFILING_TOKEN).encode("latin-1")
+        self.directory = directory
+        self.interval = interval or settings.PROFILE_SAMPLE_INTERVAL_SECONDS
+        self._busy = False
+
+    def _requested(self, scope) -> Optional[str]:
+        """프로파일링 방식 (토큰이 없거나 틀리면 None)"""
+        token, mode = None, "sample"
+        for name, value in scope["headers"]:
+            if name == b"x-profile-token":
+                token = value
+            elif name == b"x-profile-mode" and value == b"cprofile":
+                mode = "cprofile"
+
+        if token is None or not hmac.compare_digest(token, self.token):
+            return None
+        return mode
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        mode = self._requested(scope)
+        if mode is None or self._busy:
+            return await self.app(scope, receive, send)
+
+        name = f"{scope['method']} {scope['path']} {current_request_id() or ''}"
+        path = profile_path(name, "prof" if mode == "cprofile" else "folded", self.directory)
+
+        async def send_with_header(message):
+            if message["type"] == "http.response.start":
+                headers = [*message.get("headers", []), (b"x-profile-file", os.path.basename(path).encode("latin-1"))]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        self._busy = True
+        try:
+            if mode == "cprofile":
+                profiler = cProfile.Profile()
+                profiler.enable()
+                try:
+                    await self.app(scope, receive, send_with_header)
+                finally:
+                    profiler.disable()
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    profiler.dump_stats(path)
+            else:
+                sampler = StackSampler(interval=self.interval, path=path).start()
+                try:
+                    await self.app(scope, receive, send_with_header)
+                finally:
+                    # 마지막 표본과 파일 저장을 기다리는 동안 루프를 막지 않습니다.
+                    await asyncio.to_thread(sampler.stop)
+        finally:
+            self._busy = False
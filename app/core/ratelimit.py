@@ -0,0 +1,196 @@
+# app/core/ratelimit.py
+
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import Request
+
+from app.core.config import settings
+
+
+class RateLimitExceeded(Exception):
+    """요청 한도를 넘었을 때 발생합니다. retry_after 초 뒤에 다시 시도할 수 있습니다."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class TokenBucket:
+    """capacity 만큼 쌓이고 초당 rate 만큼 다시 채워지는 토큰 버킷"""
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_acquire(self, amount: float = 1) -> float:
+        """토큰을 가져갑니다. 성공하면 0, 부족하면 다시 시도할 수 있을 때까지 남은 초를 반환합니다."""
+        now = time.monotonic()
+        self._refill(now)
+        # 한 번에 capacity보다 큰 요청은 버킷이 가득 찼을 때 허용합니다.
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def adjust(self, amount: float):
+        """추정치와 실제 사용량의 차이를 반영합니다. (음수 잔량 허용)"""
+        self._refill(time.monotonic())
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class MemberRateLimiter:
+    """memberId별 요청 수 / 추정 토큰 수 제한"""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, max_members: int = 10000):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_members = max_members
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict[str, tuple[TokenBucket, TokenBucket]] = OrderedDict()
+
+    def _get(self, member_id: str) -> tuple[TokenBucket, TokenBucket]:
+        buckets = self._buckets.get(member_id)
+        if buckets is None:
+            buckets = (
+                TokenBucket(self.requests_per_minute, self.requests_per_minute / 60),
+                TokenBucket(self.tokens_per_minute, self.tokens_per_minute / 60),
+            )
+            self._buckets[member_id] = buckets
+            # 오래 요청이 없던 회원의 버킷은 가득 찬 상태와 같으므로 버려도 됩니다.
+            while len(self._buckets) > self.max_members:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(member_id)
+        return buckets
+
+    def check_request(self, member_id: str):
+        with self._lock:
+            retry_after = self._get(member_id)[0].try_acquire(1)
+        if retry_after:
+            raise RateLimitExceeded("요청이 너무 많습니다.", retry_after)
+
+    def check_tokens(self, member_id: str, estimated_tokens: int):
+        with self._lock:
+            retry_after = self._get(member_id)[1].try_acquire(estimated_tokens)
+        if retry_after:
+            raise RateLimitExceeded("AI 사용량 한도를 초과했습니다.", retry_after)
+
+    def settle_tokens(self, member_id: str, estimated_tokens: int, actual_tokens: Optional[int]):
+        """run이 끝난 뒤 실제 토큰 사용량으로 보정합니다."""
+        if actual_tokens is None:
+            return
+        with self._lock:
+            self._get(member_id)[1].adjust(actual_tokens - estimated_tokens)
+
+
+class FairQueue:
+    """회원별 대기열을 번갈아 처리하는 run 생성 대기열
+
+    - 동시에 실행할 수 있는 run은 max_active개이며, 자리가 나면 대기 중인 회원을 순서대로 돌아가며 깨웁니다.
+    - 한 회원이 max_waiting개 넘게 기다리면 RateLimitExceeded를 발생시킵니다.
+    """
+
+    def __init__(self, max_active: int, max_waiting: int = 5, expected_seconds: float = 10.0):
+        self.max_active = max_active
+        self.max_waiting = max_waiting
+        self.expected_seconds = expected_seconds
+        self.active = 0
+        self._waiters: dict[str, deque[asyncio.Future]] = {}
+        self._turns: deque[str] = deque()
+
+    def waiting(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    @asynccontextmanager
+    async def slot(self, member_id: str, timeout: Optional[float] = None):
+        """run 하나를 실행할 자리를 기다립니다. timeout초 안에 자리가 나지 않으면 asyncio.TimeoutError"""
+        await self._acquire(member_id, timeout)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, member_id: str, timeout: Optional[float] = None):
+        if self.active < self.max_active and not self._turns:
+            self.active += 1
+            return
+
+        waiters = self._waiters.setdefault(member_id, deque())
+        if len(waiters) >= self.max_waiting:
+            rounds = len(waiters) * max(1, len(self._turns)) / self.max_active
+            raise RateLimitExceeded("대기 중인 요청이 너무 많습니다.", rounds * self.expected_seconds)
+
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        if member_id not in self._turns:
+            self._turns.append(member_id)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            if future.done() and not future.cancelled():
+                # 자리를 넘겨받은 직후 취소된 경우 다음 대기자에게 넘깁니다.
+                self._release()
+            else:
+                future.cancel()
+                self._discard(member_id, future)
+            raise
+
+    def _discard(self, member_id: str, future: asyncio.Future):
+        waiters = self._waiters.get(member_id)
+        if waiters and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._waiters[member_id]
+                self._turns.remove(member_id)
+
+    def _release(self):
+        while self._turns:
+            member_id = self._turns.popleft()
+            waiters = self._waiters[member_id]
+            future = waiters.popleft()
+            if waiters:
+                self._turns.append(member_id)
+            else:
+                del self._waiters[member_id]
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+
+def estimate_tokens(text: str) -> int:
+    """메시지와 run마다 함께 전달되는 컨텍스트의 토큰 수를 대략 추정합니다."""
+    return len(text.encode("utf-8")) // 3 + settings.RUN_ESTIMATED_CONTEXT_TOKENS
+
+
+member_rate_limiter = MemberRateLimiter(
+    requests_per_minute=settings.RATE_LIMIT_REQUESTS_PER_MINUTE,
+    tokens_per_minute=settings.RATE_LIMIT_TOKENS_PER_MINUTE,
+)
+
+run_queue = FairQueue(max_active=settings.RUN_MAX_CONCURRENCY, max_waiting=settings.RUN_MAX_WAITING_PER_MEMBER)
+
+
+async def limit_member_requests(request: Request):
+    """라우터 prefix의 memberId 기준으로 요청 수를 제한하는 의존성"""
+    member_id = request.path_params.get("memberId")
+    if member_id:
+        member_rate_limiter.check_request(member_id)
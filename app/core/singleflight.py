@@ -0,0 +1,80 @@
+# app/core/singleflight.py
+
+import threading
+from typing import Any, Callable, Hashable
+
+from app.core.deadline import DeadlineExceeded, current_deadline, stage, timeout_for
+
+# 다른 호출자의 결과를 기다린 시간을 기록할 deadline 단계 이름
+WAIT_STAGE = "singleflight wait"
+
+
+class _Call:
+    """진행 중인 업스트림 호출 하나를 나타냅니다."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+def _deadline_error(error: BaseException | None) -> bool:
+    """DeadlineExceeded인지 (OpenAI SDK는 연결 오류로 감싸서 발생시킵니다.)"""
+    return isinstance(error, DeadlineExceeded) or isinstance(getattr(error, "__cause__", None), DeadlineExceeded)
+
+
+class SingleFlight:
+    """동일한 키의 동시 호출을 하나의 업스트림 호출로 합칩니다.
+
+    - 같은 키로 이미 호출이 진행 중이면 새 호출을 만들지 않고 그 결과를 기다립니다.
+    - 호출이 끝나면 키를 제거하므로 결과를 캐싱하지는 않습니다.
+    - 기다리는 호출자는 자기 요청의 deadline까지만 기다립니다.
+    - 예외도 기다리던 호출자에게 그대로 전달됩니다. 단, 먼저 호출한 요청의 DeadlineExceeded는 그 요청의 예산이
+      끝난 것이므로 전달하지 않고, 기다리던 호출자가 자기 남은 예산으로 다시 호출합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = _Call()
+                    self._calls[key] = call
+            if leader:
+                break
+
+            with stage(WAIT_STAGE):
+                finished = call.done.wait(timeout_for(WAIT_STAGE))
+            if not finished:
+                raise DeadlineExceeded(WAIT_STAGE, current_deadline())
+            if _deadline_error(call.error):
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """현재 진행 중인 서로 다른 키의 수"""
+        with self._lock:
+            return len(self._calls)
+
+
+def normalize_address(address: str) -> str:
+    """공백 차이로 같은 주소가 다른 키가 되지 않도록 정규화합니다."""
+    return " ".join(address.split())
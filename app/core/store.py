@@ -0,0 +1,244 @@
+# app/core/store.py
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+import orjson
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 직렬화한 값이 이보다 크면 zlib으로 압축합니다. (첫 바이트로 형식을 구분)
+COMPRESS_MIN_BYTES = 512
+_RAW = b"j"
+_ZLIB = b"z"
+
+
+def encode(value: Any) -> bytes:
+    data = orjson.dumps(value)
+    if len(data) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(data, 6)
+        if len(compressed) < len(data):
+            return _ZLIB + compressed
+    return _RAW + data
+
+
+def decode(data: bytes) -> Any:
+    if data[:1] == _ZLIB:
+        return orjson.loads(zlib.decompress(data[1:]))
+    return orjson.loads(data[1:])
+
+
+class Store:
+    """TTL이 있는 key-value 캐시 저장소
+
+    - 값은 orjson으로 직렬화할 수 있는 dict / list / str / 숫자이며, 저장한 뒤 값을 고쳐도 저장소에는 반영되지 않습니다.
+    - get_many / set_many는 한 번의 왕복으로 처리합니다.
+    - 캐시이므로 저장소 오류는 로그만 남기고 조회 실패(미스)로 처리합니다.
+    - shared가 True이면 다른 워커 프로세스와 값을 공유합니다.
+    """
+
+    shared = False
+    errors: tuple[type[Exception], ...] = ()
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_many((key,)).get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        self.set_many({key: value}, ttl)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """저장된 key만 담은 dict"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        try:
+            return self._get_many(keys)
+        except self.errors as e:
+            logger.warning("%s 조회 실패: %s", type(self).__name__, e)
+            return {}
+
+    def set_many(self, items: dict[str, Any], ttl: Optional[float] = None):
+        """ttl초 뒤에 만료 (None이면 만료 없음)"""
+        if not items:
+            return
+        try:
+            self._set_many(items, ttl)
+        except self.errors as e:
+            logger.warning("%s 저장 실패: %s", type(self).__name__, e)
+
+    def delete(self, key: str):
+        try:
+            self._delete(key)
+        except self.errors as e:
+            logger.warning("%s 삭제 실패: %s", type(self).__name__, e)
+
+    def _get_many(self, keys: list[str]) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def _set_many(self, items: dict[str, Any], ttl: Optional[float]):
+        raise NotImplementedError
+
+    def _delete(self, key: str):
+        raise NotImplementedError
+
+
+class MemoryStore(Store):
+    """프로세스 내 LRU 저장소
+
+    - 다른 저장소와 같게 값을 orjson bytes로 보관하고 꺼낼 때마다 새로 만듭니다. (압축은 하지 않음)
+      꺼낸 dict를 고쳐도 캐시된 값은 그대로이고, tuple은 list로 돌아옵니다.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[bytes, Optional[float]]] = OrderedDict()
+
+    def _get_many(self, keys: list[str]) -> dict[str, Any]:
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                value, expires_at = entry
+                if expires_at is not None and expires_at <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = value
+        return {key: orjson.loads(value) for key, value in found.items()}
+
+    def _set_many(self, items: dict[str, Any], ttl: Optional[float]):
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        encoded = {key: orjson.dumps(value) for key, value in items.items()}
+        with self._lock:
+            for key, value in encoded.items():
+                self._entries[key] = (value, expires_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteStore(Store):
+    """같은 노드의 워커끼리 공유하는 SQLite(WAL) 저장소
+
+    - 연결은 스레드(와 프로세스)마다 따로 엽니다.
+    - purge_every번 저장할 때마다 만료된 행을 지웁니다.
+    """
+
+    shared = True
+    errors = (sqlite3.Error,)
+    # 한 쿼리에 넣는 key 수 (SQLite 변수 개수 제한)
+    BATCH = 500
+
+    def __init__(self, path: str, purge_every: int = 1000):
+        self.path = path
+        self.purge_every = purge_every
+        self._writes = 0
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS store (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL) WITHOUT ROWID"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
+
+    def _get_many(self, keys: list[str]) -> dict[str, Any]:
+        connection = self._connection()
+        now = time.time()
+        found = {}
+        for start in range(0, len(keys), self.BATCH):
+            batch = keys[start:start + self.BATCH]
+            rows = connection.execute(
+                f"SELECT key, value FROM store WHERE key IN ({','.join('?' * len(batch))})"
+                " AND (expires_at IS NULL OR expires_at > ?)",
+                (*batch, now),
+            )
+            found.update((key, decode(value)) for key, value in rows)
+        return found
+
+    def _set_many(self, items: dict[str, Any], ttl: Optional[float]):
+        expires_at = None if ttl is None else time.time() + ttl
+        rows = [(key, encode(value), expires_at) for key, value in items.items()]
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany("INSERT OR REPLACE INTO store (key, value, expires_at) VALUES (?, ?, ?)", rows)
+            self._writes += 1
+            if self._writes % self.purge_every == 0:
+                connection.execute("DELETE FROM store WHERE expires_at <= ?", (time.time(),))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _delete(self, key: str):
+        self._connection().execute("DELETE FROM store WHERE key = ?", (key,))
+
+
+class RedisStore(Store):
+    """여러 노드가 공유하는 Redis 저장소 (redis 패키지 필요, Valkey 등 Redis 호환 서버도 사용 가능)"""
+
+    shared = True
+
+    def __init__(self, url: str, prefix: str = "farmmate:", timeout: float = 0.5):
+        import redis
+
+        self.prefix = prefix
+        self.errors = (redis.RedisError,)
+        self._redis = redis.Redis.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+
+    def _get_many(self, keys: list[str]) -> dict[str, Any]:
+        values = self._redis.mget([self.prefix + key for key in keys])
+        return {key: decode(value) for key, value in zip(keys, values) if value is not None}
+
+    def _set_many(self, items: dict[str, Any], ttl: Optional[float]):
+        pipeline = self._redis.pipeline(transaction=False)
+        for key, value in items.items():
+            pipeline.set(self.prefix + key, encode(value), px=None if ttl is None else max(1, int(ttl * 1000)))
+        pipeline.execute()
+
+    def _delete(self, key: str):
+        self._redis.delete(self.prefix + key)
+
+
+def create_store(backend: str) -> Store:
+    """STORE_BACKEND ("memory", "sqlite", "redis")에 맞는 저장소"""
+    if backend == "sqlite":
+        return SQLiteStore(settings.STORE_SQLITE_PATH)
+    if backend == "redis":
+        try:
+            return RedisStore(settings.STORE_REDIS_URL)
+        except ImportError:
+            logger.warning("redis 패키지가 없어 프로세스 내 저장소를 사용합니다.")
+    elif backend != "memory":
+        logger.warning("알 수 없는 STORE_BACKEND(%s)입니다. 프로세스 내 저장소를 사용합니다.", backend)
+    return MemoryStore(settings.STORE_MEMORY_MAX_ENTRIES)
+
+
+store = create_store(settings.STORE_BACKEND)
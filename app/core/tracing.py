@@ -0,0 +1,150 @@
+# app/core/tracing.py
+
+import logging
+import re
+import uuid
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Optional
+
+from app.core.config import settings
+from app.core.deadline import current_deadline
+from app.core.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = "x-request-id"
+# 클라이언트가 보낸 요청 ID는 이 형식일 때만 그대로 사용합니다.
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{8,64}$")
+
+# Server-Timing 항목 (stage 이름 접두어 -> metric 이름), 위에서부터 처음 일치하는 항목을 사용합니다.
+TIMING_GROUPS = (
+    ("openai run_wait", "run_wait"),
+    ("run_queue", "run_queue"),
+    ("openai", "openai"),
+    ("kakao", "geocode"),
+    ("kma", "kma"),
+    ("backend", "backend"),
+)
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def current_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+def server_timing(stages: list[tuple[str, float]], total: float) -> str:
+    """단계별 사용 시간을 Server-Timing 헤더 값으로 만듭니다. (ms)"""
+    grouped: dict[str, float] = {}
+    for stage_name, seconds in stages:
+        for prefix, metric in TIMING_GROUPS:
+            if stage_name.startswith(prefix):
+                grouped[metric] = grouped.get(metric, 0.0) + seconds
+                break
+    entries = [f"{metric};dur={seconds * 1000:.1f}" for metric, seconds in grouped.items()]
+    entries.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(entries)
+
+
+def _init_tracer():
+    """OTEL_EXPORTER_OTLP_ENDPOINT가 설정되어 있고 opentelemetry가 설치되어 있을 때만 span을 내보냅니다."""
+    if not settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+        return None
+    try:
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        logger.warning("opentelemetry 패키지가 없어 span을 내보내지 않습니다.")
+        return None
+
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(
+        OTLPSpanExporter(endpoint=f"{settings.OTEL_EXPORTER_OTLP_ENDPOINT.rstrip('/')}/v1/traces")
+    ))
+    trace.set_tracer_provider(provider)
+    return trace.get_tracer(__name__)
+
+
+_tracer = _init_tracer()
+
+
+def span(name: str, **attributes):
+    """OpenTelemetry span (내보내기를 사용하지 않으면 아무것도 하지 않음)"""
+    if _tracer is None:
+        return nullcontext()
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def inject_headers(headers):
+    """업스트림 요청 헤더에 요청 ID와 (사용 중이면) traceparent를 추가합니다."""
+    request_id = _request_id.get()
+    if request_id is not None:
+        headers[REQUEST_ID_HEADER] = request_id
+    if _tracer is not None:
+        from opentelemetry.propagate import inject
+        inject(headers)
+
+
+@contextmanager
+def request_id_scope(request_id: str):
+    token = _request_id.set(request_id)
+    try:
+        yield
+    finally:
+        _request_id.reset(token)
+
+
+class TracingMiddleware:
+    """요청마다 요청 ID를 만들고 응답에 X-Request-ID / Server-Timing 헤더를 추가하는 ASGI 미들웨어
+
+    - Server-Timing은 DeadlineMiddleware가 기록한 단계별 사용 시간으로 만들기 때문에 그 안쪽에 둡니다.
+    - 처리되지 않은 예외는 여기서 500 응답으로 바꿉니다. Exception 처리기는 가장 바깥의 ServerErrorMiddleware에서
+      실행되어 요청 ID와 헤더를 붙일 수 없기 때문입니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                candidate = value.decode("latin-1")
+                if _VALID_REQUEST_ID.match(candidate):
+                    request_id = candidate
+                break
+        request_id = request_id or uuid.uuid4().hex
+        deadline = current_deadline()
+
+        response_started = False
+
+        async def send_with_headers(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                headers = list(message.get("headers", []))
+                headers.append((b"x-request-id", request_id.encode("latin-1")))
+                if deadline is not None:
+                    timing = server_timing(deadline.breakdown(), deadline.elapsed())
+                    headers.append((b"server-timing", timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        with request_id_scope(request_id), span(f"{scope['method']} {route_template(scope)}", **{"request.id": request_id}):
+            try:
+                await self.app(scope, receive, send_with_headers)
+            except Exception as exc:
+                if response_started:
+                    raise
+                # globalException -> utils.response -> tracing 순으로 import하므로 여기서 가져옵니다.
+                from app.core.globalException import internal_error_response
+
+                logger.exception("처리되지 않은 예외 (request_id=%s)", request_id)
+                await internal_error_response(exc)(scope, receive, send_with_headers)
@@ -0,0 +1,139 @@
+# app/core/upstream.py
+
+import re
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.admission import observe_upstream
+from app.core.bulkhead import Bulkhead, bulkheads
+from app.core.deadline import DeadlineExceeded, current_deadline, stage
+from app.core.hedging import Hedger, hedgers
+from app.core.metrics import record_upstream
+from app.core.tracing import inject_headers, span
+
+# thread_abc, run_abc 같은 OpenAI 리소스 ID, 숫자, UUID 경로 조각
+_ID_SEGMENT = re.compile(r"^([a-z]+_[A-Za-z0-9]+|\d+|[0-9a-fA-F-]{32,36})$")
+_VERSION_SEGMENT = re.compile(r"^(v\d+|api)$")
+
+
+def operation_name(method: str, path: str) -> str:
+    """메트릭/추적에 쓸 업스트림 작업 이름 (ID는 {id}로 치환)"""
+    segments = [segment for segment in path.strip("/").split("/") if segment]
+    while segments and (_VERSION_SEGMENT.match(segments[0]) or _ID_SEGMENT.match(segments[0])):
+        segments.pop(0)
+    return f"{method} /" + "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in segments)
+
+
+def _call(bulkhead: Bulkhead, hedger: Optional[Hedger], operation: str, wait, fn, /, *args, **kwargs):
+    """bulkhead에서 fn을 실행하고, 남은 deadline을 넘기면 기다리지 않고 DeadlineExceeded를 발생시킵니다.
+
+    - 업스트림/작업별 호출 시간과 실패(5xx 응답 또는 예외)를 메트릭으로 기록합니다.
+    - 호출 시간은 admission limiter의 지연 신호로도 사용합니다.
+    """
+    deadline = current_deadline()
+    stage_name = f"{bulkhead.name} {operation}"
+    started = time.monotonic()
+    with stage(stage_name), span(stage_name, **{"upstream": bulkhead.name, "operation": operation}):
+        try:
+            if hedger is not None:
+                response = hedger.call(bulkhead, wait, fn, *args, **kwargs)
+            else:
+                response = bulkhead.submit(fn, *args, **kwargs).result(wait)
+        except FutureTimeoutError:
+            pass
+        except Exception as e:
+            _record(bulkhead.name, operation, time.monotonic() - started, error=e)
+            raise
+        else:
+            _record(bulkhead.name, operation, time.monotonic() - started, status_code=response.status_code)
+            return response
+    # 기다린 시간이 단계별 사용 시간에 기록된 뒤에 발생시킵니다.
+    error = DeadlineExceeded(stage_name, deadline)
+    _record(bulkhead.name, operation, time.monotonic() - started, error=error)
+    raise error
+
+
+def _record(upstream: str, operation: str, seconds: float, **outcome):
+    record_upstream(upstream, operation, seconds, **outcome)
+    observe_upstream(upstream, seconds)
+
+
+class BulkheadTransport(httpx.HTTPTransport):
+    """httpx 요청을 업스트림 전용 bulkhead에서 실행하는 transport (OpenAI 클라이언트용)
+
+    - 요청의 timeout은 현재 요청 deadline의 남은 시간으로 줄입니다.
+    - 요청 ID(X-Request-ID)를 헤더로 전달합니다.
+    """
+
+    def __init__(self, name: str, **kwargs):
+        self.bulkhead: Bulkhead = bulkheads[name]
+        kwargs.setdefault("limits", httpx.Limits(
+            max_connections=self.bulkhead.max_workers,
+            max_keepalive_connections=self.bulkhead.max_workers,
+        ))
+        super().__init__(**kwargs)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        operation = operation_name(request.method, request.url.path)
+        stage_name = f"{self.bulkhead.name} {operation}"
+        deadline = current_deadline()
+        remaining = None
+        if deadline is not None:
+            remaining = deadline.timeout_for(stage_name)
+            request.extensions["timeout"] = {
+                key: remaining if value is None else min(value, remaining)
+                for key, value in request.extensions.get("timeout", {}).items()
+            } or {"connect": remaining, "read": remaining, "write": remaining, "pool": remaining}
+        inject_headers(request.headers)
+        try:
+            return _call(self.bulkhead, None, operation, remaining, super().handle_request, request)
+        except httpx.TimeoutException:
+            if deadline is not None and deadline.remaining() <= 0:
+                raise DeadlineExceeded(stage_name, deadline)
+            raise
+
+
+class BulkheadAdapter(HTTPAdapter):
+    """requests 요청을 업스트림 전용 bulkhead에서 실행하는 adapter
+
+    - 요청의 timeout은 현재 요청 deadline의 남은 시간으로 줄입니다.
+    - 요청 ID(X-Request-ID)를 헤더로 전달합니다.
+    - hedger가 있으면 GET 요청이 느릴 때 같은 요청을 한 번 더 보냅니다.
+    """
+
+    def __init__(self, bulkhead: Bulkhead, hedger: Optional[Hedger] = None, **kwargs):
+        self.bulkhead = bulkhead
+        self.hedger = hedger
+        kwargs.setdefault("pool_maxsize", bulkhead.max_workers)
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        operation = operation_name(request.method, request.path_url.split("?")[0])
+        stage_name = f"{self.bulkhead.name} {operation}"
+        deadline = current_deadline()
+        remaining = None
+        if deadline is not None:
+            remaining = deadline.timeout_for(stage_name)
+            timeout = remaining if timeout is None or isinstance(timeout, tuple) else min(timeout, remaining)
+        inject_headers(request.headers)
+        try:
+            hedger = self.hedger if request.method == "GET" else None
+            return _call(self.bulkhead, hedger, operation, remaining, super().send, request, timeout=timeout, **kwargs)
+        except requests.exceptions.Timeout:
+            if deadline is not None and deadline.remaining() <= 0:
+                raise DeadlineExceeded(stage_name, deadline)
+            raise
+
+
+def upstream_session(name: str) -> requests.Session:
+    """업스트림 하나 전용 requests 세션 (연결 재사용 + bulkhead 격리 + hedging)"""
+    session = requests.Session()
+    adapter = BulkheadAdapter(bulkheads[name], hedgers.get(name))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
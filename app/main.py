@@ -1,19 +1,61 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Depends
+from fastapi.responses import ORJSONResponse
 from app.api.openai.chatbot import router as openai_router
 from app.api.weather.weather import router as weather_router
 from app.api.health.health import router as health_router
+from app.api.metrics.metrics import router as metrics_router
+from app.api.profiling.profiling import router as profiling_router
 from app.core.globalException import add_exception_handlers
+from app.core.ratelimit import limit_member_requests
+from app.core.admission import admit
+from app.core.bulkhead import reserve_request_threads
+from app.core.deadline import DeadlineMiddleware
+from app.core.metrics import MetricsMiddleware
+from app.core.tracing import TracingMiddleware
+from app.core.profiling import ProfilingMiddleware, require_profiling_token
+from app.core.loopmonitor import loop_monitor
+from app.core.config import settings
 import uvicorn
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    reserve_request_threads()
+    if settings.LOOP_MONITOR_ENABLED:
+        await loop_monitor.start()
+    yield
+    await loop_monitor.stop()
+
 
-app.include_router(openai_router, prefix="/members/{memberId}/threads")
-app.include_router(weather_router, prefix="/weather")
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+app.include_router(
+    openai_router,
+    prefix="/members/{memberId}/threads",
+    dependencies=[Depends(limit_member_requests), Depends(admit("chat"))],
+)
+app.include_router(weather_router, prefix="/weather", dependencies=[Depends(admit("weather"))])
 app.include_router(health_router, prefix="/health")
+app.include_router(metrics_router, prefix="/metrics", include_in_schema=False)
+if settings.PROFILING_TOKEN:
+    app.include_router(
+        profiling_router,
+        prefix="/profiling",
+        dependencies=[Depends(require_profiling_token)],
+        include_in_schema=False,
+    )
 
 add_exception_handlers(app)
 
+# 나중에 추가한 미들웨어가 바깥쪽에서 실행됩니다. (Metrics -> Deadline -> Tracing -> Profiling)
+if settings.PROFILING_TOKEN:
+    app.add_middleware(ProfilingMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(DeadlineMiddleware)
+app.add_middleware(MetricsMiddleware)
+
 
 # 실행
 if __name__ == "__main__":
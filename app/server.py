@@ -0,0 +1,210 @@
+"""운영 환경 실행 진입점
+
+실행: python -m app.server
+
+- 컨테이너의 CPU / 메모리 한도(cgroup)로 워커 프로세스 수를 정합니다. (WEB_CONCURRENCY로 직접 지정 가능)
+- 부모 프로세스가 앱을 미리 import하고 소켓을 연 다음 워커를 fork하므로, 읽기 전용 데이터는 워커끼리 공유됩니다.
+- uvloop / httptools가 설치되어 있으면 사용합니다.
+- SIGTERM을 받으면 새 연결을 받지 않고, 처리 중인 요청(AI run 포함)이 끝날 때까지
+  SHUTDOWN_DRAIN_SECONDS 동안 기다린 뒤 종료합니다.
+- 회원별 요청 제한, run 동시 실행 수, 캐시는 워커마다 따로 있습니다.
+"""
+
+import gc
+import importlib.util
+import logging
+import math
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from typing import Optional
+
+import uvicorn
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.server")
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+# cgroup v1에서 메모리 한도가 없으면 이 값보다 큰 숫자가 들어 있습니다.
+_UNLIMITED_MEMORY = 1 << 60
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def cpu_limit(root: str = CGROUP_ROOT) -> float:
+    """컨테이너가 쓸 수 있는 CPU 수 (cgroup quota가 없으면 이 프로세스에 할당된 코어 수)"""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = float(len(os.sched_getaffinity(0)))
+    else:
+        cpus = float(os.cpu_count() or 1)
+
+    cpu_max = _read(os.path.join(root, "cpu.max"))  # cgroup v2: "<quota> <period>" 또는 "max <period>"
+    if cpu_max is not None:
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max":
+            return min(cpus, int(quota) / int(period))
+        return cpus
+
+    quota = _read(os.path.join(root, "cpu", "cpu.cfs_quota_us"))  # cgroup v1
+    period = _read(os.path.join(root, "cpu", "cpu.cfs_period_us"))
+    if quota is not None and period is not None and int(quota) > 0:
+        return min(cpus, int(quota) / int(period))
+    return cpus
+
+
+def memory_limit(root: str = CGROUP_ROOT) -> Optional[int]:
+    """컨테이너 메모리 한도 (byte, 한도가 없으면 None)"""
+    memory_max = _read(os.path.join(root, "memory.max"))
+    if memory_max is not None:
+        return None if memory_max == "max" else int(memory_max)
+
+    limit = _read(os.path.join(root, "memory", "memory.limit_in_bytes"))
+    if limit is not None and int(limit) < _UNLIMITED_MEMORY:
+        return int(limit)
+    return None
+
+
+def worker_count(cpus: float, memory: Optional[int], worker_memory_mb: int = 256) -> int:
+    """코어마다 워커 하나, 단 메모리 한도 안에 들어가는 만큼만
+
+    - 처리기는 대부분 업스트림을 기다리므로 소수점 코어는 올려서 셉니다.
+    """
+    workers = max(1, math.ceil(cpus))
+    if memory is not None:
+        workers = min(workers, max(1, memory // (worker_memory_mb * 1024 * 1024)))
+    return workers
+
+
+def event_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def preload():
+    """워커를 fork하기 전에 앱과 읽기 전용 데이터를 부모 프로세스에서 만들어 둡니다.
+
+    - 네트워크 연결은 워커마다 따로 가져야 하므로 여기서 업스트림을 호출하지 않습니다.
+    - gc.freeze()로 미리 만든 객체를 GC 대상에서 빼야 워커에서 페이지가 복사되지 않습니다.
+    """
+    from app.main import app
+
+    app.openapi()
+    gc.collect()
+    gc.freeze()
+    return app
+
+
+def create_server(app) -> uvicorn.Server:
+    config = uvicorn.Config(
+        app,
+        loop=event_loop(),
+        http=http_protocol(),
+        lifespan="on",
+        proxy_headers=True,
+        timeout_graceful_shutdown=settings.SHUTDOWN_DRAIN_SECONDS,
+    )
+    return uvicorn.Server(config)
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    sock = socket.create_server((host, port), backlog=2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+class Supervisor:
+    """워커를 fork해서 같은 소켓을 나눠 받게 하고, 죽은 워커는 다시 띄우며, 종료 신호는 워커에 전달합니다."""
+
+    def __init__(self, app, sock: socket.socket, workers: int):
+        self.app = app
+        self.sock = sock
+        self.workers = workers
+        self.children: dict[int, float] = {}
+        self.stopping = False
+
+    def spawn(self):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            try:
+                create_server(self.app).run(sockets=[self.sock])
+            finally:
+                os._exit(0)
+        self.children[pid] = time.monotonic()
+
+    def stop(self, signum, frame):
+        if self.stopping:
+            return
+        self.stopping = True
+        logger.info("종료 신호를 받았습니다. 처리 중인 요청을 최대 %.0f초 기다립니다.", settings.SHUTDOWN_DRAIN_SECONDS)
+        # 부모가 소켓을 들고 있으면 워커가 모두 닫아도 커널이 새 연결을 계속 받습니다.
+        self.sock.close()
+        for pid in list(self.children):
+            os.kill(pid, signal.SIGTERM)
+        killer = threading.Timer(settings.SHUTDOWN_DRAIN_SECONDS + 5, self.kill)
+        killer.daemon = True
+        killer.start()
+
+    def kill(self):
+        for pid in list(self.children):
+            logger.error("워커 %d가 제시간에 끝나지 않아 강제로 종료합니다.", pid)
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for _ in range(self.workers):
+            self.spawn()
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started = self.children.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            logger.error("워커 %d가 종료되었습니다. (status %d) 다시 시작합니다.", pid, status)
+            if time.monotonic() - started < 1:
+                # 시작하자마자 죽는 워커를 쉬지 않고 다시 띄우지 않습니다.
+                time.sleep(1)
+            self.spawn()
+
+
+def main():
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logger.setLevel(logging.INFO)
+    cpus, memory = cpu_limit(), memory_limit()
+    workers = settings.WEB_CONCURRENCY or worker_count(cpus, memory, settings.WORKER_MEMORY_MB)
+    logger.info(
+        "워커 %d개로 시작합니다. (cpu %.2f, memory %s, loop %s, http %s)",
+        workers, cpus, f"{memory // (1024 * 1024)}MB" if memory else "무제한", event_loop(), http_protocol(),
+    )
+
+    app = preload()
+    sock = bind_socket(settings.HOST, settings.PORT)
+    if workers == 1 or not hasattr(os, "fork"):
+        create_server(app).run(sockets=[sock])
+    else:
+        Supervisor(app, sock, workers).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,21 @@
 # app/utils/response.py
 
 from typing import Any, Optional
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+
+from app.core.tracing import current_request_id
 
 
 def create_response(*,
                     status_code: int,
                     message: str,
                     data: Any = None,
-                    error: Optional[dict[str, str]] = None) -> JSONResponse:
+                    error: Optional[dict[str, str]] = None,
+                    headers: Optional[dict[str, str]] = None) -> ORJSONResponse:
     """통합 응답 생성 함수
     - status_code로 성공/실패 판단 (2xx는 성공, 4xx/5xx는 실패)
     - error는 실패시에만 포함
+    - 직렬화는 orjson으로 합니다. (content는 dict/list/str/숫자/datetime/Enum만 사용)
     """
     content = {
         "message": message
@@ -21,11 +25,13 @@ def create_response(*,
     if 200 <= status_code < 300:
         content["data"] = data
 
-    # 상태 코드가 실패일 경우 (4xx, 5xx), error만 포함
+    # 상태 코드가 실패일 경우 (4xx, 5xx), error만 포함 (요청 ID를 함께 전달)
     else:
-        content["error"] = error
+        request_id = current_request_id()
+        content["error"] = {**error, "requestId": request_id} if error and request_id else error
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
-        content=content
+        content=content,
+        headers=headers
     )
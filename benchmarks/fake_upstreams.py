@@ -0,0 +1,359 @@
+"""부하 테스트용 가짜 업스트림 서버 (OpenAI Assistants / Kakao 로컬 / 기상청 실황·예보 / FarmMate 백엔드)
+
+- 업스트림마다 지연 분포와 실패 비율을 따로 설정할 수 있습니다.
+- 지연 분포 형식
+    fixed:<ms>                       항상 같은 지연
+    lognormal:<중앙값 ms>:<sigma>      대부분 중앙값 근처, 가끔 긴 꼬리
+    tail:<ms>:<느린 ms>:<비율>          비율만큼의 요청만 느린 응답 (기상청처럼 꼬리가 무거운 경우)
+
+실행: python benchmarks/fake_upstreams.py --port 9100 --kma-latency tail:100:3000:0.02
+      (OpenAI :9100/v1, Kakao :9101, 기상청 :9102, 백엔드 :9103/api)
+"""
+
+import argparse
+import asyncio
+import itertools
+import math
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+
+
+@dataclass
+class Behavior:
+    """가짜 업스트림 하나의 지연 분포와 실패 비율"""
+    latency: str = "fixed:0"
+    error_rate: float = 0.0
+
+    def sample_latency(self) -> float:
+        kind, *args = self.latency.split(":")
+        values = [float(arg) for arg in args]
+        if kind == "fixed":
+            return values[0] / 1000
+        if kind == "lognormal":
+            median, sigma = values
+            return random.lognormvariate(math.log(max(median, 0.001)), sigma) / 1000
+        if kind == "tail":
+            fast, slow, ratio = values
+            return (slow if random.random() < ratio else fast) / 1000
+        raise ValueError(f"알 수 없는 지연 분포입니다: {self.latency}")
+
+    async def delay(self):
+        await asyncio.sleep(self.sample_latency())
+
+    def should_fail(self) -> bool:
+        return random.random() < self.error_rate
+
+
+def _error(status_code: int = 500, message: str = "injected failure"):
+    return ORJSONResponse(status_code=status_code, content={"error": {"message": message, "type": "server_error"}})
+
+
+# --------------------------------------------- #
+# OpenAI Assistants API
+
+def create_openai_app(behavior: Behavior, run_latency: Behavior) -> FastAPI:
+    """threads / messages / runs 수명 주기를 메모리에서 흉내 내는 OpenAI API
+
+    - run은 생성 후 run_latency에서 뽑은 시간이 지나면 completed가 되고 assistant 메시지가 추가됩니다.
+    - run_latency.error_rate 비율의 run은 failed로 끝납니다.
+    """
+    app = FastAPI()
+    ids = itertools.count(1)
+    threads: dict[str, dict] = {}
+    messages: dict[str, list[dict]] = {}
+    runs: dict[str, dict] = {}
+
+    def new_id(prefix: str) -> str:
+        return f"{prefix}_{next(ids):012d}"
+
+    def message_object(thread_id: str, role: str, text: str, run_id: Optional[str] = None) -> dict:
+        return {
+            "id": new_id("msg"), "object": "thread.message", "created_at": int(time.time()),
+            "thread_id": thread_id, "role": role, "status": "completed",
+            "content": [{"type": "text", "text": {"value": text, "annotations": []}}],
+            "assistant_id": "asst_fake" if role == "assistant" else None, "run_id": run_id,
+            "attachments": [], "metadata": {},
+        }
+
+    def advance(run: dict) -> dict:
+        """요청이 올 때마다 시간에 맞춰 run 상태를 진행시킵니다."""
+        if run["status"] in ("queued", "in_progress") and time.monotonic() >= run["_finish_at"]:
+            if run["_fail"]:
+                run.update(status="failed", failed_at=int(time.time()),
+                           last_error={"code": "server_error", "message": "injected failure"})
+            else:
+                run.update(status="completed", completed_at=int(time.time()),
+                           usage={"prompt_tokens": 900, "completion_tokens": 150, "total_tokens": 1050})
+                messages[run["thread_id"]].append(message_object(
+                    run["thread_id"], "assistant", "물은 흙 표면이 마르면 충분히 주세요. " * 6, run["id"]))
+        elif run["status"] == "queued":
+            run["status"] = "in_progress"
+        return {key: value for key, value in run.items() if not key.startswith("_")}
+
+    @app.middleware("http")
+    async def latency_and_errors(request: Request, call_next):
+        await behavior.delay()
+        if behavior.should_fail():
+            return _error()
+        return await call_next(request)
+
+    @app.get("/v1/assistants/{assistant_id}")
+    async def retrieve_assistant(assistant_id: str):
+        return {"id": assistant_id, "object": "assistant", "created_at": 0, "model": "gpt-4o-mini",
+                "name": "fake", "instructions": "", "tools": [], "metadata": {}}
+
+    @app.post("/v1/threads")
+    async def create_thread(request: Request):
+        body = await request.json() if await request.body() else {}
+        thread_id = new_id("thread")
+        threads[thread_id] = {"id": thread_id, "object": "thread", "created_at": int(time.time()),
+                              "metadata": body.get("metadata") or {}, "tool_resources": None}
+        messages[thread_id] = []
+        return threads[thread_id]
+
+    @app.get("/v1/threads/{thread_id}")
+    async def retrieve_thread(thread_id: str):
+        if thread_id not in threads:
+            return _error(404, "No thread found")
+        return threads[thread_id]
+
+    @app.post("/v1/threads/{thread_id}")
+    async def update_thread(thread_id: str, request: Request):
+        if thread_id not in threads:
+            return _error(404, "No thread found")
+        threads[thread_id]["metadata"] = (await request.json()).get("metadata") or {}
+        return threads[thread_id]
+
+    @app.delete("/v1/threads/{thread_id}")
+    async def delete_thread(thread_id: str):
+        threads.pop(thread_id, None)
+        messages.pop(thread_id, None)
+        return {"id": thread_id, "object": "thread.deleted", "deleted": True}
+
+    @app.post("/v1/threads/{thread_id}/messages")
+    async def create_message(thread_id: str, request: Request):
+        if thread_id not in threads:
+            return _error(404, "No thread found")
+        body = await request.json()
+        message = message_object(thread_id, body.get("role", "user"), body.get("content", ""))
+        messages[thread_id].append(message)
+        return message
+
+    @app.get("/v1/threads/{thread_id}/messages")
+    async def list_messages(thread_id: str, order: str = "desc", limit: int = 20, after: Optional[str] = None):
+        if thread_id not in threads:
+            return _error(404, "No thread found")
+        items = messages[thread_id] if order == "asc" else messages[thread_id][::-1]
+        if after is not None:
+            position = next((i for i, message in enumerate(items) if message["id"] == after), len(items) - 1)
+            items = items[position + 1:]
+        page = items[:limit]
+        return {"object": "list", "data": page, "first_id": page[0]["id"] if page else None,
+                "last_id": page[-1]["id"] if page else None, "has_more": len(items) > limit}
+
+    @app.post("/v1/threads/{thread_id}/runs")
+    async def create_run(thread_id: str, request: Request):
+        if thread_id not in threads:
+            return _error(404, "No thread found")
+        body = await request.json()
+        run_id = new_id("run")
+        runs[run_id] = {
+            "id": run_id, "object": "thread.run", "created_at": int(time.time()), "thread_id": thread_id,
+            "assistant_id": body.get("assistant_id"), "status": "queued", "model": "gpt-4o-mini",
+            "instructions": "", "tools": [], "metadata": {}, "usage": None, "required_action": None,
+            "last_error": None, "parallel_tool_calls": True, "response_format": "auto", "tool_choice": "auto",
+            "truncation_strategy": body.get("truncation_strategy"),
+            "_finish_at": time.monotonic() + run_latency.sample_latency(), "_fail": run_latency.should_fail(),
+        }
+        return advance(runs[run_id])
+
+    @app.get("/v1/threads/{thread_id}/runs/{run_id}")
+    async def retrieve_run(thread_id: str, run_id: str):
+        if run_id not in runs:
+            return _error(404, "No run found")
+        return advance(runs[run_id])
+
+    @app.post("/v1/threads/{thread_id}/runs/{run_id}/cancel")
+    async def cancel_run(thread_id: str, run_id: str):
+        if run_id not in runs:
+            return _error(404, "No run found")
+        runs[run_id].update(status="cancelled", cancelled_at=int(time.time()))
+        return advance(runs[run_id])
+
+    @app.post("/v1/chat/completions")
+    async def chat_completion(request: Request):
+        body = await request.json()
+        message = {"role": "assistant", "content": "감자를 재배하는 농장입니다. 최근 물 주기를 상담했습니다."}
+        if body.get("tools"):
+            message = {"role": "assistant", "content": None, "tool_calls": [{
+                "id": new_id("call"), "type": "function",
+                "function": {"name": "get_weather", "arguments": '{"address": "서울특별시 중구 세종대로 110"}'},
+            }]}
+        return {"id": new_id("chatcmpl"), "object": "chat.completion", "created": int(time.time()),
+                "model": body.get("model", "gpt-4o-mini"),
+                "choices": [{"index": 0, "message": message, "finish_reason": "stop", "logprobs": None}],
+                "usage": {"prompt_tokens": 300, "completion_tokens": 60, "total_tokens": 360}}
+
+    return app
+
+
+# --------------------------------------------- #
+# Kakao 로컬 / 기상청 / 백엔드
+
+def create_kakao_app(behavior: Behavior) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/v2/local/search/address.json")
+    async def search_address(query: str):
+        await behavior.delay()
+        if behavior.should_fail():
+            return _error()
+        if "없는주소" in query:
+            return {"documents": [], "meta": {"total_count": 0}}
+        # 같은 주소는 같은 좌표 (서울 근처)
+        offset = (hash(query) % 1000) / 10000
+        return {"documents": [{"address_name": query, "x": str(126.97 + offset), "y": str(37.56 + offset)}],
+                "meta": {"total_count": 1}}
+
+    return app
+
+
+def create_kma_app(behavior: Behavior) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/1360000/VilageFcstInfoService_2.0/getUltraSrtNcst")
+    async def nowcast(base_date: str, base_time: str, nx: int, ny: int):
+        await behavior.delay()
+        if behavior.should_fail():
+            return _error()
+        observed = {"T1H": "12.3", "RN1": "0", "UUU": "-1.2", "VVV": "0.8", "REH": "55",
+                    "PTY": "0", "VEC": "310", "WSD": "1.5"}
+        items = [{"baseDate": base_date, "baseTime": base_time, "category": category,
+                  "nx": nx, "ny": ny, "obsrValue": value} for category, value in observed.items()]
+        return {"response": {"header": {"resultCode": "00", "resultMsg": "NORMAL_SERVICE"},
+                             "body": {"dataType": "JSON", "items": {"item": items},
+                                      "pageNo": 1, "numOfRows": 8, "totalCount": 8}}}
+
+    def forecast_response(base_date: str, base_time: str, nx: int, ny: int, hours: int,
+                          forecast: dict[str, str], rows: int):
+        base = datetime.strptime(base_date + base_time, "%Y%m%d%H%M")
+        items = [
+            {"baseDate": base_date, "baseTime": base_time, "category": category,
+             "fcstDate": f"{moment:%Y%m%d}", "fcstTime": f"{moment:%H}00", "fcstValue": value, "nx": nx, "ny": ny}
+            for moment in (base.replace(minute=0) + timedelta(hours=hour) for hour in range(1, hours + 1))
+            for category, value in forecast.items()
+        ]
+        return {"response": {"header": {"resultCode": "00", "resultMsg": "NORMAL_SERVICE"},
+                             "body": {"dataType": "JSON", "items": {"item": items[:rows]},
+                                      "pageNo": 1, "numOfRows": rows, "totalCount": len(items)}}}
+
+    @app.get("/1360000/VilageFcstInfoService_2.0/getVilageFcst")
+    async def village_forecast(base_date: str, base_time: str, nx: int, ny: int, numOfRows: int = 10):
+        await behavior.delay()
+        if behavior.should_fail():
+            return _error()
+        forecast = {"TMP": "12", "UUU": "-1.2", "VVV": "0.8", "VEC": "310", "WSD": "1.5", "SKY": "3",
+                    "PTY": "0", "POP": "30", "WAV": "0", "PCP": "강수없음", "REH": "55", "SNO": "적설없음"}
+        return ORJSONResponse(forecast_response(base_date, base_time, nx, ny, 72, forecast, numOfRows))
+
+    @app.get("/1360000/VilageFcstInfoService_2.0/getUltraSrtFcst")
+    async def ultra_forecast(base_date: str, base_time: str, nx: int, ny: int, numOfRows: int = 10):
+        await behavior.delay()
+        if behavior.should_fail():
+            return _error()
+        forecast = {"LGT": "0", "PTY": "0", "RN1": "강수없음", "SKY": "3", "T1H": "12", "REH": "55",
+                    "UUU": "-1.2", "VVV": "0.8", "VEC": "310", "WSD": "1.5"}
+        return ORJSONResponse(forecast_response(base_date, base_time, nx, ny, 6, forecast, numOfRows))
+
+    return app
+
+
+def create_backend_app(behavior: Behavior) -> FastAPI:
+    """회원별 채팅방 ID를 메모리에 기록하는 FarmMate 백엔드 (대시보드의 채팅방 목록 조회용)"""
+    app = FastAPI()
+    member_threads: dict[str, list[str]] = defaultdict(list)
+
+    @app.api_route("/api/members/{member_id}/threads", methods=["GET", "POST", "PATCH"])
+    @app.api_route("/api/members/{member_id}/threads/{thread_id}", methods=["DELETE"])
+    async def threads(request: Request, member_id: str, thread_id: Optional[str] = None):
+        await behavior.delay()
+        if behavior.should_fail():
+            return ORJSONResponse(status_code=500, content={"details": "injected failure"})
+        if request.method == "GET":
+            return {"status": 200, "data": [{"threadId": thread_id} for thread_id in member_threads[member_id]]}
+        if request.method == "POST":
+            member_threads[member_id].append((await request.json())["threadId"])
+        elif request.method == "DELETE" and thread_id in member_threads[member_id]:
+            member_threads[member_id].remove(thread_id)
+        return {"status": 200}
+
+    return app
+
+
+# --------------------------------------------- #
+
+def upstream_urls(host: str, port: int) -> dict[str, str]:
+    """앱에 넘길 업스트림 주소 환경 변수"""
+    return {
+        "OPENAI_BASE_URL": f"http://{host}:{port}/v1",
+        "KAKAO_LOCAL_API_URL": f"http://{host}:{port + 1}/v2/local/search/address.json",
+        "KMA_NOWCAST_URL": f"http://{host}:{port + 2}/1360000/VilageFcstInfoService_2.0/getUltraSrtNcst",
+        "KMA_VILLAGE_FORECAST_URL": f"http://{host}:{port + 2}/1360000/VilageFcstInfoService_2.0/getVilageFcst",
+        "KMA_ULTRA_FORECAST_URL": f"http://{host}:{port + 2}/1360000/VilageFcstInfoService_2.0/getUltraSrtFcst",
+        "BACKEND_BASE_URL": f"http://{host}:{port + 3}/api",
+    }
+
+
+async def serve(apps: list[FastAPI], host: str, port: int):
+    servers = [
+        uvicorn.Server(uvicorn.Config(app, host=host, port=port + offset, log_level="warning", access_log=False))
+        for offset, app in enumerate(apps)
+    ]
+    await asyncio.gather(*(server.serve() for server in servers))
+
+
+def add_behavior_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--openai-latency", default="lognormal:60:0.4", help="OpenAI API 호출 지연 분포")
+    parser.add_argument("--openai-error-rate", type=float, default=0.0)
+    parser.add_argument("--run-latency", default="lognormal:2500:0.5", help="run이 끝날 때까지 걸리는 시간 분포")
+    parser.add_argument("--run-error-rate", type=float, default=0.0, help="failed로 끝나는 run 비율")
+    parser.add_argument("--kakao-latency", default="lognormal:40:0.3")
+    parser.add_argument("--kakao-error-rate", type=float, default=0.0)
+    parser.add_argument("--kma-latency", default="tail:100:3000:0.02")
+    parser.add_argument("--kma-error-rate", type=float, default=0.0)
+    parser.add_argument("--backend-latency", default="lognormal:30:0.3")
+    parser.add_argument("--backend-error-rate", type=float, default=0.0)
+
+
+def create_apps(args) -> list[FastAPI]:
+    return [
+        create_openai_app(Behavior(args.openai_latency, args.openai_error_rate),
+                          Behavior(args.run_latency, args.run_error_rate)),
+        create_kakao_app(Behavior(args.kakao_latency, args.kakao_error_rate)),
+        create_kma_app(Behavior(args.kma_latency, args.kma_error_rate)),
+        create_backend_app(Behavior(args.backend_latency, args.backend_error_rate)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100, help="OpenAI 포트 (Kakao/기상청/백엔드는 +1, +2, +3)")
+    add_behavior_arguments(parser)
+    args = parser.parse_args()
+
+    for name, url in upstream_urls(args.host, args.port).items():
+        print(f"{name}={url}")
+    asyncio.run(serve(create_apps(args), args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
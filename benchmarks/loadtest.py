@@ -0,0 +1,250 @@
+"""가짜 업스트림을 띄우고 앱의 모든 라우터에 부하를 주는 부하 테스트
+
+- benchmarks/fake_upstreams.py와 앱(uvicorn)을 각각 별도 프로세스로 실행합니다.
+- 가상 사용자마다 회원 하나를 맡아 채팅방 생성 -> 메시지(run/날씨·상태 바로 답변/캐시)/조회/상태/대시보드/
+  날씨(실황/예보/관측 기록/지역)/수정/삭제를 섞어서 반복합니다.
+- 엔드포인트별 처리량과 p50/p95/p99를 출력합니다.
+
+실행: python benchmarks/loadtest.py --users 20 --duration 30 --kma-latency tail:100:3000:0.05
+      python benchmarks/loadtest.py --app-env HEDGE_UPSTREAMS= --json result.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+import httpx
+
+from fake_upstreams import add_behavior_arguments, upstream_urls
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 가상 사용자가 고르는 동작과 비율
+SCENARIO = (
+    ("send_message", 24),
+    ("send_weather", 6),
+    ("send_status", 6),
+    ("send_cached", 6),
+    ("get_thread", 12),
+    ("get_status", 8),
+    ("get_dashboard", 8),
+    ("get_weather", 8),
+    ("get_forecast", 4),
+    ("get_history", 3),
+    ("get_region", 2),
+    ("modify_thread", 5),
+    ("recreate_thread", 4),
+    ("health", 2),
+    ("metrics", 2),
+)
+ADDRESSES = ("서울특별시 중구 세종대로 110", "충청남도 천안시 동남구 두정역동 2길 31", "전라남도 나주시 빛가람로 25")
+QUESTIONS = ("감자 싹이 났는데 물은 얼마나 자주 줘야 하나요?", "잎이 노랗게 변하는데 비료를 더 줘야 하나요?",
+             "진딧물이 생겼을 때 친환경 방제 방법이 있나요?", "수확 시기는 어떻게 판단하나요?")
+# /weather/region에 쓸 서울 도심 범위 (격자 몇 개)
+REGION_BBOX = "126.95,37.52,127.05,37.60"
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0.0
+
+
+class Recorder:
+    """엔드포인트별 응답 시간과 실패 수"""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.statuses: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    async def call(self, client: httpx.AsyncClient, endpoint: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+            status = response.status_code
+        except httpx.HTTPError:
+            response, status = None, 0
+        self.latencies[endpoint].append(time.perf_counter() - started)
+        self.statuses[endpoint][status] += 1
+        if not 200 <= status < 300:
+            self.errors[endpoint] += 1
+        return response
+
+    def summary(self, elapsed: float) -> list[dict]:
+        rows = []
+        for endpoint, latencies in sorted(self.latencies.items()):
+            rows.append({
+                "endpoint": endpoint,
+                "requests": len(latencies),
+                "errors": self.errors[endpoint],
+                "rps": len(latencies) / elapsed,
+                "p50Ms": percentile(latencies, 0.50) * 1000,
+                "p95Ms": percentile(latencies, 0.95) * 1000,
+                "p99Ms": percentile(latencies, 0.99) * 1000,
+                "maxMs": max(latencies) * 1000,
+                "statuses": dict(self.statuses[endpoint]),
+            })
+        return rows
+
+
+async def create_thread(client, recorder: Recorder, member_id: str):
+    response = await recorder.call(client, "POST /members/{memberId}/threads/", "POST", f"/members/{member_id}/threads/",
+                                   json={"cropId": 1, "cropName": "감자", "address": random.choice(ADDRESSES),
+                                         "plantedAt": "2024-09-01"})
+    if response is not None and response.status_code == 201:
+        return response.json()["data"]["threadId"]
+    return None
+
+
+async def virtual_user(client: httpx.AsyncClient, recorder: Recorder, user: int, stop_at: float):
+    member_id = f"load-{user}"
+    base = f"/members/{member_id}/threads"
+    actions, weights = zip(*SCENARIO)
+    thread_id = await create_thread(client, recorder, member_id)
+
+    while time.monotonic() < stop_at:
+        if thread_id is None:
+            await asyncio.sleep(0.5)
+            thread_id = await create_thread(client, recorder, member_id)
+            continue
+
+        action = random.choices(actions, weights)[0]
+        if action == "send_message":
+            await recorder.call(client, "POST /{thread_id} (run)", "POST", f"{base}/{thread_id}",
+                                json={"message": f"{random.choice(QUESTIONS)} ({random.random():.6f})",
+                                      "useCache": False})
+        elif action == "send_weather":
+            await recorder.call(client, "POST /{thread_id} (weather)", "POST", f"{base}/{thread_id}",
+                                json={"message": "오늘 날씨 어때?"})
+        elif action == "send_status":
+            await recorder.call(client, "POST /{thread_id} (status)", "POST", f"{base}/{thread_id}",
+                                json={"message": "우리 밭 상태 어때?"})
+        elif action == "send_cached":
+            await recorder.call(client, "POST /{thread_id} (cache)", "POST", f"{base}/{thread_id}",
+                                json={"message": random.choice(QUESTIONS)})
+        elif action == "get_thread":
+            await recorder.call(client, "GET /{thread_id}", "GET", f"{base}/{thread_id}")
+        elif action == "get_status":
+            await recorder.call(client, "GET /{thread_id}/status", "GET", f"{base}/{thread_id}/status")
+        elif action == "get_dashboard":
+            # threadIds 없이 백엔드의 회원 채팅방 목록으로 조회합니다.
+            await recorder.call(client, "GET /status (dashboard)", "GET", f"{base}/status")
+        elif action == "get_weather":
+            await recorder.call(client, "GET /weather", "GET", "/weather", params={"address": random.choice(ADDRESSES)})
+        elif action == "get_forecast":
+            await recorder.call(client, "GET /weather/forecast", "GET", "/weather/forecast",
+                                params={"address": random.choice(ADDRESSES), "hours": 24})
+        elif action == "get_history":
+            await recorder.call(client, "GET /weather/history", "GET", "/weather/history",
+                                params={"address": random.choice(ADDRESSES)})
+        elif action == "get_region":
+            await recorder.call(client, "GET /weather/region", "GET", "/weather/region", params={"bbox": REGION_BBOX})
+        elif action == "modify_thread":
+            await recorder.call(client, "PATCH /{thread_id}", "PATCH", f"{base}/{thread_id}",
+                                json={"cropId": 1, "address": random.choice(ADDRESSES), "plantedAt": "2024-09-15"})
+        elif action == "recreate_thread":
+            await recorder.call(client, "DELETE /{thread_id}", "DELETE", f"{base}/{thread_id}")
+            thread_id = await create_thread(client, recorder, member_id)
+        elif action == "health":
+            await recorder.call(client, "GET /health", "GET", "/health")
+        elif action == "metrics":
+            await recorder.call(client, "GET /metrics", "GET", "/metrics")
+
+
+async def wait_until_ready(url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(url)
+                return
+            except httpx.HTTPError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f"{url}이(가) {timeout}초 안에 준비되지 않았습니다.")
+
+
+def start_processes(args) -> list[subprocess.Popen]:
+    behavior = [
+        f"--{name.replace('_', '-')}={value}" for name, value in vars(args).items()
+        if name.endswith(("_latency", "_error_rate"))
+    ]
+    fakes = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "benchmarks", "fake_upstreams.py"), "--port", str(args.fake_port), *behavior],
+        stdout=subprocess.DEVNULL,
+    )
+
+    env = {
+        **os.environ,
+        **upstream_urls("127.0.0.1", args.fake_port),
+        "OPENAI_API_KEY": "fake", "ASSISTANT_ID": "asst_fake",
+        "KAKAO_LOCAL_API_KEY": "fake", "WEATHER_API_KEY": "fake",
+        # 회원 수가 적은 부하 테스트에서 요청 제한에 걸리지 않도록 합니다.
+        "RATE_LIMIT_REQUESTS_PER_MINUTE": "1000000", "RATE_LIMIT_TOKENS_PER_MINUTE": "1000000000",
+    }
+    env.update(value.split("=", 1) for value in args.app_env)
+    app = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.app_port),
+         "--log-level", "warning", "--no-access-log"],
+        cwd=ROOT, env=env,
+    )
+    return [fakes, app]
+
+
+def print_summary(rows: list[dict], elapsed: float):
+    print(f"\n{elapsed:.1f}s 동안")
+    print(f"{'endpoint':<34} {'reqs':>6} {'err':>5} {'rps':>7} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9}")
+    for row in rows:
+        print(f"{row['endpoint']:<34} {row['requests']:>6} {row['errors']:>5} {row['rps']:>7.1f} "
+              f"{row['p50Ms']:>9.1f} {row['p95Ms']:>9.1f} {row['p99Ms']:>9.1f}")
+
+
+async def run(args) -> list[dict]:
+    await wait_until_ready(f"http://127.0.0.1:{args.fake_port}/v1/assistants/asst_fake")
+    await wait_until_ready(f"http://127.0.0.1:{args.app_port}/health")
+
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.users * 2, max_keepalive_connections=args.users * 2)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.app_port}", limits=limits, timeout=120) as client:
+        started = time.monotonic()
+        stop_at = started + args.duration
+        await asyncio.gather(*(virtual_user(client, recorder, user, stop_at) for user in range(args.users)))
+        elapsed = time.monotonic() - started
+
+    rows = recorder.summary(elapsed)
+    print_summary(rows, elapsed)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=30, help="부하 시간(초)")
+    parser.add_argument("--app-port", type=int, default=8100)
+    parser.add_argument("--fake-port", type=int, default=9100)
+    parser.add_argument("--app-env", action="append", default=[], metavar="KEY=VALUE", help="앱에 넘길 설정")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    add_behavior_arguments(parser)
+    args = parser.parse_args()
+
+    processes = start_processes(args)
+    try:
+        rows = asyncio.run(run(args))
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"users": args.users, "duration": args.duration, "endpoints": rows}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
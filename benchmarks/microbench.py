@@ -0,0 +1,166 @@
+"""요청마다 실행되는 순수 함수들의 마이크로벤치마크
+
+- 측정값(호출 1회당 ns)은 benchmarks/baselines/microbench.json에 기준값으로 저장하고,
+  이후 실행 결과를 기준값과 비교해 느려진 항목을 찾습니다.
+- 기준값은 같은 기계에서 만든 것과 비교해야 의미가 있습니다.
+
+실행: python benchmarks/microbench.py                 # 측정 + 기준값과 비교 (느려지면 종료 코드 1)
+      python benchmarks/microbench.py --save          # 측정 결과를 기준값으로 저장
+      python benchmarks/microbench.py -k lamcproj     # 이름에 lamcproj가 들어간 항목만
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from typing import Callable
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from fastapi import FastAPI, HTTPException
+from openai.types.beta.threads import Message
+from starlette.requests import Request
+
+from app.api.openai.chatbot import ThreadStatus, message_to_dict
+from app.api.weather.weather import LamcParameter, lamcproj, parse_nowcast_items
+from app.core.globalException import add_exception_handlers
+from app.core.ratelimit import RateLimitExceeded
+from app.models.error import ErrorDetail
+from app.utils.response import create_response
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baselines", "microbench.json")
+
+# 기상청 초단기실황 응답 item (정수 / 실수 / 음수가 섞여 있음)
+NOWCAST_ITEMS = [
+    {"baseDate": "20241014", "baseTime": "1500", "category": category, "nx": 60, "ny": 127, "obsrValue": value}
+    for category, value in (("PTY", "0"), ("REH", "55"), ("RN1", "0"), ("T1H", "12.3"),
+                            ("UUU", "-1.2"), ("VEC", "310"), ("VVV", "0.8"), ("WSD", "1.5"))
+]
+
+
+def make_message() -> Message:
+    return Message.model_validate({
+        "id": "msg_bench", "object": "thread.message", "created_at": 1729000000, "thread_id": "thread_bench",
+        "role": "assistant", "status": "completed", "attachments": [], "metadata": {},
+        "content": [{"type": "text", "text": {"value": "물은 흙 표면이 마르면 충분히 주세요.", "annotations": []}}],
+    })
+
+
+def run_handler(handler, request: Request, exc: Exception):
+    """await할 일이 없는 예외 처리기 코루틴을 이벤트 루프 없이 실행합니다."""
+    coroutine = handler(request, exc)
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("예외 처리기가 실제로 대기했습니다.")
+
+
+def benchmarks() -> dict[str, Callable[[], object]]:
+    """이름 -> 인자 없는 측정 함수"""
+    param = LamcParameter()
+    status = ThreadStatus()
+    message = make_message()
+
+    app = FastAPI()
+    add_exception_handlers(app)
+    request = Request({"type": "http", "method": "POST", "path": "/members/1/threads/thread_bench",
+                       "headers": [], "query_string": b""})
+    value_error = ValueError("메시지가 누락되었습니다.")
+    http_error = HTTPException(status_code=404, detail="주소가 올바르지 않습니다.")
+    rate_limited = RateLimitExceeded("요청이 너무 많습니다.", 2.5)
+
+    return {
+        "lamcproj": lambda: lamcproj(127.1138, 36.8195, 0, param),
+        "get_sky_condition": lambda: status.get_sky_condition(5),
+        "get_wind_direction": lambda: status.get_wind_direction("310"),
+        "parse_nowcast_items": lambda: parse_nowcast_items(NOWCAST_ITEMS),
+        "message_to_dict": lambda: message_to_dict(message),
+        "create_response_ok": lambda: create_response(
+            status_code=200, message="날씨 정보를 성공적으로 조회했습니다.",
+            data={"T1H": 12.3, "RN1": 0, "REH": 55, "PTY": 0, "VEC": 310, "WSD": 1.5}),
+        "create_response_error": lambda: create_response(
+            status_code=404, message="주소를 찾을 수 없습니다.",
+            error=ErrorDetail(code="NOT_FOUND", message="주소가 올바르지 않음", details="Invalid address").to_dict()),
+        "handler_value_error": lambda: run_handler(app.exception_handlers[ValueError], request, value_error),
+        "handler_http_exception": lambda: run_handler(app.exception_handlers[HTTPException], request, http_error),
+        "handler_rate_limit": lambda: run_handler(app.exception_handlers[RateLimitExceeded], request, rate_limited),
+    }
+
+
+def measure(fn: Callable[[], object], repeat: int, min_time: float) -> dict:
+    """호출 1회당 시간(ns)의 중앙값과 최솟값"""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    per_call = [total / number * 1e9 for total in timer.repeat(repeat=repeat, number=number)]
+    return {"medianNs": statistics.median(per_call), "minNs": min(per_call), "number": number}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """기준값보다 tolerance배 넘게 느려진 항목"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        ratio = result["medianNs"] / base["medianNs"]
+        result["vsBaseline"] = round(ratio, 3)
+        if ratio > tolerance:
+            regressions.append(f"{name}: {base['medianNs']:.0f}ns -> {result['medianNs']:.0f}ns ({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="keyword", default="", help="이름에 이 문자열이 들어간 항목만 측정")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.2, help="반복 1회에 쓰는 최소 시간(초)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="측정 결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=1.3, help="이 배수보다 느려지면 회귀로 판단")
+    args = parser.parse_args()
+
+    results = {
+        name: measure(fn, args.repeat, args.min_time)
+        for name, fn in benchmarks().items() if args.keyword in name
+    }
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+
+    print(f"{'benchmark':<26} {'median(ns)':>11} {'min(ns)':>10} {'vs base':>8}")
+    for name, result in results.items():
+        ratio = f"{result['vsBaseline']:.2f}x" if "vsBaseline" in result else "-"
+        print(f"{name:<26} {result['medianNs']:>11.0f} {result['minNs']:>10.0f} {ratio:>8}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": f"{platform.system()} {platform.machine()}",
+                "results": {name: {key: round(value, 1) if key != "number" else value
+                                   for key, value in result.items() if key != "vsBaseline"}
+                            for name, result in results.items()},
+            }, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"\n기준값을 저장했습니다: {os.path.relpath(args.baseline, ROOT)}")
+    elif regressions:
+        print("\n기준값보다 느려진 항목:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
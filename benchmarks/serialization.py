@@ -0,0 +1,117 @@
+"""채팅방 메시지 목록 응답의 직렬화 비용 비교
+
+- 이전 방식: 메시지마다 pydantic 모델 + dict 생성, 표준 json 기반 JSONResponse
+- 현재 방식: 메시지를 바로 dict로 변환, orjson 기반 create_response
+
+실행: python benchmarks/serialization.py [--repeat 200]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from enum import Enum
+
+from fastapi.responses import JSONResponse
+from openai.types.beta.threads import Message
+from pydantic import BaseModel, Field
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from app.api.openai.chatbot import message_to_dict
+from app.utils.response import create_response
+
+THREAD_SIZES = (10, 100, 1000)
+
+
+class Role(str, Enum):
+    USER = "user"
+    ASSITANT = "assistant"
+
+
+class MessageData(BaseModel):
+    """이전 get_thread에서 메시지마다 만들던 모델"""
+    role: Role = Field(..., description="메시지 작성자 (assistant 또는 user)")
+    text: str = Field(..., description="메시지 내용")
+
+    def to_dict(self):
+        return {
+            "role": self.role,
+            "text": self.text,
+        }
+
+
+def make_messages(count: int) -> list[Message]:
+    """OpenAI messages.list 결과와 같은 모양의 메시지 목록"""
+    text = "감자 싹이 났는데 물은 얼마나 자주 줘야 하나요? " * 8
+    return [
+        Message.model_validate({
+            "id": f"msg_{i:06d}",
+            "object": "thread.message",
+            "created_at": 1729000000 + i,
+            "thread_id": "thread_benchmark",
+            "role": "user" if i % 2 == 0 else "assistant",
+            "status": "completed",
+            "content": [{"type": "text", "text": {"value": text, "annotations": []}}],
+            "attachments": [],
+            "metadata": {},
+        })
+        for i in range(count)
+    ]
+
+
+def legacy_response(messages: list[Message]):
+    messages_data = [
+        MessageData(
+            role=Role(message.role),
+            text=message.content[0].text.value if message.content else "",
+        ).to_dict()
+        for message in messages
+    ]
+    return JSONResponse(status_code=200, content={
+        "message": "채팅방 정보를 가져왔습니다.",
+        "data": {"threadId": "thread_benchmark", "messages": messages_data},
+    })
+
+
+def fast_response(messages: list[Message]):
+    return create_response(
+        status_code=200,
+        message="채팅방 정보를 가져왔습니다.",
+        data={"threadId": "thread_benchmark", "messages": [message_to_dict(message) for message in messages]},
+    )
+
+
+def measure(fn, messages: list[Message], repeat: int) -> float:
+    """한 번 응답을 만드는 데 걸린 시간(ms)의 최솟값"""
+    timings = timeit.repeat(lambda: fn(messages), number=1, repeat=repeat)
+    return min(timings) * 1000
+
+
+def run(repeat: int) -> list[dict]:
+    results = []
+    for size in THREAD_SIZES:
+        messages = make_messages(size)
+        # 두 방식의 응답 내용이 같은지 먼저 확인합니다.
+        assert json.loads(legacy_response(messages).body) == json.loads(fast_response(messages).body)
+        legacy = measure(legacy_response, messages, repeat)
+        fast = measure(fast_response, messages, repeat)
+        results.append({"messages": size, "legacyMs": legacy, "fastMs": fast, "speedup": legacy / fast})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="크기별 측정 횟수")
+    args = parser.parse_args()
+
+    print(f"{'messages':>8} {'legacy(ms)':>11} {'fast(ms)':>9} {'speedup':>8}")
+    for result in run(args.repeat):
+        print(f"{result['messages']:>8} {result['legacyMs']:>11.3f} {result['fastMs']:>9.3f} {result['speedup']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
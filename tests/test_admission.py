@@ -0,0 +1,110 @@
+import sys
+import os
+import asyncio
+import time
+from types import SimpleNamespace
+import pytest
+from fastapi import FastAPI, Depends, status
+from httpx import AsyncClient
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import admission
+from app.core.admission import AdaptiveLimiter, LoadShedError
+from app.core.bulkhead import Bulkhead
+from app.core.upstream import _call
+from app.core.globalException import add_exception_handlers
+
+
+# 1. 한도를 넘은 요청은 대기열이 차면 즉시 거절
+@pytest.mark.asyncio
+async def test_sheds_when_queue_is_full():
+    limiter = AdaptiveLimiter("test", initial_limit=1, min_limit=1, max_queue=1, queue_timeout=1)
+    await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+
+    with pytest.raises(LoadShedError):
+        await limiter.acquire()
+    assert limiter.shed_count == 1
+
+    limiter.release()
+    await waiting
+    assert limiter.in_flight == 1 and limiter.queue_depth == 0
+
+
+# 2. 대기 시간이 지나면 거절
+@pytest.mark.asyncio
+async def test_sheds_after_queue_timeout():
+    limiter = AdaptiveLimiter("test", initial_limit=1, min_limit=1, max_queue=4, queue_timeout=0.05)
+    await limiter.acquire()
+    with pytest.raises(LoadShedError):
+        await limiter.acquire()
+    assert limiter.queue_depth == 0
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+# 3. 업스트림 지연이 늘면 한도 감소, 정상이면 다시 증가
+def test_limit_adapts_to_latency():
+    limiter = AdaptiveLimiter("test", ("kma", "openai"), initial_limit=10, min_limit=2)
+    limiter.in_flight = 10
+    for _ in range(5):
+        limiter.observe("kma", 0.05)
+        limiter.observe("openai", 1.0)
+    for _ in range(10):
+        limiter.observe("kma", 0.5)
+    assert limiter.limit < 10
+
+    reduced = limiter.limit
+    limiter.in_flight = int(reduced)
+    for _ in range(200):
+        limiter.observe("kma", 0.05)
+    assert limiter.limit > reduced
+
+
+def test_latency_comes_from_upstream_calls(monkeypatch):
+    """
+    요청이 슬롯을 오래 잡고 있어도 한도는 그대로이고, 의존하는 업스트림 호출(_call)의 지연만 반영되는지 테스트합니다.
+    """
+    limiter = AdaptiveLimiter("test", ("kma",), initial_limit=4, min_limit=1)
+    monkeypatch.setitem(admission.limiters, "test", limiter)
+    bulkhead = Bulkhead("kma", max_workers=1, max_queue=0)
+
+    def call(seconds):
+        time.sleep(seconds)
+        return SimpleNamespace(status_code=200)
+
+    for _ in range(3):
+        _call(bulkhead, None, "GET /getUltraSrtNcst", None, call, 0.01)
+    _call(Bulkhead("openai", max_workers=1, max_queue=0), None, "GET /threads", None, call, 0.2)
+    assert set(limiter.snapshot()["latency"]) == {"kma"} and limiter.limit == 4
+
+    for _ in range(3):
+        _call(bulkhead, None, "GET /getUltraSrtNcst", None, call, 0.1)
+    assert limiter.limit < 4
+
+
+# 4. 거절 응답은 503과 Retry-After
+@pytest.mark.asyncio
+async def test_shed_response_is_rendered():
+    app = FastAPI()
+    limiter = AdaptiveLimiter("test", initial_limit=1, min_limit=1, max_queue=0)
+
+    async def admit():
+        async with limiter.slot():
+            yield
+
+    @app.get("/busy", dependencies=[Depends(admit)])
+    async def busy():
+        return {}
+
+    add_exception_handlers(app)
+    await limiter.acquire()
+    async with AsyncClient(app=app, base_url="http://testserver") as ac:
+        response = await ac.get("/busy")
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "2"
+    assert response.json()["error"]["code"] == "OVERLOADED"
@@ -0,0 +1,51 @@
+import sys
+import os
+import time
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.openai.answer_cache import AnswerCache, normalize_question
+
+
+# 1. 비슷한 질문은 같은 답변 반환
+def test_similar_question_hits():
+    """
+    띄어쓰기나 조사가 조금 다른 질문도 같은 작물이면 저장된 답변을 반환하는지 테스트합니다.
+    """
+    cache = AnswerCache()
+    cache.put("감자", "감자 물 주기 주기는?", "3~4일 간격으로 주세요.")
+    assert cache.get("감자", "감자 물주기 주기") == "3~4일 간격으로 주세요."
+
+
+# 2. 다른 작물이나 다른 질문은 캐시 미스
+def test_other_crop_or_question_misses():
+    cache = AnswerCache()
+    cache.put("감자", "감자 물 주기 주기", "3~4일 간격으로 주세요.")
+    assert cache.get("고추", "감자 물 주기 주기") is None
+    assert cache.get("감자", "고추 비료 언제") is None
+
+
+# 3. TTL 만료
+def test_expired_entry_misses():
+    cache = AnswerCache(ttl=0.05)
+    cache.put("고추", "고추 비료 언제", "정식 후 2주 뒤에 주세요.")
+    time.sleep(0.1)
+    assert cache.get("고추", "고추 비료 언제") is None
+    assert len(cache) == 0
+
+
+# 4. 최대 개수를 넘으면 가장 오래 쓰이지 않은 항목 제거
+def test_lru_eviction():
+    cache = AnswerCache(max_entries=2)
+    cache.put("감자", "감자 물 주기", "a")
+    cache.put("고추", "고추 비료 언제", "b")
+    assert cache.get("감자", "감자 물 주기") == "a"
+    cache.put("배추", "배추 수확 시기", "c")
+    assert cache.get("고추", "고추 비료 언제") is None
+    assert cache.get("감자", "감자 물 주기") == "a"
+    assert len(cache) == 2
+
+
+def test_normalize_question():
+    assert normalize_question("감자 물, 언제 줘요?") == "감자물언제줘요"
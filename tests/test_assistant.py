@@ -0,0 +1,371 @@
+import sys
+import os
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import httpx
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.openai import chatbot
+from app.api.openai.answer_cache import AnswerCache
+from app.api.openai.context import ThreadContext
+from app.api.openai.tools import ToolRegistry
+from app.api.weather.history import KST
+from app.core.bulkhead import Bulkhead, bulkheads
+from app.core.config import settings
+from app.core.deadline import DeadlineMiddleware
+from app.core.globalException import add_exception_handlers
+
+THREAD_ID = "thread_stub"
+URI = "/members/member_1/threads"
+
+
+def text_message(role: str, text: str, created_at: int):
+    return SimpleNamespace(role=role, created_at=created_at, content=[SimpleNamespace(text=SimpleNamespace(value=text))])
+
+
+def run(status: str, tool_calls=None):
+    required_action = None
+    if tool_calls is not None:
+        required_action = SimpleNamespace(submit_tool_outputs=SimpleNamespace(tool_calls=tool_calls))
+    return SimpleNamespace(id="run_stub", status=status, required_action=required_action)
+
+
+def tool_call(call_id: str, name: str, arguments: dict):
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=json.dumps(arguments)))
+
+
+class FakeOpenAI:
+    """테스트에 쓰는 OpenAI API만 흉내 내고, 호출을 (이름, 인자) 순서대로 기록하는 가짜 클라이언트"""
+
+    def __init__(self):
+        self.calls = []
+        self.messages = []
+        # runs.retrieve가 차례로 돌려줄 run 상태 (마지막 상태는 계속 반복)
+        self.runs = []
+        self.summary = "- 감자 싹이 났음"
+        self.beta = SimpleNamespace(threads=SimpleNamespace(
+            update=self._recorder("threads.update"),
+            messages=SimpleNamespace(list=self._list_messages, create=self._recorder("messages.create")),
+            runs=SimpleNamespace(
+                create=self._recorder("runs.create"),
+                retrieve=self._retrieve_run,
+                submit_tool_outputs=self._recorder("runs.submit_tool_outputs"),
+                cancel=self._recorder("runs.cancel"),
+            ),
+        ))
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._complete))
+
+    def _recorder(self, name: str, result=None):
+        def record(**kwargs):
+            self.calls.append((name, kwargs))
+            return result
+        return record
+
+    def _retrieve_run(self, thread_id, run_id):
+        self.calls.append(("runs.retrieve", {"thread_id": thread_id, "run_id": run_id}))
+        return self.runs.pop(0) if len(self.runs) > 1 else self.runs[0]
+
+    def _list_messages(self, thread_id, order="asc", limit=20):
+        self.calls.append(("messages.list", {"thread_id": thread_id}))
+        messages = self.messages if order == "asc" else list(reversed(self.messages))
+        return SimpleNamespace(data=messages[:limit])
+
+    def _complete(self, **kwargs):
+        self.calls.append(("chat.completions.create", kwargs))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self.summary))])
+
+    def called(self, name: str) -> list[dict]:
+        return [kwargs for call, kwargs in self.calls if call == name]
+
+
+@pytest.fixture
+def openai_client(monkeypatch):
+    fake = FakeOpenAI()
+    monkeypatch.setattr(chatbot, "client", fake)
+    yield fake
+    chatbot.context_store.delete(THREAD_ID)
+
+
+@pytest.fixture
+def chat_app(openai_client, monkeypatch):
+    """가짜 OpenAI 클라이언트와 항상 성공하는 백엔드로 채팅방 API만 띄웁니다."""
+    backend = []
+
+    def patch(url, json):
+        backend.append(json)
+        return SimpleNamespace(status_code=200, json=dict)
+
+    monkeypatch.setattr(chatbot, "backend_http", SimpleNamespace(patch=patch))
+    app = FastAPI()
+    add_exception_handlers(app)
+    app.include_router(chatbot.router, prefix="/members/{memberId}/threads")
+    return app, backend
+
+
+# 1. 대화 요약
+def test_refresh_synopsis_keeps_newer_context(openai_client, monkeypatch):
+    """
+    요약하는 동안 바뀐 주소/작물 정보를 덮어쓰지 않고 요약 항목만 저장하는지 테스트합니다.
+    """
+    monkeypatch.setattr(settings, "RUN_CONTEXT_LAST_MESSAGES", 2)
+    openai_client.messages = [
+        text_message("user", "감자 싹이 났어요", 100),
+        text_message("assistant", "축하드려요", 101),
+        text_message("user", "물은 언제 줘요?", 102),
+        text_message("assistant", "흙이 마르면 주세요", 103),
+    ]
+    scheduled = ThreadContext(address="서울 중구", crop="감자", cropId=1)
+    # 요약을 예약한 뒤 다음 메시지와 PATCH가 먼저 저장되었습니다.
+    chatbot.context_store.set(THREAD_ID, ThreadContext(address="제주시", crop="감자", cropId=1, turns_since_summary=1))
+
+    chatbot.refresh_synopsis(THREAD_ID, scheduled)
+
+    saved = chatbot.context_store.get(THREAD_ID)
+    assert saved.address == "제주시" and saved.turns_since_summary == 1
+    assert saved.synopsis == "- 감자 싹이 났음" and saved.summarized_until == 101
+    assert openai_client.called("threads.update")[0]["metadata"]["address"] == "제주시"
+
+    # 이미 요약한 메시지만 남았으면 다시 요약하지 않습니다.
+    chatbot.refresh_synopsis(THREAD_ID, scheduled)
+    assert len(openai_client.called("chat.completions.create")) == 1
+
+
+def test_refresh_synopsis_without_stored_context(openai_client, monkeypatch):
+    monkeypatch.setattr(settings, "RUN_CONTEXT_LAST_MESSAGES", 1)
+    openai_client.messages = [text_message("user", "감자 싹이 났어요", 100), text_message("assistant", "축하드려요", 101)]
+
+    chatbot.refresh_synopsis(THREAD_ID, ThreadContext(address="서울 중구", crop="감자"))
+
+    saved = chatbot.context_store.get(THREAD_ID)
+    assert saved.address == "서울 중구" and saved.summarized_until == 100
+
+
+# 2. tool 호출 처리
+def test_wait_for_run_submits_tool_outputs(openai_client, monkeypatch):
+    """
+    requires_action이면 등록된 tool을 실행해 결과를 제출하고, 등록되지 않은 tool은 에러를 결과로 제출한 뒤 계속 기다리는지 테스트합니다.
+    """
+    registry = ToolRegistry(max_workers=2)
+
+    @registry.register(name="get_weather", description="날씨", parameters={"type": "object"})
+    def get_weather(address):
+        return {"address": address, "temp": 18.0}
+
+    monkeypatch.setattr(chatbot, "tool_registry", registry)
+    openai_client.runs = [
+        run("requires_action", [tool_call("call_1", "get_weather", {"address": "서울 중구"}), tool_call("call_2", "unknown", {})]),
+        run("completed"),
+    ]
+
+    assert chatbot.wait_for_run(THREAD_ID, "run_stub").status == "completed"
+
+    submitted = openai_client.called("runs.submit_tool_outputs")
+    assert len(submitted) == 1 and submitted[0]["run_id"] == "run_stub"
+    weather, unknown = submitted[0]["tool_outputs"]
+    assert weather["tool_call_id"] == "call_1" and json.loads(weather["output"]) == {"address": "서울 중구", "temp": 18.0}
+    assert unknown["tool_call_id"] == "call_2" and "error" in json.loads(unknown["output"])
+    assert openai_client.called("runs.cancel") == []
+
+
+@pytest.mark.asyncio
+async def test_run_is_cancelled_when_deadline_expires_in_openai_call(chat_app, monkeypatch):
+    """
+    실제 OpenAI 클라이언트와 bulkhead transport로 run 조회 중 deadline이 지나면, SDK 재시도 없이 run을 취소하고 504를 반환하는지 테스트합니다.
+    """
+    app, _ = chat_app
+    app.add_middleware(DeadlineMiddleware)
+    monkeypatch.setattr(chatbot, "client", chatbot.create_openai_client())
+    monkeypatch.setattr(chatbot, "_assistant", SimpleNamespace(id="asst_stub"))
+    chatbot.context_store.set(THREAD_ID, ThreadContext(crop="감자", cropId=1, memberId="member_1"))
+
+    requests_sent = []
+    release = threading.Event()
+
+    def handle_request(self, request):
+        requests_sent.append((request.method, request.url.path))
+        if request.url.path.endswith("/runs/run_stub"):
+            # run 조회가 요청 deadline보다 오래 걸립니다.
+            release.wait(5)
+            return httpx.Response(200, json={"id": "run_stub", "object": "thread.run", "status": "in_progress"})
+        if request.url.path.endswith("/runs"):
+            return httpx.Response(200, json={"id": "run_stub", "object": "thread.run", "status": "queued"})
+        if request.url.path.endswith("/cancel"):
+            return httpx.Response(200, json={"id": "run_stub", "object": "thread.run", "status": "cancelling"})
+        return httpx.Response(200, json={"id": THREAD_ID, "object": "thread", "created_at": 0, "metadata": {}})
+
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", handle_request)
+
+    started = time.monotonic()
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.post(
+                f"{URI}/{THREAD_ID}", json={"message": "감자 잎이 노랗게 변했어요", "useCache": False},
+                headers={"X-Request-Timeout": "0.5"},
+            )
+    finally:
+        release.set()
+    elapsed = time.monotonic() - started
+
+    assert response.status_code == 504
+    assert response.json()["error"]["code"] == "DEADLINE_EXCEEDED"
+    assert elapsed < 1
+    retrieves = [path for method, path in requests_sent if method == "GET" and path.endswith("/runs/run_stub")]
+    assert len(retrieves) == 1
+    assert any(path.endswith(f"/threads/{THREAD_ID}/runs/run_stub/cancel") for _, path in requests_sent)
+
+
+@pytest.mark.asyncio
+async def test_full_openai_bulkhead_is_shed_without_retry(chat_app, monkeypatch):
+    """
+    OpenAI bulkhead가 가득 차면 SDK 재시도 없이 바로 503을 반환하는지 테스트합니다.
+    """
+    app, _ = chat_app
+    bulkhead = Bulkhead("openai", max_workers=1, max_queue=0)
+    monkeypatch.setitem(bulkheads, "openai", bulkhead)
+    monkeypatch.setattr(chatbot, "client", chatbot.create_openai_client())
+    release = threading.Event()
+    bulkhead.submit(release.wait, 5)
+
+    started = time.monotonic()
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.post(f"{URI}/{THREAD_ID}", json={"message": "감자 잎이 노랗게 변했어요"})
+    finally:
+        release.set()
+    elapsed = time.monotonic() - started
+
+    assert response.status_code == 503
+    assert response.json()["error"]["code"] == "OVERLOADED"
+    assert elapsed < 0.5
+    assert bulkhead.rejected == 1
+
+
+# 3. 답변 캐시
+def test_cached_answer_is_scoped_to_region_and_stage(openai_client, monkeypatch):
+    """
+    같은 작물이라도 격자나 생육 단계가 다른 회원에게는 저장된 답변을 반환하지 않는지 테스트합니다.
+    """
+    monkeypatch.setattr(chatbot, "answer_cache", AnswerCache())
+    monkeypatch.setattr(chatbot, "retrieve_thread", lambda thread_id: SimpleNamespace(id=thread_id))
+    monkeypatch.setattr(chatbot, "address_cell", {"서울 중구": (60, 127), "제주시": (53, 38)}.get)
+    today = datetime.now(KST).date()
+    sprouting = (today - timedelta(days=10)).isoformat()
+    farms = {
+        "thread_seoul": ThreadContext(address="서울 중구", crop="감자", plantedAt=sprouting, memberId="member_1"),
+        "thread_neighbor": ThreadContext(address="서울 중구", crop="감자", plantedAt=sprouting, memberId="member_2"),
+        "thread_jeju": ThreadContext(address="제주시", crop="감자", plantedAt=sprouting, memberId="member_3"),
+        "thread_harvest": ThreadContext(
+            address="서울 중구", crop="감자", plantedAt=(today - timedelta(days=100)).isoformat(), memberId="member_4"
+        ),
+    }
+    for thread_id, context in farms.items():
+        chatbot.context_store.set(thread_id, context)
+    try:
+        chatbot.answer_cache.put(chatbot.answer_scope(farms["thread_seoul"]), "감자 잎이 노랗게 변했어요", "물을 줄이세요.")
+        replies = {
+            thread_id: chatbot.answer_without_run(thread_id, "감자 잎이 노랗게 변했어요", True)[2] for thread_id in farms
+        }
+    finally:
+        for thread_id in farms:
+            chatbot.context_store.delete(thread_id)
+
+    assert replies == {
+        "thread_seoul": "물을 줄이세요.",
+        "thread_neighbor": "물을 줄이세요.",
+        "thread_jeju": None,
+        "thread_harvest": None,
+    }
+
+
+# 4. 농장 정보 수정
+@pytest.mark.asyncio
+async def test_patch_updates_metadata_without_run(chat_app, openai_client):
+    """
+    PATCH는 run을 만들지 않고 Thread metadata만 바꾸며, 이름 없이 작물 ID만 바뀌면 이전 작물명을 지우는지 테스트합니다.
+    """
+    app, backend = chat_app
+    chatbot.context_store.set(THREAD_ID, ThreadContext(address="서울 중구", crop="감자", cropId=1, plantedAt="2024-03-01"))
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        moved = await ac.patch(f"{URI}/{THREAD_ID}", json={"address": "제주시", "cropId": 1})
+        replanted = await ac.patch(f"{URI}/{THREAD_ID}", json={"address": "제주시", "cropId": 2, "plantedAt": "2024-05-01"})
+
+    assert moved.status_code == 200 and replanted.status_code == 200
+    assert backend[1] == {"address": "제주시", "cropId": 2, "plantedAt": "2024-05-01", "threadId": THREAD_ID}
+    assert openai_client.called("runs.create") == [] and openai_client.called("messages.create") == []
+
+    first, second = (call["metadata"] for call in openai_client.called("threads.update"))
+    assert first == {"address": "제주시", "crop": "감자", "cropId": "1", "plantedAt": "2024-03-01", "memberId": "member_1"}
+    assert second == {"address": "제주시", "cropId": "2", "plantedAt": "2024-05-01", "memberId": "member_1"}
+    assert chatbot.context_store.get(THREAD_ID).crop is None
+
+
+@pytest.mark.asyncio
+async def test_patch_with_crop_name(chat_app, openai_client):
+    app, _ = chat_app
+    chatbot.context_store.set(THREAD_ID, ThreadContext(address="서울 중구", crop="감자", cropId=1))
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.patch(f"{URI}/{THREAD_ID}", json={"address": "서울 중구", "cropId": 2, "cropName": "고추"})
+        invalid = await ac.patch(f"{URI}/{THREAD_ID}", json={"address": "서울 중구", "cropId": 3, "cropName": "고추!"})
+
+    assert response.status_code == 200 and invalid.status_code == 422
+    saved = chatbot.context_store.get(THREAD_ID)
+    assert (saved.crop, saved.cropId) == ("고추", 2)
+
+
+# 5. 날씨 질문은 run 없이 답변
+@pytest.mark.asyncio
+async def test_send_message_answers_weather_locally(chat_app, openai_client, monkeypatch):
+    """
+    날씨 질문은 run을 만들지 않고 서버의 날씨 정보로 답한 뒤, 질문과 답변을 채팅방 기록에 남기는지 테스트합니다.
+    """
+    app, _ = chat_app
+    chatbot.context_store.set(THREAD_ID, ThreadContext(address="서울 중구", crop="감자", cropId=1, memberId="member_1"))
+    monkeypatch.setattr(chatbot, "retrieve_thread", lambda thread_id: SimpleNamespace(id=thread_id))
+    monkeypatch.setattr(chatbot, "describe_current_weather", lambda address: f"{address}의 기온은 18℃입니다.")
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.post(f"{URI}/{THREAD_ID}", json={"message": "오늘 날씨 어때?"})
+
+    assert response.status_code == 200
+    assert response.json()["data"] == {"threadId": THREAD_ID, "text": "서울 중구의 기온은 18℃입니다."}
+    assert openai_client.called("runs.create") == []
+    assert [(call["role"], call["content"]) for call in openai_client.called("messages.create")] == [
+        ("user", "오늘 날씨 어때?"), ("assistant", "서울 중구의 기온은 18℃입니다."),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_send_message_answers_status_with_growth_stage(chat_app, openai_client, monkeypatch):
+    """
+    상태 질문은 run 없이 날씨와 함께 생육 단계와 추천 작업을 답하는지 테스트합니다.
+    """
+    app, _ = chat_app
+    planted_at = (datetime.now(KST).date() - timedelta(days=10)).isoformat()
+    chatbot.context_store.set(THREAD_ID, ThreadContext(address="서울 중구", crop="감자", cropId=1, plantedAt=planted_at))
+    monkeypatch.setattr(chatbot, "retrieve_thread", lambda thread_id: SimpleNamespace(id=thread_id, created_at=1728864000))
+    monkeypatch.setattr(chatbot, "address_cell", lambda address: (60, 127))
+    weather = {
+        "temp": 18.0, "skyCondition": "맑음", "rainProbability": None, "rainfall": 0, "rainCondition": "비안옴",
+        "humidity": 50, "windSpeed": 1.0, "windDirection": "남",
+    }
+    monkeypatch.setattr(chatbot, "cell_weather", lambda nx, ny: (weather, None))
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.post(f"{URI}/{THREAD_ID}", json={"message": "우리 밭 상태 어때?"})
+
+    assert response.status_code == 200
+    text = response.json()["data"]["text"]
+    assert "기온은 18.0℃" in text
+    assert "감자은(는) 심은 지 10일째로 발아기 단계입니다." in text
+    assert "1. 싹이 올라올 때까지 흙이 마르지 않게 물 주기" in text
+    assert openai_client.called("runs.create") == []
@@ -0,0 +1,91 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import bulkhead as bulkhead_module
+from app.core.bulkhead import Bulkhead, BulkheadFull, reserve_request_threads
+
+
+# 1. 풀과 대기열이 가득 차면 즉시 거절
+def test_rejects_when_saturated():
+    """
+    느린 업스트림이 풀과 대기열을 모두 채우면 이후 호출은 기다리지 않고 거절되는지 테스트합니다.
+    """
+    bulkhead = Bulkhead("kma", max_workers=1, max_queue=1)
+    release = threading.Event()
+    threads = [threading.Thread(target=bulkhead.call, args=(release.wait,)) for _ in range(2)]
+    for t in threads:
+        t.start()
+    while bulkhead.pending < 2:
+        time.sleep(0.01)
+
+    snapshot = bulkhead.snapshot()
+    assert snapshot["active"] == 1 and snapshot["queued"] == 1
+
+    started = time.monotonic()
+    with pytest.raises(BulkheadFull):
+        bulkhead.call(lambda: None)
+    assert time.monotonic() - started < 0.1
+    assert bulkhead.snapshot()["rejected"] == 1
+
+    release.set()
+    for t in threads:
+        t.join()
+    assert bulkhead.snapshot()["completed"] == 2
+
+
+# 2. 다른 업스트림 풀은 영향을 받지 않음
+def test_other_bulkhead_is_isolated():
+    kma = Bulkhead("kma", max_workers=1, max_queue=0)
+    openai = Bulkhead("openai", max_workers=1, max_queue=0)
+    release = threading.Event()
+    t = threading.Thread(target=kma.call, args=(release.wait,))
+    t.start()
+    while kma.pending < 1:
+        time.sleep(0.01)
+
+    assert openai.call(lambda: "ok") == "ok"
+    release.set()
+    t.join()
+
+
+# 3. 업스트림 하나가 멈춰도 요청 스레드가 모자라지 않음
+@pytest.mark.asyncio
+async def test_hung_upstream_does_not_starve_request_threads(monkeypatch):
+    """
+    기상청 호출이 멈춰 풀과 대기열(anyio 기본 스레드 한도 40보다 많음)이 모두 차도 채팅 요청은 바로 처리되는지 테스트합니다.
+    """
+    kma = Bulkhead("kma", max_workers=8, max_queue=40)
+    openai = Bulkhead("openai", max_workers=2, max_queue=2)
+    monkeypatch.setattr(bulkhead_module, "bulkheads", {"kma": kma, "openai": openai})
+    assert reserve_request_threads() >= 48 + 4 + 40
+
+    release = threading.Event()
+    app = FastAPI()
+
+    @app.get("/weather")
+    def weather():
+        return kma.call(release.wait, 5)
+
+    @app.get("/chat")
+    def chat():
+        return openai.call(lambda: "ok")
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        hung = [asyncio.create_task(ac.get("/weather")) for _ in range(48)]
+        while kma.pending < 48:
+            await asyncio.sleep(0.01)
+
+        response = await asyncio.wait_for(ac.get("/chat"), timeout=2)
+        assert response.json() == "ok"
+
+        release.set()
+        await asyncio.gather(*hung)
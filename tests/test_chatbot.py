@@ -370,7 +370,7 @@ async def test_send_message_ai_response_success():
     async with AsyncClient(app=app, base_url="http://testserver") as ac:
         payload = {
             "threadId": thread_id,
-            "message": "오늘 날씨는 어떤가요?"
+            "message": "감자 싹이 났는데 물은 얼마나 자주 줘야 하나요?"
         }
         response = await ac.post(f"{URI}/threads/{thread_id}", json=payload)
         assert response.is_success == True
@@ -398,7 +398,7 @@ async def test_send_message_ai_response_failed(mocker):
     async with AsyncClient(app=app, base_url="http://testserver") as ac:
         payload = {
             "threadId": thread_id,
-            "message": "오늘 날씨는 어떤가요?"
+            "message": "감자 싹이 났는데 물은 얼마나 자주 줘야 하나요?"
         }
         response = await ac.post(f"{URI}/threads/{thread_id}", json=payload)
         assert response.is_success == False
@@ -428,7 +428,7 @@ async def test_send_message_ai_response_cancelled(mocker):
     async with AsyncClient(app=app, base_url="http://testserver") as ac:
         payload = {
             "threadId": thread_id,
-            "message": "오늘 날씨는 어떤가요?"
+            "message": "감자 싹이 났는데 물은 얼마나 자주 줘야 하나요?"
         }
         response = await ac.post(f"{URI}/threads/{thread_id}", json=payload)
         assert response.is_success == False
@@ -457,7 +457,7 @@ async def test_send_message_ai_response_timeout(mocker):
     async with AsyncClient(app=app, base_url="http://testserver") as ac:
         payload = {
             "threadId": thread_id,
-            "message": "오늘 날씨는 어떤가요?"
+            "message": "감자 싹이 났는데 물은 얼마나 자주 줘야 하나요?"
         }
         response = await ac.post(f"{URI}/threads/{thread_id}", json=payload)
         assert response.is_success == False
@@ -486,7 +486,7 @@ async def test_send_message_no_ai_response(mocker):
     async with AsyncClient(app=app, base_url="http://testserver") as ac:
         payload = {
             "threadId": thread_id,
-            "message": "오늘 날씨는 어떤가요?"
+            "message": "감자 싹이 났는데 물은 얼마나 자주 줘야 하나요?"
         }
 
         response = await ac.post(f"{URI}/threads/{thread_id}", json=payload)
@@ -0,0 +1,57 @@
+import sys
+import os
+from datetime import date
+from types import SimpleNamespace
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.openai.context import ThreadContext, truncation_strategy, usage_to_dict
+
+
+# 1. 농장 정보와 요약은 run마다 고정 지시문으로 전달
+def test_farm_instructions():
+    context = ThreadContext(address="전라남도 고흥군 점암면", crop="감자", plantedAt="2024-11-01")
+    instructions = context.run_instructions()
+    assert "주소 : 전라남도 고흥군 점암면" in instructions
+    assert "작물 : 감자" in instructions
+    assert "[이전 대화 요약]" not in instructions
+
+    context.synopsis = "- 싹이 났음"
+    assert context.run_instructions().endswith("[이전 대화 요약]\n- 싹이 났음")
+
+
+def test_empty_context_has_no_instructions():
+    assert ThreadContext().run_instructions() is None
+
+
+# 2. truncation 전략
+def test_truncation_strategy():
+    assert truncation_strategy("last_messages", 10) == {"type": "last_messages", "last_messages": 10}
+    assert truncation_strategy("auto", 10) == {"type": "auto"}
+
+
+# 3. run 토큰 사용량
+def test_usage_to_dict():
+    usage = SimpleNamespace(prompt_tokens=120, completion_tokens=30, total_tokens=150)
+    assert usage_to_dict(usage) == {"promptTokens": 120, "completionTokens": 30, "totalTokens": 150}
+    assert usage_to_dict(None) is None
+
+
+# 4. Thread metadata 저장/복원
+def test_metadata_round_trip():
+    context = ThreadContext(address="충남 천안시", crop="고추", cropId=3, plantedAt="2024-11-01", synopsis="- 정식 완료")
+    metadata = context.to_metadata()
+    assert all(isinstance(value, str) and len(value) <= 512 for value in metadata.values())
+    restored = ThreadContext.from_metadata(metadata)
+    assert restored.address == "충남 천안시"
+    assert restored.cropId == 3
+    assert restored.synopsis == "- 정식 완료"
+
+
+# 5. 생육 단계와 현재 날씨는 run마다 전달
+def test_run_instructions_include_growth_stage_and_weather():
+    context = ThreadContext(address="충남 천안시", crop="고추", plantedAt="2024-11-01")
+    instructions = context.run_instructions(weather="맑음, 기온 3℃", today=date(2024, 11, 11))
+    assert "[생육 단계] 오늘은 작물을 심은 지 10일째입니다." in instructions
+    assert "[현재 날씨] 맑음, 기온 3℃" in instructions
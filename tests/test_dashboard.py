@@ -0,0 +1,170 @@
+import sys
+import os
+import threading
+import time
+from dataclasses import replace
+from types import SimpleNamespace
+import pytest
+from fastapi import FastAPI, HTTPException
+from httpx import AsyncClient
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.openai import chatbot
+from app.api.openai.context import ThreadContext
+from app.core.config import settings
+from app.core.globalException import add_exception_handlers
+
+URI = "/members/member_1/threads"
+
+FARMS = {
+    "thread_a": ThreadContext(address="서울 중구", crop="감자", cropId=1, plantedAt="2024-03-01", memberId="member_1"),
+    "thread_b": ThreadContext(address="서울 중구 을지로", crop="고추", cropId=2, plantedAt="2024-05-01", memberId="member_1"),
+    "thread_c": ThreadContext(address="제주시", crop="딸기", cropId=3, plantedAt="2024-09-10", memberId="member_1"),
+    "thread_x": ThreadContext(address="부산 해운대구", crop="상추", cropId=4, plantedAt="2024-09-10", memberId="member_1"),
+    "thread_other": ThreadContext(address="대전 서구", crop="배추", cropId=5, plantedAt="2024-09-10", memberId="member_2"),
+    "thread_legacy": ThreadContext(address="서울 중구", crop="감자", cropId=1, plantedAt="2024-03-01"),
+    "thread_legacy_other": ThreadContext(address="대전 서구", crop="배추", cropId=5, plantedAt="2024-09-10"),
+}
+# 백엔드에 기록된 회원별 채팅방
+MEMBER_THREADS = {
+    "member_1": ["thread_a", "thread_b", "thread_legacy"],
+    "member_2": ["thread_other", "thread_legacy_other"],
+}
+# OpenAI에 없는 채팅방
+MISSING = {"thread_x"}
+CELLS = {"서울 중구": (60, 127), "서울 중구 을지로": (60, 127), "제주시": (53, 38)}
+
+
+@pytest.fixture
+def dashboard(monkeypatch):
+    """
+    채팅방 조회, 주소 변환, 날씨 조회를 가짜로 바꾸고 호출 수와 최대 동시 실행 수를 기록합니다.
+    """
+    calls = {"thread": 0, "weather": [], "active": 0, "peak": 0, "backend": 0, "saved": []}
+    lock = threading.Lock()
+
+    def retrieve_thread(thread_id):
+        with lock:
+            calls["thread"] += 1
+            calls["active"] += 1
+            calls["peak"] = max(calls["peak"], calls["active"])
+        time.sleep(0.02)
+        with lock:
+            calls["active"] -= 1
+        if thread_id in MISSING:
+            raise HTTPException(status_code=404, detail="채팅방을 찾을 수 없습니다.")
+        return SimpleNamespace(id=thread_id, created_at=1728864000)
+
+    def cell_weather(nx, ny):
+        calls["weather"].append((nx, ny))
+        if (nx, ny) == (53, 38):
+            raise HTTPException(status_code=500, detail="날씨 정보를 가져오지 못했습니다")
+        weather = {"temp": 18.0, "humidity": 90, "rainProbability": 70.0, "rainfall": 0, "windSpeed": 1.0}
+        return weather, None
+
+    def backend_get(url):
+        calls["backend"] += 1
+        member_id = url.split("/members/")[1].split("/")[0]
+        threads = [{"threadId": thread_id} for thread_id in MEMBER_THREADS.get(member_id, [])]
+        return SimpleNamespace(status_code=200, json=lambda: {"data": threads})
+
+    monkeypatch.setattr(chatbot, "retrieve_thread", retrieve_thread)
+    monkeypatch.setattr(chatbot, "fetch_thread_context", lambda thread_id: replace(FARMS[thread_id]))
+    monkeypatch.setattr(chatbot, "save_thread_context", lambda thread_id, context: calls["saved"].append((thread_id, context)))
+    monkeypatch.setattr(chatbot, "backend_http", SimpleNamespace(get=backend_get))
+    monkeypatch.setattr(chatbot, "address_cell", CELLS.__getitem__)
+    monkeypatch.setattr(chatbot, "cell_weather", cell_weather)
+    monkeypatch.setattr(settings, "DASHBOARD_CONCURRENCY", 2)
+
+    app = FastAPI()
+    add_exception_handlers(app)
+    app.include_router(chatbot.router, prefix="/members/{memberId}/threads")
+    return app, calls
+
+
+# 1. 여러 채팅방 상태를 한 번에 조회
+@pytest.mark.asyncio
+async def test_dashboard_dedupes_weather_and_returns_partial_results(dashboard):
+    """
+    같은 격자의 날씨는 한 번만 조회하고, 없는 채팅방은 오류로, 날씨만 실패한 채팅방은 날씨 없이 반환하는지 테스트합니다.
+    """
+    app, calls = dashboard
+    chatbot.context_store.set("thread_a", FARMS["thread_a"])
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.get(f"{URI}/status", params={"threadIds": "thread_a,thread_b,thread_c,thread_x,thread_a"})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["count"] == 4 and data["failed"] == 1
+    threads = {thread["threadId"]: thread for thread in data["threads"]}
+    assert [thread["threadId"] for thread in data["threads"]] == ["thread_a", "thread_b", "thread_c", "thread_x"]
+
+    assert sorted(calls["weather"]) == [(53, 38), (60, 127)]
+    assert calls["peak"] <= 2
+
+    seoul = threads["thread_b"]
+    assert seoul["crop"] == "고추" and seoul["error"] is None
+    assert seoul["status"]["weather"]["rainProbability"] == 70.0
+    assert seoul["status"]["recommendedActions"]["0"].startswith("강수확률 70%")
+    assert seoul["status"]["createdAt"] == {"year": 2024, "month": 10, "day": 14}
+
+    jeju = threads["thread_c"]
+    assert jeju["status"]["weather"] is None and jeju["error"]["code"] == "INTERNAL_SERVER_ERROR"
+    assert jeju["status"]["growthStage"] is not None
+
+    assert threads["thread_x"]["status"] is None
+    assert threads["thread_x"]["error"]["code"] == "NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_dashboard_validates_thread_ids(dashboard, monkeypatch):
+    app, _ = dashboard
+    monkeypatch.setattr(settings, "DASHBOARD_MAX_THREADS", 2)
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        empty = await ac.get(f"{URI}/status", params={"threadIds": " , "})
+        too_many = await ac.get(f"{URI}/status", params={"threadIds": "a,b,c"})
+    assert empty.status_code == 422 and too_many.status_code == 422
+
+
+# 2. 다른 회원의 채팅방
+@pytest.mark.asyncio
+async def test_dashboard_rejects_threads_of_other_members(dashboard):
+    """
+    다른 회원의 채팅방은 OpenAI나 날씨를 조회하지 않고 NOT_FOUND로 반환하고, 회원이 기록되지 않은 이전 채팅방은
+    백엔드의 회원 채팅방 목록으로 확인해 회원을 기록하는지 테스트합니다.
+    """
+    app, calls = dashboard
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.get(
+            f"{URI}/status", params={"threadIds": "thread_b,thread_other,thread_legacy,thread_legacy_other"}
+        )
+
+    data = response.json()["data"]
+    assert data["failed"] == 2
+    assert [thread["error"] and thread["error"]["code"] for thread in data["threads"]] == [
+        None, "NOT_FOUND", None, "NOT_FOUND",
+    ]
+    assert "배추" not in response.text
+    assert calls["thread"] == 2 and calls["weather"] == [(60, 127)]
+    assert calls["backend"] == 1
+    assert [(thread_id, context.memberId) for thread_id, context in calls["saved"]] == [("thread_legacy", "member_1")]
+
+
+# 3. threadIds 없이 회원의 모든 채팅방 조회
+@pytest.mark.asyncio
+async def test_dashboard_lists_member_threads(dashboard):
+    """
+    threadIds가 없으면 백엔드에 기록된 회원의 채팅방(이전 채팅방 포함)을 모두 반환하는지 테스트합니다.
+    """
+    app, calls = dashboard
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.get(f"{URI}/status")
+
+    data = response.json()["data"]
+    assert response.status_code == 200 and data["failed"] == 0
+    assert [thread["threadId"] for thread in data["threads"]] == ["thread_a", "thread_b", "thread_legacy"]
+    assert calls["backend"] == 1
+    assert [thread_id for thread_id, _ in calls["saved"]] == ["thread_legacy"]
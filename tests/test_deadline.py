@@ -0,0 +1,100 @@
+import sys
+import os
+import threading
+import time
+import pytest
+import requests
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.bulkhead import Bulkhead
+from app.core.deadline import (
+    Deadline, DeadlineExceeded, DeadlineMiddleware, current_deadline, route_budget, stage, timeout_for
+)
+from app.core.config import settings
+from app.core.globalException import add_exception_handlers
+from app.core.upstream import BulkheadAdapter
+
+
+# 1. 경로별 예산
+def test_route_budget():
+    """
+    채팅 / 상태 조회 / 날씨 경로마다 설정된 예산이 선택되는지 테스트합니다.
+    """
+    assert route_budget("POST", "/members/1/threads/thread_abc") == settings.DEADLINE_CHAT_SECONDS
+    assert route_budget("GET", "/members/1/threads/thread_abc/status") == settings.DEADLINE_STATUS_SECONDS
+    assert route_budget("GET", "/members/1/threads/status") == settings.DEADLINE_STATUS_SECONDS
+    assert route_budget("GET", "/weather") == settings.DEADLINE_WEATHER_SECONDS
+    assert route_budget("GET", "/members/1/threads/thread_abc") == settings.DEADLINE_DEFAULT_SECONDS
+
+
+# 2. 남은 시간과 단계별 사용 시간
+def test_deadline_breakdown():
+    """
+    예산을 다 쓰면 가장 오래 걸린 단계가 먼저 오는 내역과 함께 DeadlineExceeded가 발생하는지 테스트합니다.
+    """
+    deadline = Deadline(0.05)
+    deadline.record("kakao GET /local/search/address.json", 0.01)
+    deadline.record("kma GET /getUltraSrtNcst", 0.04)
+    time.sleep(0.06)
+
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        deadline.timeout_for("openai POST /threads/{id}/runs")
+    exc = exc_info.value
+    assert exc.stage == "openai POST /threads/{id}/runs"
+    assert exc.stages[0][0] == "kma GET /getUltraSrtNcst"
+    assert "kma GET /getUltraSrtNcst 0.04s" in exc.details
+
+
+# 3. deadline이 없으면 기본값 사용
+def test_timeout_for_without_deadline():
+    """
+    미들웨어 밖(백그라운드 작업 등)에서는 기존 timeout을 그대로 사용하는지 테스트합니다.
+    """
+    assert current_deadline() is None
+    assert timeout_for("openai run_wait", default=1.0) == 1.0
+    with stage("openai run_wait"):
+        pass
+
+
+# 4. 느린 업스트림은 남은 시간까지만 기다림
+@pytest.mark.asyncio
+async def test_adapter_stops_waiting_at_deadline():
+    """
+    bulkhead 대기열에서 기다리는 호출도 요청 deadline이 지나면 즉시 DeadlineExceeded로 끝나는지 테스트합니다.
+    """
+    bulkhead = Bulkhead("kma", max_workers=1, max_queue=4)
+    release = threading.Event()
+    blocker = threading.Thread(target=bulkhead.call, args=(release.wait,))
+    blocker.start()
+    while bulkhead.pending < 1:
+        time.sleep(0.01)
+
+    session = requests.Session()
+    session.mount("http://", BulkheadAdapter(bulkhead))
+
+    app = FastAPI()
+    add_exception_handlers(app)
+    app.add_middleware(DeadlineMiddleware)
+
+    @app.get("/weather")
+    def weather():
+        return session.get("http://kma.invalid/getUltraSrtNcst", timeout=10).json()
+
+    started = time.monotonic()
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get("/weather", headers={"X-Request-Timeout": "0.2"})
+    finally:
+        release.set()
+        blocker.join()
+    elapsed = time.monotonic() - started
+
+    assert response.status_code == 504
+    assert elapsed < 2
+    error = response.json()["error"]
+    assert error["code"] == "DEADLINE_EXCEEDED"
+    assert "kma GET /getUltraSrtNcst" in error["details"]
@@ -0,0 +1,75 @@
+import sys
+import os
+import threading
+import time
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.bulkhead import Bulkhead
+from app.core.hedging import Hedger
+
+
+def warm_up(hedger: Hedger, latency: float = 0.01, samples: int = 20):
+    for _ in range(samples):
+        hedger.observe(latency)
+
+
+# 1. 표본이 모이기 전에는 hedge하지 않음
+def test_no_hedge_without_samples():
+    """
+    최근 지연 시간 표본이 부족하면 첫 요청만 보내는지 테스트합니다.
+    """
+    hedger = Hedger("kma", min_samples=5, budget_ratio=1)
+    bulkhead = Bulkhead("kma", max_workers=2, max_queue=0)
+    calls = []
+
+    result = hedger.call(bulkhead, None, lambda: calls.append(1) or "ok")
+
+    assert result == "ok"
+    assert len(calls) == 1
+    assert hedger.snapshot()["hedged"] == 0
+
+
+# 2. 느린 첫 요청 대신 두 번째 요청의 응답 사용
+def test_hedge_wins_over_slow_attempt():
+    """
+    첫 요청이 percentile 지연보다 느리면 같은 요청을 다시 보내고 먼저 끝난 응답을 반환하는지 테스트합니다.
+    """
+    hedger = Hedger("kma", percentile=90, min_delay=0.01, budget_ratio=1)
+    warm_up(hedger)
+    bulkhead = Bulkhead("kma", max_workers=2, max_queue=0)
+    attempts = []
+    lock = threading.Lock()
+
+    def request():
+        with lock:
+            attempts.append(1)
+            attempt = len(attempts)
+        time.sleep(1.0 if attempt == 1 else 0.01)
+        return f"attempt-{attempt}"
+
+    started = time.monotonic()
+    result = hedger.call(bulkhead, 5, request)
+
+    assert result == "attempt-2"
+    assert time.monotonic() - started < 0.5
+    snapshot = hedger.snapshot()
+    assert snapshot["hedged"] == 1 and snapshot["hedgeWins"] == 1
+
+
+# 3. hedge budget을 넘으면 두 번째 요청을 보내지 않음
+def test_budget_limits_extra_requests():
+    """
+    budget_ratio가 0.25이면 느린 요청 8번 중 hedge는 2번만 보내는지 테스트합니다.
+    """
+    hedger = Hedger("kakao", percentile=50, min_delay=0.005, budget_ratio=0.25)
+    warm_up(hedger, latency=0.001, samples=50)
+    bulkhead = Bulkhead("kakao", max_workers=4, max_queue=0)
+
+    for _ in range(8):
+        hedger.call(bulkhead, 5, time.sleep, 0.02)
+
+    snapshot = hedger.snapshot()
+    assert snapshot["hedged"] == 2
+    assert snapshot["overBudget"] == 6
@@ -0,0 +1,43 @@
+import sys
+import os
+import pytest
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.openai.intent import Intent, classify_intent
+
+
+# 1. 날씨 질문은 로컬에서 답변
+@pytest.mark.parametrize("message", [
+    "오늘 날씨 어때?",
+    "지금 기온 몇 도야",
+    "오늘 비와?",
+    "바람 많이 불어?",
+])
+def test_weather_questions(message):
+    assert classify_intent(message) == Intent.WEATHER
+
+
+# 2. 상태 질문
+@pytest.mark.parametrize("message", [
+    "우리 밭 상태 어때?",
+    "내 작물 상태 알려줘",
+])
+def test_status_question(message):
+    assert classify_intent(message) == Intent.STATUS
+
+
+# 3. 조언이 필요한 질문은 Assistant로 전달
+@pytest.mark.parametrize("message", [
+    "비 오면 감자 수확해도 되나요?",
+    "날씨가 추운데 비료 언제 줘야 해?",
+    "근데, 나 감자 처음 심어서 마트에서 사서 해도 되나?",
+    "안녕하세요",
+    "물 온도 몇도가 좋아?",
+    "흙 온도 어때?",
+    "하우스 안 습도 알려줘",
+    "모종 상태 어때?",
+])
+def test_other_questions(message):
+    assert classify_intent(message) == Intent.OTHER
@@ -0,0 +1,72 @@
+import sys
+import os
+import asyncio
+import time
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.loopmonitor import LoopBlockedError, LoopMonitor, detect_blocking
+
+app = FastAPI()
+
+
+@app.get("/blocking")
+async def blocking_handler():
+    time.sleep(0.2)
+    return {}
+
+
+@app.get("/non-blocking")
+async def non_blocking_handler():
+    await asyncio.sleep(0.2)
+    return {}
+
+
+# 1. async 핸들러 안의 블로킹 호출은 테스트 실패
+@pytest.mark.asyncio
+async def test_blocking_handler_fails():
+    """
+    async 핸들러에서 time.sleep을 호출하면 멈춘 위치의 스택과 함께 LoopBlockedError가 발생하는지 테스트합니다.
+    """
+    with pytest.raises(LoopBlockedError) as exc_info:
+        async with detect_blocking(threshold=0.05):
+            async with AsyncClient(app=app, base_url="http://test") as ac:
+                await ac.get("/blocking")
+
+    assert exc_info.value.sample.lag >= 0.15
+    assert "blocking_handler" in exc_info.value.sample.stack
+
+
+# 2. await하는 핸들러는 통과
+@pytest.mark.asyncio
+async def test_non_blocking_handler_passes():
+    """
+    이벤트 루프를 막지 않는 핸들러는 detect_blocking 안에서 문제 없이 끝나는지 테스트합니다.
+    """
+    async with detect_blocking(threshold=0.05):
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get("/non-blocking")
+    assert response.status_code == 200
+
+
+# 3. 지연 percentile
+@pytest.mark.asyncio
+async def test_percentiles():
+    """
+    루프가 한 번 멈추면 최대 지연에 반영되고, 평소 지연(p50)은 작게 유지되는지 테스트합니다.
+    """
+    monitor = LoopMonitor(interval=0.01, threshold=0.05)
+    await monitor.start()
+    await asyncio.sleep(0.1)
+    time.sleep(0.1)
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    percentiles = monitor.percentiles()
+    assert percentiles["max"] >= 0.08
+    assert percentiles["p50"] < 0.05
+    assert monitor.snapshot()["blockedCount"] == 1
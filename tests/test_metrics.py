@@ -0,0 +1,93 @@
+import sys
+import os
+from types import SimpleNamespace
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.metrics.metrics import collect_pools
+from app.core.bulkhead import Bulkhead
+from app.core.metrics import Counter, Histogram, MetricsMiddleware, upstream_errors, upstream_latency
+from app.core.upstream import _call
+
+
+# 1. histogram 누적 버킷
+def test_histogram_render():
+    """
+    버킷 값이 누적되고 _sum / _count가 함께 출력되는지 테스트합니다.
+    """
+    histogram = Histogram("test_seconds", "테스트", ("upstream",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 3.0):
+        histogram.observe("kma", value=value)
+
+    lines = histogram.render()
+    assert 'test_seconds_bucket{upstream="kma",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{upstream="kma",le="1"} 2' in lines
+    assert 'test_seconds_bucket{upstream="kma",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{upstream="kma"} 3' in lines
+
+
+# 2. label 값 escape
+def test_counter_escapes_labels():
+    """
+    따옴표나 줄바꿈이 들어간 label 값이 Prometheus 형식에 맞게 escape되는지 테스트합니다.
+    """
+    counter = Counter("test_total", "테스트", ("reason",))
+    counter.inc('bad "value"\n')
+    assert 'test_total{reason="bad \\"value\\"\\n"} 1' in counter.render()
+
+
+# 3. 업스트림 호출 시간과 5xx 응답 기록
+def test_upstream_call_records_latency_and_errors():
+    """
+    bulkhead를 거친 업스트림 호출의 시간과 5xx 응답이 업스트림/작업별로 기록되는지 테스트합니다.
+    """
+    bulkhead = Bulkhead("backend", max_workers=1, max_queue=1)
+    operation = "PATCH /members/{id}/threads/{id}"
+    before = upstream_latency.count("backend", operation)
+
+    response = _call(bulkhead, None, operation, None, lambda: SimpleNamespace(status_code=503))
+
+    assert response.status_code == 503
+    assert upstream_latency.count("backend", operation) == before + 1
+    assert upstream_errors.value("backend", operation, "503") >= 1
+
+
+# 4. 라우트별 처리 중 요청 수
+@pytest.mark.asyncio
+async def test_in_flight_uses_route_template():
+    """
+    경로 파라미터가 다른 요청도 같은 라우트 label로 묶이는지 테스트합니다.
+    """
+    from app.core.metrics import http_in_flight, http_latency
+
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/members/{memberId}/threads/{thread_id}")
+    async def get_thread(memberId: str, thread_id: str):
+        assert http_in_flight.value("GET", "/members/{memberId}/threads/{thread_id}") >= 1
+        return {}
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        await ac.get("/members/1/threads/thread_a")
+        await ac.get("/members/2/threads/thread_b")
+
+    assert http_latency.count("GET", "/members/{memberId}/threads/{thread_id}", "200") == 2
+    assert http_in_flight.value("GET", "/members/{memberId}/threads/{thread_id}") == 0
+
+
+# 5. bulkhead / admission / hedging 상태
+def test_pool_collector_types():
+    """
+    누적 횟수는 _total counter로, 처리 중 / 대기열 / 한도는 gauge로 내보내는지 테스트합니다.
+    """
+    text = "\n".join(line for metric in collect_pools() for line in metric.render())
+    for name in ("upstream_pool_rejected_total", "admission_shed_total", "upstream_hedged_requests_total"):
+        assert f"# TYPE {name} counter" in text
+    for name in ("upstream_pool_pending", "admission_limit", "admission_in_flight", "admission_queue_depth"):
+        assert f"# TYPE {name} gauge" in text
+    assert 'admission_queue_depth{router="chat"} 0' in text
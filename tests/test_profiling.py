@@ -0,0 +1,167 @@
+import sys
+import os
+import pstats
+import threading
+import time
+import pytest
+from fastapi import Depends, FastAPI, Request
+from httpx import AsyncClient
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.profiling.profiling import router as profiling_router
+from app.core.config import settings
+from app.core.globalException import add_exception_handlers
+from app.core.profiling import ProfilingMiddleware, StackSampler, require_profiling_token, stop_session
+
+TOKEN = "profile-secret"
+
+
+def busy_work(seconds: float):
+    ends_at = time.monotonic() + seconds
+    while time.monotonic() < ends_at:
+        sum(range(1000))
+
+
+def create_app(directory: str) -> FastAPI:
+    app = FastAPI()
+    add_exception_handlers(app)
+    app.add_middleware(ProfilingMiddleware, token=TOKEN, directory=directory, interval=0.002)
+    app.include_router(profiling_router, prefix="/profiling", dependencies=[Depends(require_profiling_token)])
+
+    @app.get("/slow")
+    def slow(request: Request):
+        busy_work(0.1)
+        return dict(request.query_params)
+
+    @app.get("/slow-async")
+    async def slow_async():
+        busy_work(0.05)
+        return {}
+
+    return app
+
+
+# 1. 스레드 스택 표본 추출
+def test_sampler_counts_busy_threads():
+    """
+    일하는 스레드의 함수는 표본에 잡히고, 기다리기만 하는 스레드는 세지 않는지 테스트합니다.
+    """
+    idle = threading.Event()
+    waiter = threading.Thread(target=idle.wait, name="idle-waiter", daemon=True)
+    worker = threading.Thread(target=busy_work, args=(0.2,), name="busy-worker")
+    waiter.start()
+    worker.start()
+
+    sampler = StackSampler(interval=0.002).start()
+    worker.join()
+    sampler.stop()
+    idle.set()
+
+    assert sampler.samples > 10
+    assert any(stack.startswith("busy-worker;") and "busy_work" in stack for stack in sampler.stacks)
+    assert not any(stack.startswith("idle-waiter;") for stack in sampler.stacks)
+
+
+def test_sampler_can_be_read_while_sampling():
+    """
+    표본을 모으는 중에 top()과 snapshot()을 반복해서 읽어도 오류 없이 읽히는지 테스트합니다.
+    """
+    worker = threading.Thread(target=busy_work, args=(0.2,), name="busy-worker")
+    worker.start()
+    sampler = StackSampler(interval=0.001).start()
+    while worker.is_alive():
+        sampler.top()
+        sampler.snapshot()
+    sampler.stop()
+    worker.join()
+    assert sum(sampler.counts().values()) >= sampler.samples > 0
+
+
+# 2. 토큰 없이 보낸 요청은 프로파일링하지 않음
+@pytest.mark.asyncio
+async def test_request_without_token_is_not_profiled(tmp_path):
+    """
+    토큰이 없거나 틀리면 프로파일 파일을 만들지 않고 그대로 처리하는지 테스트합니다.
+    """
+    async with AsyncClient(app=create_app(str(tmp_path)), base_url="http://test") as ac:
+        plain = await ac.get("/slow")
+        wrong = await ac.get("/slow", headers={"x-profile-token": "wrong"})
+
+    assert plain.status_code == 200 and wrong.status_code == 200
+    assert "x-profile-file" not in plain.headers and "x-profile-file" not in wrong.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+# 3. 헤더로 켠 요청은 folded 스택 파일로 저장
+@pytest.mark.asyncio
+async def test_header_profiles_request(tmp_path):
+    """
+    x-profile-token 헤더가 맞으면 스레드 풀에서 실행된 동기 처리기까지 표본에 잡혀 저장되는지 테스트합니다.
+    """
+    async with AsyncClient(app=create_app(str(tmp_path)), base_url="http://test") as ac:
+        response = await ac.get("/slow", headers={"x-profile-token": TOKEN})
+
+    assert response.status_code == 200
+    profile = tmp_path / response.headers["x-profile-file"]
+    assert profile.suffix == ".folded"
+    assert "slow (test_profiling.py" in profile.read_text(encoding="utf-8")
+
+
+# 4. 쿼리의 토큰으로는 켜지지 않음
+@pytest.mark.asyncio
+async def test_query_token_is_ignored(tmp_path):
+    """
+    ?profile=<토큰> 쿼리로는 프로파일링하지 않고, 쿼리는 처리기에 그대로 전달되는지 테스트합니다.
+    """
+    async with AsyncClient(app=create_app(str(tmp_path)), base_url="http://test") as ac:
+        response = await ac.get("/slow", params={"profile": TOKEN, "address": "서울"})
+
+    assert response.json() == {"profile": TOKEN, "address": "서울"}
+    assert "x-profile-file" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+# 5. cProfile 방식
+@pytest.mark.asyncio
+async def test_cprofile_mode(tmp_path):
+    """
+    x-profile-mode: cprofile 이면 pstats로 읽을 수 있는 .prof 파일을 저장하는지 테스트합니다.
+    """
+    async with AsyncClient(app=create_app(str(tmp_path)), base_url="http://test") as ac:
+        response = await ac.get("/slow-async", headers={"x-profile-token": TOKEN, "x-profile-mode": "cprofile"})
+
+    profile = tmp_path / response.headers["x-profile-file"]
+    assert profile.suffix == ".prof"
+    stats = pstats.Stats(str(profile))
+    assert any(name == "busy_work" for _, _, name in stats.stats)
+
+
+# 6. 프로세스 전체 표본 추출 세션
+@pytest.mark.asyncio
+async def test_profiling_session(tmp_path, monkeypatch):
+    """
+    세션은 관리자 토큰이 있어야 시작할 수 있고, 한 번에 하나만 실행되며, 종료하면 파일로 저장되는지 테스트합니다.
+    """
+    monkeypatch.setattr(settings, "PROFILING_TOKEN", TOKEN)
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+    headers = {"x-profile-token": TOKEN}
+
+    async with AsyncClient(app=create_app(str(tmp_path)), base_url="http://test") as ac:
+        try:
+            forbidden = await ac.post("/profiling/session")
+            started = await ac.post("/profiling/session", params={"seconds": 30}, headers=headers)
+            conflict = await ac.post("/profiling/session", headers=headers)
+            await ac.get("/slow")
+            stopped = await ac.delete("/profiling/session", headers=headers)
+        finally:
+            stop_session()
+
+    assert forbidden.status_code == 403
+    assert started.status_code == 201 and started.json()["data"]["running"] is True
+    assert conflict.status_code == 409
+
+    data = stopped.json()["data"]
+    assert data["running"] is False and data["samples"] > 0
+    assert os.path.exists(data["file"])
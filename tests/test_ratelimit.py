@@ -0,0 +1,78 @@
+import sys
+import os
+import asyncio
+import pytest
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.ratelimit import FairQueue, MemberRateLimiter, RateLimitExceeded, TokenBucket
+
+
+# 1. 토큰 버킷
+def test_token_bucket_retry_after():
+    """
+    토큰이 부족하면 다시 채워질 때까지 남은 시간을 반환하는지 테스트합니다.
+    """
+    bucket = TokenBucket(capacity=2, rate=1)
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    retry_after = bucket.try_acquire()
+    assert 0.9 < retry_after <= 1.0
+
+
+# 2. 회원별 요청 제한
+def test_member_limit_is_per_member():
+    limiter = MemberRateLimiter(requests_per_minute=1, tokens_per_minute=1000)
+    limiter.check_request("member-a")
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        limiter.check_request("member-a")
+    assert exc_info.value.retry_after_header == "60"
+    limiter.check_request("member-b")
+
+
+# 3. 토큰 사용량 보정
+def test_settle_tokens_charges_actual_usage():
+    limiter = MemberRateLimiter(requests_per_minute=10, tokens_per_minute=1000)
+    limiter.check_tokens("member-a", 100)
+    limiter.settle_tokens("member-a", 100, 1000)
+    with pytest.raises(RateLimitExceeded):
+        limiter.check_tokens("member-a", 100)
+
+
+# 4. 공정 대기열
+@pytest.mark.asyncio
+async def test_fair_queue_interleaves_members():
+    """
+    한 회원이 먼저 여러 요청을 넣어도 다른 회원의 요청과 번갈아 처리되는지 테스트합니다.
+    """
+    queue = FairQueue(max_active=1, max_waiting=10)
+    order = []
+
+    async def run(member_id, i):
+        async with queue.slot(member_id):
+            order.append(f"{member_id}{i}")
+            await asyncio.sleep(0.01)
+
+    holder = asyncio.create_task(run("x", 0))
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(run("a", i)) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(run("b", i)) for i in range(3)]
+    await asyncio.gather(holder, *tasks)
+
+    assert order == ["x0", "a0", "b0", "a1", "b1", "a2", "b2"]
+    assert queue.active == 0
+
+
+@pytest.mark.asyncio
+async def test_fair_queue_rejects_too_many_waiting():
+    queue = FairQueue(max_active=1, max_waiting=1)
+    async with queue.slot("a"):
+        waiting = asyncio.create_task(queue._acquire("a"))
+        await asyncio.sleep(0)
+        with pytest.raises(RateLimitExceeded):
+            await queue._acquire("a")
+    await waiting
+    queue._release()
+    assert queue.active == 0
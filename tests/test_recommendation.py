@@ -0,0 +1,72 @@
+import sys
+import os
+from datetime import date, datetime
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.openai.context import ThreadContext
+from app.api.weather.history import KST
+from app.api.openai.recommendation import CROP_RULES, DEFAULT_CROP, crop_rules, recommend
+
+MILD = {"temp": 18.0, "humidity": 60, "rainProbability": 10.0, "rainfall": 0, "windSpeed": 1.5}
+
+
+# 1. 생육 단계와 작업 일정
+def test_stage_and_schedule_follow_planted_date():
+    """
+    심은 지 28일째 감자는 줄기 신장기이고, 오늘 전후 3일 안의 작업(웃거름, 북주기)과 30일 안의 일정을 실제 날짜로 반환하는지 테스트합니다.
+    """
+    result = recommend("감자", date(2024, 3, 1), date(2024, 3, 29), weather=MILD)
+    assert result["crop"] == "감자"
+    assert result["stage"] == {
+        "name": "줄기 신장기",
+        "daysSincePlanted": 28,
+        "nextStage": "덩이줄기 형성기",
+        "nextStageDate": {"year": 2024, "month": 4, "day": 10},
+    }
+    assert result["actions"][:2] == ["웃거름 주기", "북주기"]
+    assert "5~7일 간격으로 물 주기" in result["actions"]
+    assert result["schedule"] == [
+        {"action": "북주기", "date": {"year": 2024, "month": 3, "day": 31}},
+        {"action": "2차 북주기", "date": {"year": 2024, "month": 4, "day": 20}},
+    ]
+
+
+# 2. 날씨 규칙
+def test_weather_rules_replace_stage_actions():
+    """
+    비 예보와 최근 3일 많은 비가 있으면 날씨 작업이 먼저 오고 물 주기 작업은 빠지는지 테스트합니다.
+    """
+    weather = {**MILD, "rainProbability": 70.0, "humidity": 90}
+    recent = {"aggregates": {"RN1": {"sum": 42.5}, "T1H": {"min": -1.0}}}
+    result = recommend("고추", date(2024, 5, 1), date(2024, 6, 20), weather=weather, recent=recent)
+
+    assert result["actions"][:2] == [
+        "강수확률 70% — 물 주기는 미루고 배수로를 정비하세요",
+        "최근 3일 강수량 42.5mm — 배수 상태와 뿌리 썩음을 확인하세요",
+    ]
+    assert "꽃이 떨어지지 않게 물 주기" not in result["actions"]
+    assert len(result["actions"]) == 5
+
+
+def test_unknown_crop_and_missing_planted_date():
+    """
+    등록되지 않은 작물은 이름에 든 작물 또는 기본 규칙을 쓰고, 심은 날을 모르면 날씨 작업만 추천하는지 테스트합니다.
+    """
+    assert crop_rules("방울토마토")[0] == "토마토"
+    assert crop_rules("블루베리") == (DEFAULT_CROP, CROP_RULES[DEFAULT_CROP])
+
+    result = recommend("블루베리", None, date(2024, 6, 1), weather={**MILD, "temp": 33.0})
+    assert result["stage"] is None and result["schedule"] == []
+    assert result["actions"] == ["기온 33℃ — 한낮 물 주기를 피하고 그늘을 만들어 주세요"]
+    assert recommend("블루베리", None, date(2024, 6, 1))["actions"] == ["작물 상태 확인하기"]
+
+
+def test_planted_date():
+    assert ThreadContext(plantedAt="2024-03-01").planted_date() == date(2024, 3, 1)
+    assert ThreadContext(plantedAt="3월 1일").planted_date() is None
+    assert ThreadContext(plantedAt="2024-03-01").days_since_planted(date(2024, 3, 29)) == 28
+    # 오늘은 서버 시간대가 아니라 한국 날짜 기준입니다.
+    today = datetime.now(KST).date()
+    assert ThreadContext(plantedAt=f"{today:%Y-%m-%d}").days_since_planted() == 0
@@ -0,0 +1,52 @@
+import sys
+import os
+import pytest
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.server import cpu_limit, memory_limit, worker_count
+
+
+def write(root, name: str, content: str):
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+# 1. cgroup v2 한도 읽기
+def test_cgroup_v2_limits(tmp_path):
+    """
+    cpu.max의 quota / period와 memory.max를 읽고, "max"는 한도 없음으로 보는지 테스트합니다.
+    """
+    write(tmp_path, "cpu.max", "150000 100000\n")
+    write(tmp_path, "memory.max", str(1024 * 1024 * 1024))
+    assert cpu_limit(str(tmp_path)) == pytest.approx(min(1.5, len(os.sched_getaffinity(0))))
+    assert memory_limit(str(tmp_path)) == 1024 * 1024 * 1024
+
+    write(tmp_path, "memory.max", "max")
+    assert memory_limit(str(tmp_path)) is None
+
+
+# 2. cgroup v1 한도 읽기
+def test_cgroup_v1_limits(tmp_path):
+    """
+    cfs quota가 -1이면 코어 수를, 메모리 한도가 매우 큰 값이면 한도 없음으로 보는지 테스트합니다.
+    """
+    write(tmp_path, "cpu/cpu.cfs_quota_us", "-1")
+    write(tmp_path, "cpu/cpu.cfs_period_us", "100000")
+    write(tmp_path, "memory/memory.limit_in_bytes", "9223372036854771712")
+    assert cpu_limit(str(tmp_path)) == len(os.sched_getaffinity(0))
+    assert memory_limit(str(tmp_path)) is None
+
+
+# 3. 워커 수 계산
+def test_worker_count():
+    """
+    코어마다 워커 하나(소수점은 올림)이고, 메모리 한도를 넘지 않으며, 최소 하나인지 테스트합니다.
+    """
+    gib = 1024 * 1024 * 1024
+    assert worker_count(4, None) == 4
+    assert worker_count(1.5, None) == 2
+    assert worker_count(8, gib, worker_memory_mb=256) == 4
+    assert worker_count(0.5, 100 * 1024 * 1024, worker_memory_mb=256) == 1
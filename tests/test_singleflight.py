@@ -0,0 +1,148 @@
+import sys
+import os
+import threading
+import time
+import pytest
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.deadline import Deadline, DeadlineExceeded, use_deadline
+from app.core.singleflight import SingleFlight, normalize_address
+
+
+# 1. 동시에 들어온 같은 키의 호출은 한 번만 실행
+def test_concurrent_calls_are_coalesced():
+    """
+    같은 키로 동시에 호출하면 업스트림 함수는 한 번만 실행되고 모두 같은 결과를 받는지 테스트합니다.
+    """
+    flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def upstream():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return {"T1H": 3}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("key", upstream))) for _ in range(10)]
+    threads[0].start()
+    started.wait()
+    for t in threads[1:]:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == [{"T1H": 3}] * 10
+    assert flight.in_flight() == 0
+
+
+# 2. 예외도 기다리던 호출자 모두에게 전달
+def test_error_is_shared():
+    """
+    업스트림 호출이 실패하면 기다리던 호출자도 같은 예외를 받는지 테스트합니다.
+    """
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def upstream():
+        started.set()
+        time.sleep(0.05)
+        raise RuntimeError("upstream failed")
+
+    def worker():
+        try:
+            flight.do("key", upstream)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    threads[0].start()
+    started.wait()
+    for t in threads[1:]:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == ["upstream failed"] * 5
+
+
+# 3. 호출이 끝나면 결과를 캐싱하지 않음
+def test_sequential_calls_are_not_cached():
+    """
+    순차 호출은 매번 업스트림을 호출하는지 테스트합니다.
+    """
+    flight = SingleFlight()
+    counter = iter(range(10))
+    assert flight.do("key", lambda: next(counter)) == 0
+    assert flight.do("key", lambda: next(counter)) == 1
+
+
+# 4. 먼저 호출한 요청의 deadline 초과는 기다리던 호출자에게 전달하지 않음
+def test_follower_retries_after_leader_deadline():
+    """
+    먼저 호출한 요청이 자기 deadline을 넘겨 실패해도, 예산이 남은 호출자는 직접 다시 호출해 결과를 받는지 테스트합니다.
+    """
+    flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def upstream():
+        calls.append(1)
+        if len(calls) == 1:
+            started.set()
+            time.sleep(0.1)
+            raise DeadlineExceeded("kma GET /getUltraSrtNcst", Deadline(0.05))
+        return {"T1H": 3}
+
+    outcomes = {}
+
+    def worker(name, budget):
+        with use_deadline(Deadline(budget)):
+            try:
+                outcomes[name] = flight.do("key", upstream)
+            except DeadlineExceeded as e:
+                outcomes[name] = e
+
+    leader = threading.Thread(target=worker, args=("leader", 0.05))
+    follower = threading.Thread(target=worker, args=("follower", 5))
+    leader.start()
+    started.wait()
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert isinstance(outcomes["leader"], DeadlineExceeded)
+    assert outcomes["follower"] == {"T1H": 3}
+    assert len(calls) == 2
+
+
+# 5. 기다리는 호출자는 자기 deadline까지만 기다림
+def test_follower_stops_waiting_at_its_deadline():
+    flight = SingleFlight()
+    release = threading.Event()
+    leader = threading.Thread(target=flight.do, args=("key", release.wait, 5))
+    leader.start()
+    while flight.in_flight() < 1:
+        time.sleep(0.01)
+
+    started = time.monotonic()
+    try:
+        with use_deadline(Deadline(0.1)):
+            with pytest.raises(DeadlineExceeded) as exc_info:
+                flight.do("key", release.wait, 5)
+    finally:
+        release.set()
+        leader.join()
+
+    assert time.monotonic() - started < 1
+    assert exc_info.value.stage == "singleflight wait"
+
+
+# 6. 주소 정규화
+def test_normalize_address():
+    assert normalize_address("  서울 성북구   낙산길 243 ") == "서울 성북구 낙산길 243"
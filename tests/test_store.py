@@ -0,0 +1,169 @@
+import sys
+import os
+import multiprocessing
+import socketserver
+import threading
+import time
+import pytest
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.openai.answer_cache import AnswerCache
+from app.api.openai.context import ThreadContext, ThreadContextStore
+from app.core.store import MemoryStore, RedisStore, SQLiteStore, decode, encode
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    """테스트용 RESP 서버 (MGET / SET [PX] / DEL만 지원)"""
+
+    def read_command(self) -> list[bytes]:
+        header = self.rfile.readline()
+        if not header:
+            return []
+        command = []
+        for _ in range(int(header[1:])):
+            length = int(self.rfile.readline()[1:])
+            command.append(self.rfile.read(length + 2)[:-2])
+        return command
+
+    def handle(self):
+        data = self.server.data
+        while command := self.read_command():
+            name = command[0].upper()
+            if name == b"MGET":
+                values = [data.get(key, (None, None)) for key in command[1:]]
+                reply = f"*{len(values)}\r\n".encode()
+                for value, expires_at in values:
+                    if value is None or (expires_at is not None and expires_at <= time.time()):
+                        reply += b"$-1\r\n"
+                    else:
+                        reply += f"${len(value)}\r\n".encode() + value + b"\r\n"
+            elif name == b"SET":
+                ttl = int(command[4]) / 1000 if len(command) > 4 else None
+                data[command[1]] = (command[2], None if ttl is None else time.time() + ttl)
+                reply = b"+OK\r\n"
+            elif name == b"DEL":
+                reply = f":{int(data.pop(command[1], None) is not None)}\r\n".encode()
+            else:
+                reply = b"+OK\r\n"
+            self.wfile.write(reply)
+
+
+@pytest.fixture
+def redis_url():
+    pytest.importorskip("redis")
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeRedisHandler)
+    server.daemon_threads = True
+    server.data = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"redis://127.0.0.1:{server.server_address[1]}/0"
+    server.shutdown()
+    server.server_close()
+
+
+def write_from_other_process(path: str):
+    SQLiteStore(path).set_many({"geocode:서울": [126.97, 37.56], "geocode:천안": [127.15, 36.81]}, ttl=60)
+
+
+# 1. 직렬화
+def test_encode_is_compact_and_roundtrips():
+    """
+    작은 값은 그대로, 큰 값은 압축해서 저장하고 같은 값으로 복원되는지 테스트합니다.
+    """
+    small = {"T1H": 12.3, "REH": 55}
+    large = {"synopsis": "감자 잎이 노랗게 변해 질소 비료를 권했습니다. " * 40}
+    assert encode(small)[:1] == b"j" and decode(encode(small)) == small
+    assert encode(large)[:1] == b"z" and decode(encode(large)) == large
+    assert len(encode(large)) < len(large["synopsis"].encode("utf-8")) / 4
+
+
+# 2. 저장소 공통 동작 (TTL / 일괄 조회 / 삭제)
+@pytest.mark.parametrize("backend", ["memory", "sqlite", "redis"])
+def test_store_ttl_batch_and_delete(backend, tmp_path, request):
+    """
+    세 저장소 모두 없는 key는 빠지고, TTL이 지나면 만료되고, 삭제가 반영되는지 테스트합니다.
+    """
+    if backend == "memory":
+        store = MemoryStore()
+    elif backend == "sqlite":
+        store = SQLiteStore(str(tmp_path / "store.sqlite3"))
+    else:
+        store = RedisStore(request.getfixturevalue("redis_url"))
+
+    store.set_many({"a": 1, "b": [1, 2]}, ttl=60)
+    store.set("short", {"x": "y"}, ttl=0.05)
+    store.set("forever", "값")
+    assert store.get_many(["a", "b", "missing", "short", "forever"]) == {
+        "a": 1, "b": [1, 2], "short": {"x": "y"}, "forever": "값"
+    }
+
+    time.sleep(0.1)
+    store.delete("a")
+    assert store.get_many(["a", "b", "short", "forever"]) == {"b": [1, 2], "forever": "값"}
+
+    # 저장한 값이나 꺼낸 값을 고쳐도 저장된 값은 그대로입니다.
+    value = {"POP": [20, 60]}
+    store.set("forecast", value)
+    value["POP"].append(80)
+    store.get("forecast")["POP"].append(90)
+    assert store.get("forecast") == {"POP": [20, 60]}
+
+
+# 3. 프로세스 내 LRU
+def test_memory_store_evicts_least_recently_used():
+    store = MemoryStore(max_entries=2)
+    store.set("a", 1)
+    store.set("b", 2)
+    store.get("a")
+    store.set("c", 3)
+    assert store.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+# 4. SQLite 저장소는 다른 프로세스와 공유
+def test_sqlite_store_is_shared_between_processes(tmp_path):
+    """
+    다른 워커 프로세스가 저장한 값을 같은 파일의 저장소에서 읽을 수 있는지 테스트합니다.
+    """
+    path = str(tmp_path / "store.sqlite3")
+    store = SQLiteStore(path)
+    process = multiprocessing.get_context("spawn").Process(target=write_from_other_process, args=(path,))
+    process.start()
+    process.join(30)
+
+    assert store.get_many(["geocode:서울", "geocode:천안"]) == {
+        "geocode:서울": [126.97, 37.56], "geocode:천안": [127.15, 36.81]
+    }
+    keys = [f"k{i}" for i in range(SQLiteStore.BATCH * 2 + 1)]
+    store.set_many({key: i for i, key in enumerate(keys)}, ttl=60)
+    assert len(store.get_many(keys)) == len(keys)
+
+
+# 5. 저장소 오류는 캐시 미스로 처리
+def test_store_errors_are_misses():
+    """
+    Redis 서버에 연결할 수 없으면 예외 없이 미스로 처리되는지 테스트합니다.
+    """
+    pytest.importorskip("redis")
+    store = RedisStore("redis://127.0.0.1:1/0", timeout=0.1)
+    store.set("a", 1)
+    assert store.get("a") is None
+
+
+# 6. 채팅방 컨텍스트와 답변 캐시를 워커끼리 공유
+def test_context_and_answers_are_shared(tmp_path):
+    """
+    같은 SQLite 파일을 쓰는 두 워커의 저장소에서 채팅방 컨텍스트와 답변을 서로 읽을 수 있는지 테스트합니다.
+    """
+    path = str(tmp_path / "store.sqlite3")
+    worker_a, worker_b = SQLiteStore(path), SQLiteStore(path)
+
+    context = ThreadContext(address="서울특별시 중구", crop="감자", cropId=1, turns_since_summary=2)
+    ThreadContextStore(worker_a).set("thread_1", context)
+    assert ThreadContextStore(worker_b).get("thread_1") == context
+    assert ThreadContextStore(worker_b).get_many(["thread_1", "thread_2"]) == {"thread_1": context}
+
+    AnswerCache(store=worker_a).put("감자", "감자 물 주기 주기는?", "3~4일 간격으로 주세요.")
+    cache_b = AnswerCache(store=worker_b)
+    assert cache_b.get("감자", "감자 물주기 주기는") == "3~4일 간격으로 주세요."
+    assert len(cache_b) == 1
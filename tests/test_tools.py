@@ -0,0 +1,53 @@
+import sys
+import os
+import json
+import time
+from types import SimpleNamespace
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.openai.tools import ToolRegistry, tool_registry
+
+
+def make_tool_call(call_id, name, arguments):
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=json.dumps(arguments)))
+
+
+# 1. 등록된 tool 실행
+def test_execute_registered_tools_concurrently():
+    """
+    여러 tool 호출이 동시에 실행되고 호출 순서대로 결과가 반환되는지 테스트합니다.
+    """
+    registry = ToolRegistry(max_workers=4)
+
+    @registry.register(name="slow_echo", description="echo", parameters={"type": "object"})
+    def slow_echo(value):
+        time.sleep(0.2)
+        return {"value": value}
+
+    calls = [make_tool_call(f"call_{i}", "slow_echo", {"value": i}) for i in range(4)]
+    started = time.monotonic()
+    outputs = registry.execute(calls)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.6
+    assert [o["tool_call_id"] for o in outputs] == ["call_0", "call_1", "call_2", "call_3"]
+    assert json.loads(outputs[2]["output"]) == {"value": 2}
+
+
+# 2. 실패한 tool은 에러를 결과로 반환
+def test_execute_unknown_tool_returns_error():
+    """
+    등록되지 않은 tool 호출은 run이 계속될 수 있도록 에러 내용을 결과로 돌려주는지 테스트합니다.
+    """
+    registry = ToolRegistry()
+    outputs = registry.execute([make_tool_call("call_0", "unknown", {})])
+    assert "error" in json.loads(outputs[0]["output"])
+
+
+# 3. 날씨 tool 정의
+def test_weather_tool_definition():
+    definitions = tool_registry.definitions("get_weather")
+    assert len(definitions) == 1
+    assert definitions[0]["function"]["parameters"]["required"] == ["address"]
@@ -0,0 +1,113 @@
+import sys
+import os
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.deadline import DeadlineMiddleware, current_deadline
+from app.core.globalException import add_exception_handlers
+from app.core.ratelimit import RateLimitExceeded
+from app.core.tracing import TracingMiddleware, inject_headers, request_id_scope, server_timing
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    add_exception_handlers(app)
+    app.add_middleware(TracingMiddleware)
+    app.add_middleware(DeadlineMiddleware)
+
+    @app.get("/members/{memberId}/threads/{thread_id}")
+    async def get_thread(memberId: str, thread_id: str):
+        deadline = current_deadline()
+        deadline.record("kakao GET /local/search/address.json", 0.012)
+        deadline.record("openai run_wait", 1.5)
+        deadline.record("openai POST /threads/{id}/runs", 0.2)
+        deadline.record("openai GET /threads/{id}/runs/{id}", 0.1)
+        return {}
+
+    @app.post("/members/{memberId}/threads/{thread_id}")
+    async def send_message(memberId: str, thread_id: str):
+        raise RateLimitExceeded("요청이 너무 많습니다.", 3)
+
+    @app.delete("/members/{memberId}/threads/{thread_id}")
+    async def delete_thread(memberId: str, thread_id: str):
+        current_deadline().record("backend DELETE /chat", 0.03)
+        raise RuntimeError("unexpected")
+
+    return app
+
+
+# 1. 단계별 시간을 Server-Timing 항목으로 묶기
+def test_server_timing_groups_stages():
+    """
+    OpenAI 호출 / run 대기 / 지오코딩 / 기상청 / 백엔드 시간이 각각의 항목으로 합산되는지 테스트합니다.
+    """
+    header = server_timing([
+        ("openai run_wait", 1.5),
+        ("openai POST /threads/{id}/runs", 0.2),
+        ("openai GET /threads/{id}/runs/{id}", 0.1),
+        ("kakao GET /local/search/address.json", 0.012),
+        ("kma GET /getUltraSrtNcst", 0.05),
+    ], total=2.0)
+
+    assert header == "run_wait;dur=1500.0, openai;dur=300.0, geocode;dur=12.0, kma;dur=50.0, total;dur=2000.0"
+
+
+# 2. 응답 헤더에 요청 ID와 Server-Timing 추가
+@pytest.mark.asyncio
+async def test_response_headers():
+    """
+    요청 ID가 새로 만들어지고, 요청 중 기록한 단계별 시간이 Server-Timing 헤더로 반환되는지 테스트합니다.
+    """
+    async with AsyncClient(app=create_app(), base_url="http://test") as ac:
+        response = await ac.get("/members/1/threads/thread_abc")
+
+    assert len(response.headers["x-request-id"]) == 32
+    timing = response.headers["server-timing"]
+    assert "run_wait;dur=1500.0" in timing and "openai;dur=300.0" in timing and "geocode;dur=12.0" in timing
+
+
+# 3. 에러 응답 본문에 요청 ID 포함
+@pytest.mark.asyncio
+async def test_error_body_contains_request_id():
+    """
+    클라이언트가 보낸 요청 ID를 그대로 사용하고, 전역 예외 처리기의 에러 본문에도 포함하는지 테스트합니다.
+    """
+    async with AsyncClient(app=create_app(), base_url="http://test") as ac:
+        response = await ac.post("/members/1/threads/thread_abc", headers={"X-Request-ID": "client-req-0001"})
+
+    assert response.status_code == 429
+    assert response.headers["x-request-id"] == "client-req-0001"
+    assert response.json()["error"]["requestId"] == "client-req-0001"
+
+
+@pytest.mark.asyncio
+async def test_unhandled_exception_keeps_request_id():
+    """
+    처리되지 않은 예외의 500 응답에도 요청 ID와 Server-Timing 헤더, 본문의 요청 ID가 포함되는지 테스트합니다.
+    """
+    async with AsyncClient(app=create_app(), base_url="http://test") as ac:
+        response = await ac.delete("/members/1/threads/thread_abc", headers={"X-Request-ID": "client-req-0002"})
+
+    assert response.status_code == 500
+    assert response.headers["x-request-id"] == "client-req-0002"
+    assert "backend;dur=30.0" in response.headers["server-timing"]
+    error = response.json()["error"]
+    assert error["code"] == "INTERNAL_SERVER_ERROR" and error["requestId"] == "client-req-0002"
+
+
+# 4. 업스트림 요청 헤더로 요청 ID 전달
+def test_inject_headers():
+    """
+    요청 처리 중에 보내는 업스트림 요청에 X-Request-ID 헤더가 추가되는지 테스트합니다.
+    """
+    headers = {}
+    inject_headers(headers)
+    assert headers == {}
+
+    with request_id_scope("req-12345678"):
+        inject_headers(headers)
+    assert headers == {"x-request-id": "req-12345678"}
@@ -0,0 +1,120 @@
+import sys
+import os
+import json
+from datetime import datetime
+import pytest
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.weather.forecast import (
+    SCHEDULES, ForecastUnavailable, compact_forecast, forecast_at, iter_items, slice_forecast
+)
+from app.api.weather.history import KST, observed_at
+from app.api.weather.weather import kakao_service
+from app.core.deadline import Deadline, DeadlineExceeded
+
+
+def forecast_body(items: list[dict], result_code: str = "00") -> bytes:
+    return json.dumps({"response": {
+        "header": {"resultCode": result_code, "resultMsg": "NORMAL_SERVICE"},
+        "body": {"dataType": "JSON", "items": {"item": items}, "pageNo": 1, "numOfRows": 1000, "totalCount": len(items)},
+    }}, ensure_ascii=False).encode("utf-8")
+
+
+def row(category: str, fcst_time: str, value: str) -> dict:
+    return {"baseDate": "20241014", "baseTime": "0500", "category": category,
+            "fcstDate": "20241014", "fcstTime": fcst_time, "fcstValue": value, "nx": 60, "ny": 127}
+
+
+ROWS = [
+    row("POP", "0600", "20"), row("PCP", "0600", "강수없음"), row("TMP", "0600", "8"),
+    row("POP", "0700", "60"), row("PCP", "0700", "1mm 미만"), row("TMP", "0700", "9"),
+    row("POP", "0800", "80"), row("TMP", "0800", "11"),
+]
+
+
+# 1. 스트리밍 파싱
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_iter_items_streams_any_chunking(chunk_size):
+    """
+    청크가 항목이나 한글(UTF-8) 글자 중간에서 잘려도 모든 항목을 순서대로 꺼내는지 테스트합니다.
+    """
+    body = forecast_body(ROWS)
+    chunks = (body[start:start + chunk_size] for start in range(0, len(body), chunk_size))
+    assert list(iter_items(chunks)) == ROWS
+
+
+def test_iter_items_errors():
+    with pytest.raises(ForecastUnavailable) as error:
+        list(iter_items([forecast_body(ROWS, result_code="03")]))
+    assert error.value.result_code == "03"
+
+    no_data = b'{"response":{"header":{"resultCode":"03","resultMsg":"NO_DATA"}}}'
+    with pytest.raises(ForecastUnavailable):
+        list(iter_items([no_data]))
+
+
+# 2. 열 형식 예보
+def test_compact_forecast_and_lookup():
+    """
+    예보 시각별로 값을 모으고, 없는 값은 None, 현재 시각이 속한 예보를 찾는지 테스트합니다.
+    """
+    forecast = compact_forecast(iter(ROWS), "20241014", "0500")
+    assert forecast["times"] == [observed_at("20241014", hour) for hour in ("0600", "0700", "0800")]
+    assert forecast["values"]["POP"] == [20.0, 60.0, 80.0]
+    assert forecast["values"]["PCP"] == ["강수없음", "1mm 미만", None]
+
+    assert forecast_at(forecast, observed_at("20241014", "0730"))["POP"] == 60.0
+    assert forecast_at(forecast, observed_at("20241014", "0530"))["POP"] == 20.0
+    assert "PCP" not in forecast_at(forecast, observed_at("20241014", "0800"))
+    assert slice_forecast(forecast, observed_at("20241014", "0710"), hours=1)["values"]["TMP"] == [9.0, 11.0]
+
+
+# 3. 발표 시각
+@pytest.mark.parametrize("kind, now, expected", [
+    ("village", "202410140509", "202410140200"),
+    ("village", "202410140510", "202410140500"),
+    ("village", "202410140105", "202410132300"),
+    ("ultra", "202410140944", "202410140830"),
+    ("ultra", "202410140945", "202410140930"),
+    ("ultra", "202410140010", "202410132330"),
+])
+def test_latest_base(kind, now, expected):
+    now = datetime.strptime(now, "%Y%m%d%H%M").replace(tzinfo=KST)
+    assert f"{SCHEDULES[kind].latest_base(now):%Y%m%d%H%M}" == expected
+
+
+# 4. 격자 단위 캐시
+def test_forecast_is_cached_per_cell_and_falls_back(monkeypatch):
+    """
+    최신 발표가 아직 없으면 이전 발표를 쓰고, 같은 격자의 다음 조회는 캐시에서 응답하는지 테스트합니다.
+    """
+    requests = []
+
+    def fake_request(kind, nx, ny, base_date, base_time):
+        requests.append(base_date + base_time)
+        if base_date + base_time == requests[0]:
+            raise ForecastUnavailable("03")
+        return compact_forecast(iter(ROWS), base_date, base_time)
+
+    monkeypatch.setattr(kakao_service, "_request_forecast", fake_request)
+    first = kakao_service.get_forecast(997, 997, "village")
+    assert kakao_service.get_forecast(997, 997, "village") == first
+    assert kakao_service.get_forecast(997, 997, "village")["values"]["POP"] == [20.0, 60.0, 80.0]
+
+    # 최신 발표가 없다는 응답도 잠시 캐시하므로 업스트림 호출은 처음 두 번뿐입니다.
+    assert len(requests) == 2 and requests[1] < requests[0]
+
+
+# 5. 강수확률은 예보를 가져오지 못해도 현재 날씨 응답을 막지 않음
+@pytest.mark.parametrize("error", [
+    ForecastUnavailable("03"),
+    DeadlineExceeded("kma GET /getVilageFcst", Deadline(0.1)),
+])
+def test_rain_probability_falls_back_to_none(monkeypatch, error):
+    def fake_request(kind, nx, ny, base_date, base_time):
+        raise error
+
+    monkeypatch.setattr(kakao_service, "_request_forecast", fake_request)
+    assert kakao_service.get_rain_probability(996, 996) is None
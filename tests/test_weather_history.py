@@ -0,0 +1,102 @@
+import sys
+import os
+import math
+import time
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.weather.history import CellHistory, ObservationHistory, aggregate, observed_at
+from app.api.weather.weather import kakao_service, router as weather_router
+from app.core.globalException import add_exception_handlers
+
+HOUR = 3600
+
+
+def observation(t1h: float, rn1: float = 0, vec: float = 0) -> dict:
+    return {"T1H": t1h, "RN1": rn1, "REH": 60, "PTY": 0, "VEC": vec, "WSD": 1.2}
+
+
+# 1. ring buffer가 가득 차면 가장 오래된 관측부터 덮어씀
+def test_ring_buffer_wraps():
+    """
+    capacity를 넘게 쌓으면 최근 capacity개만 시간 순서대로 남는지 테스트합니다.
+    """
+    cell = CellHistory(capacity=3)
+    for hour in range(5):
+        cell.append(hour * HOUR, observation(float(hour)))
+
+    times, values = cell.window(since=0)
+    assert times == [2 * HOUR, 3 * HOUR, 4 * HOUR]
+    assert values["T1H"] == [2.0, 3.0, 4.0]
+    assert cell.window(since=3 * HOUR)[1]["T1H"] == [3.0, 4.0]
+
+
+# 2. 같은 발표 시각은 덮어쓰고, 이전 시각은 버림
+def test_same_hour_overwrites_and_older_is_ignored():
+    cell = CellHistory(capacity=4)
+    assert cell.append(10 * HOUR, observation(1.0))
+    assert cell.append(10 * HOUR, observation(1.5))
+    assert not cell.append(9 * HOUR, observation(9.0))
+    times, values = cell.window(since=0)
+    assert times == [10 * HOUR] and values["T1H"] == [1.5]
+    assert math.isnan(values["UUU"][0])  # 없는 항목은 NaN
+
+
+# 3. 집계 (누적 강수량 / 최저 기온 / 풍향 평균)
+def test_aggregates():
+    """
+    합과 최소값, 그리고 풍향은 350도와 10도의 평균이 0도가 되도록 벡터 평균을 쓰는지 테스트합니다.
+    """
+    assert aggregate("RN1", [0.5, float("nan"), 2.0, 1.5])["sum"] == 4.0
+    assert aggregate("T1H", [3.2, -1.4, 0.8])["min"] == -1.4
+    assert aggregate("VEC", [350.0, 10.0])["mean"] in (0.0, 360.0)
+    assert aggregate("T1H", [float("nan")]) is None
+
+
+# 4. 격자 수 제한
+def test_history_evicts_least_recently_used_cell():
+    history = ObservationHistory(capacity=4, max_cells=2)
+    history.append(60, 127, HOUR, observation(1))
+    history.append(61, 127, HOUR, observation(2))
+    history.append(60, 127, 2 * HOUR, observation(3))
+    history.append(62, 127, HOUR, observation(4))
+    assert len(history) == 2
+    assert history.summary(61, 127, hours=24, now=2 * HOUR) is None
+    assert history.summary(60, 127, hours=24, now=2 * HOUR)["samples"] == 2
+
+
+def test_observed_at_is_kst():
+    assert observed_at("20241014", "0900") == 1728864000
+
+
+# 5. /weather/history 엔드포인트
+@pytest.mark.asyncio
+async def test_history_endpoint():
+    """
+    쌓인 관측으로 최근 구간의 누적 강수량과 최저 기온을 반환하고, 기록이 없는 격자는 404인지 테스트합니다.
+    """
+    app = FastAPI()
+    add_exception_handlers(app)
+    app.include_router(weather_router, prefix="/weather")
+
+    now = int(time.time()) - HOUR // 2
+    for hours_ago, (t1h, rn1) in zip(range(3, -1, -1), [(2.0, 0.0), (-0.5, 3.5), (1.5, 2.0), (4.0, 0.0)]):
+        kakao_service.history.append(999, 999, now - hours_ago * HOUR, observation(t1h, rn1))
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.get("/weather/history", params={"nx": 999, "ny": 999, "hours": 3, "series": True})
+        missing = await ac.get("/weather/history", params={"nx": 998, "ny": 999})
+        invalid = await ac.get("/weather/history")
+
+    data = response.json()["data"]
+    assert data["samples"] == 3
+    assert data["aggregates"]["RN1"]["sum"] == 5.5
+    assert data["aggregates"]["T1H"]["min"] == -0.5
+    assert data["series"]["T1H"] == [-0.5, 1.5, 4.0]
+    assert data["series"]["UUU"] == [None, None, None]
+    assert missing.status_code == 404
+    assert invalid.status_code == 422
@@ -0,0 +1,124 @@
+import sys
+import os
+import threading
+import time
+from datetime import datetime
+import pytest
+from fastapi import FastAPI, HTTPException
+from httpx import AsyncClient
+
+# 프로젝트의 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.weather import weather
+from app.api.weather.forecast import PENDING_RETRY_SECONDS
+from app.api.weather.history import KST
+from app.api.weather.weather import LamcParameter, grid_cells, kakao_service, lamcproj, parse_bbox
+from app.api.weather.weather import router as weather_router
+from app.core.config import settings
+from app.core.globalException import add_exception_handlers
+
+
+# 1. 역변환
+@pytest.mark.parametrize("lon, lat", [(126.978, 37.566), (127.1138, 36.8195), (129.0, 35.1), (124.6, 33.1)])
+def test_inverse_projection_roundtrip(lon, lat):
+    """
+    격자 중심을 위경도로 바꾼 뒤 다시 투영하면 같은 격자이고, 원래 위치와 격자 간격(5km) 안쪽인지 테스트합니다.
+    """
+    param = LamcParameter()
+    nx, ny = lamcproj(lon, lat, 0, param)
+    center_lon, center_lat = lamcproj(nx, ny, 1, param)
+    assert lamcproj(center_lon, center_lat, 0, param) == (nx, ny)
+    assert abs(center_lon - lon) < 0.05 and abs(center_lat - lat) < 0.05
+
+
+# 2. bbox 안의 격자
+def test_grid_cells():
+    """
+    중심이 bbox 안에 있는 격자만 반환하고, 격자보다 작은 bbox는 가운데 격자 하나를 반환하는지 테스트합니다.
+    """
+    cells = grid_cells(126.9, 37.5, 127.05, 37.6, max_cells=100)
+    assert len(cells) == 6
+    assert all(126.9 <= lon <= 127.05 and 37.5 <= lat <= 37.6 for _, _, lon, lat in cells)
+
+    tiny = grid_cells(126.978, 37.566, 126.979, 37.567, max_cells=100)
+    assert [(nx, ny) for nx, ny, _, _ in tiny] == [lamcproj(126.9785, 37.5665, 0, LamcParameter())]
+
+    with pytest.raises(ValueError):
+        grid_cells(120, 30, 130, 40, max_cells=400)
+
+
+def test_parse_bbox():
+    assert parse_bbox("126.9,37.5,127.05,37.6") == (126.9, 37.5, 127.05, 37.6)
+    for invalid in ("126.9,37.5,127.05", "a,b,c,d", "127,37,126,38"):
+        with pytest.raises(ValueError):
+            parse_bbox(invalid)
+
+
+# 3. /weather/region 엔드포인트
+@pytest.mark.asyncio
+async def test_region_endpoint(monkeypatch):
+    """
+    격자 순서대로 열(column) 배열을 반환하고, 동시에 조회하는 격자 수를 제한하며,
+    실패한 격자는 null로 채우고, 두 번째 조회는 캐시에서 응답하는지 테스트합니다.
+    """
+    active, peak, calls = [0], [0], []
+    lock = threading.Lock()
+
+    def fake_fetch(nx, ny, now):
+        with lock:
+            calls.append((nx, ny))
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        if (nx, ny) == (58, 125):
+            raise HTTPException(status_code=500, detail="날씨 정보를 가져오지 못했습니다")
+        nowcast = ("20241014", "0900", {"T1H": float(nx), "RN1": 0})
+        weather.store.set(f"{nx}:{ny}", nowcast)  # 실제 조회처럼 캐시에 저장
+        return nowcast
+
+    monkeypatch.setattr(kakao_service, "_fetch_nowcast", fake_fetch)
+    monkeypatch.setattr(settings, "WEATHER_REGION_CONCURRENCY", 2)
+    monkeypatch.setattr(weather, "nowcast_cache_key", lambda nx, ny, now: f"{nx}:{ny}")
+
+    app = FastAPI()
+    add_exception_handlers(app)
+    app.include_router(weather_router, prefix="/weather")
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.get("/weather/region", params={"bbox": "126.9,37.5,127.05,37.6"})
+        first_calls = len(calls)
+        again = await ac.get("/weather/region", params={"bbox": "126.9,37.5,127.05,37.6"})
+
+    data = response.json()["data"]
+    assert data["count"] == 6 and data["missing"] == 1
+    assert len(data["nx"]) == len(data["lat"]) == len(data["values"]["T1H"]) == 6
+    assert data["values"]["T1H"] == [None if (nx, ny) == (58, 125) else float(nx) for nx, ny in zip(data["nx"], data["ny"])]
+    assert first_calls == 6 and peak[0] <= 2
+
+    # 실패한 격자만 다시 조회
+    assert len(calls) == first_calls + 1
+    assert again.json()["data"]["missing"] == 1
+
+
+# 4. 이전 시각 실황은 짧게 캐시
+def test_previous_hour_nowcast_is_cached_briefly(monkeypatch):
+    """
+    정시 발표 전이라 이전 시각의 실황을 쓰면 발표 후 다시 조회하도록 짧은 TTL로 캐시하는지 테스트합니다.
+    """
+    ttls = []
+    monkeypatch.setattr(weather.store, "set", lambda key, value, ttl=None: ttls.append(ttl))
+
+    def fake_request(nx, ny, base_date, base_time):
+        code = "03" if base_time == "1000" else "00"
+        item = {"category": "T1H", "obsrValue": "12.5"}
+        return {"response": {"header": {"resultCode": code}, "body": {"items": {"item": [item]}}}}
+
+    monkeypatch.setattr(kakao_service, "_request_nowcast", fake_request)
+    published = kakao_service._fetch_nowcast(60, 127, datetime(2024, 10, 14, 11, 5, tzinfo=KST))
+    pending = kakao_service._fetch_nowcast(60, 127, datetime(2024, 10, 14, 10, 5, tzinfo=KST))
+
+    assert published[1] == "1100" and pending[1] == "0900"
+    assert ttls == [settings.NOWCAST_CACHE_TTL_SECONDS, PENDING_RETRY_SECONDS]